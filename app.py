@@ -1,15 +1,22 @@
 import streamlit as st
 import pandas as pd
-import joblib
 import numpy as np
 import re
 import datetime
-import random
 import plotly.express as px
 import plotly.graph_objects as go
-from sklearn.cluster import KMeans
-from sklearn.preprocessing import MinMaxScaler
 import os
+from bankaci.artifacts import get_registry
+from bankaci.batch import ChunkWriter
+from bankaci.credit import DECISION_THRESHOLD, iter_application_chunks, score_applications
+from bankaci.credit_features import EMP_MAP, HOME_MAP, PURPOSE_MAP, VERIF_MAP, prepare_application
+from bankaci.decision_cache import MAX_ENTRIES, TTL_SECONDS
+from bankaci.nba import next_best_action, next_best_actions, ranked_offers
+from bankaci.resources import MissingArtifactError
+from bankaci.scratch import ScratchDir
+from bankaci.segmentation import BUILD_COMMAND, SegmentationArtifactsError
+from bankaci.strategy import STRATEGIES, customer_strategy
+from bankaci.warmup import start_warmup
 
 
 # --- 0. OTOMATİK DARK MODE AYARLAYICI (NATIVE STREAMLIT CONFIG) ---
@@ -51,6 +58,9 @@ if not os.path.exists(os.path.join(PROJECT_ROOT, 'credit_risk_model_20fold.pkl')
     if os.path.exists(os.path.join(alt_path, 'credit_risk_model_20fold.pkl')):
         PROJECT_ROOT = alt_path
 
+# Yönetici araçları (ör. karar önbelleği durumu/temizleme) sadece BANKACI_ADMIN=1 ile gösterilir
+ADMIN_MODE = os.environ.get('BANKACI_ADMIN') == '1'
+
 st.set_page_config(page_title="Bankacı Plus", page_icon="🏦", layout="wide")
 
 
@@ -610,7 +620,7 @@ set_design()
 # --- 2. SESSION STATE BAŞLATMA ---
 def init_session_state():
     defaults = {
-        'c_id': None, 'c_score': 650, 'c_geo': 'France', 'c_gen': 'Male',
+        'c_id': None, 'c_user_id': None, 'c_score': 650, 'c_geo': 'France', 'c_gen': 'Male',
         'c_age': 30, 'c_tenure': 5, 'c_bal': 0.0, 'c_prod': 1,
         'c_card': 'Evet', 'c_active': 'Aktif', 'c_sal': 50000.0,
         'c_spending': 50, 'has_bes': 0, 'has_kredi': 0, 'has_yatirim': 0,
@@ -625,284 +635,57 @@ def init_session_state():
 init_session_state()
 
 
-from sklearn.metrics import silhouette_score
-
 # --- 3. VERİ ZENGİNLEŞTİRME VE KÜMELEME ---
-def enhance_data_with_products(df):
-    np.random.seed(42)
-    # Maaş skoru: Sabit maksimum (200,000$) ile normalize edilmiş, max 50 puan
-    MAX_SALARY = 200000.0
-    salary_score = (df['EstimatedSalary'] / MAX_SALARY * 50).clip(0, 50)
-    
-    # Yaş skoru: Yaş gruplarına göre daha mantıklı bir dağılım
-    def calculate_age_score(age):
-        if age <= 35:
-            return 30  # Gençler: Yüksek harcama potansiyeli
-        elif age <= 45:
-            return 25  # Genç-orta yaş: Yüksek harcama
-        elif age <= 55:
-            return 20  # Orta yaş: Orta harcama
-        elif age <= 65:
-            return 15  # Orta-ileri yaş: Düşük-orta harcama
-        else:
-            return 10  # İleri yaş: Düşük ama sıfır olmayan harcama
-    
-    age_score = df['Age'].apply(calculate_age_score)
-    
-    # Kredi kartı skoru: Kredi kartı varsa +20 puan
-    cc_score = df['HasCrCard'] * 20
-    
-    # Rastgele gürültü kaldırıldı - daha deterministik skor
-    df['Spending_Score'] = (salary_score + age_score + cc_score).clip(1, 100).astype(int)
-    df['Has_Vadesiz'] = 1
-
-    def assign_extra_products(row):
-        current_count = 1 + row['HasCrCard']
-        target_count = row['NumOfProducts']
-        has_bes, has_kredi, has_yatirim = 0, 0, 0
-        while current_count < target_count:
-            if row['Balance'] > 50000 and has_yatirim == 0: has_yatirim = 1; current_count += 1; continue
-            if row['EstimatedSalary'] > 60000 and row[
-                'Age'] > 28 and has_bes == 0: has_bes = 1; current_count += 1; continue
-            if row['CreditScore'] < 650 and has_kredi == 0: has_kredi = 1; current_count += 1; continue
-            options = [];
-            if has_bes == 0: options.append('BES')
-            if has_kredi == 0: options.append('Kredi')
-            if has_yatirim == 0: options.append('Yatırım')
-            if not options: break
-            choice = np.random.choice(options)
-            if choice == 'BES':
-                has_bes = 1
-            elif choice == 'Kredi':
-                has_kredi = 1
-            elif choice == 'Yatırım':
-                has_yatirim = 1
-            current_count += 1
-        return pd.Series([has_bes, has_kredi, has_yatirim])
-
-    df[['Has_BES', 'Has_Kredi', 'Has_Yatirim']] = df.apply(assign_extra_products, axis=1)
-
-    scaler = MinMaxScaler()
-    # YENİ DEĞİŞKENLER: Balance, EstimatedSalary, NumOfProducts, Tenure, IsActiveMember
-    features = ['Balance', 'EstimatedSalary', 'NumOfProducts', 'Tenure', 'IsActiveMember']
-    X_scaled = scaler.fit_transform(df[features])
-    
-    # --- KÜMELEME ---
-    # n_init=10000 ile en az 10000 farklı başlangıç noktası denenir, en iyi varyasyon seçilir
-    kmeans = KMeans(n_clusters=6, random_state=42, n_init=10000, max_iter=300)
-    df['Cluster_Label'] = kmeans.fit_predict(X_scaled)
-
-    # Model Doğrulama: Silüet Skoru
-    sample_size = min(2000, len(X_scaled))
-    sil_score = silhouette_score(X_scaled[:sample_size], df['Cluster_Label'][:sample_size])
-    
-    # Kümeleri finansal özelliklerine göre detaylı isimlendirme mantığı (Centroid analizi)
-    # center[0] = Balance (normalized), center[1] = EstimatedSalary (normalized)
-    # center[2] = NumOfProducts (normalized), center[3] = Tenure (normalized)
-    # center[4] = IsActiveMember (normalized)
-    centroids = kmeans.cluster_centers_
-    
-    # Her segment için ortalama değerleri hesapla (gerçek ölçekte)
-    segment_stats = {}
-    for i in range(6):
-        cluster_data = df[df['Cluster_Label'] == i]
-        segment_stats[i] = {
-            'avg_balance': cluster_data['Balance'].mean(),
-            'avg_salary': cluster_data['EstimatedSalary'].mean(),
-            'avg_products': cluster_data['NumOfProducts'].mean(),
-            'avg_tenure': cluster_data['Tenure'].mean(),
-            'avg_active': cluster_data['IsActiveMember'].mean(),
-            'size': len(cluster_data)
-        }
-    
-    # YENİ 6 SEGMENT İSİMLENDİRME MANTIĞI (5 değişkene göre)
-    # Her cluster için benzersiz isim garantisi: Centroid değerlerine göre sıralama
-    cluster_names = {}
-    
-    # Her cluster için skor hesapla (öncelik sırası belirlemek için)
-    cluster_scores = []
-    for i, center in enumerate(centroids):
-        stats = segment_stats[i]
-        balance_norm = center[0]
-        salary_norm = center[1]
-        products_norm = center[2]
-        tenure_norm = center[3]
-        active_norm = center[4]
-        
-        # Toplam skor: Yüksek değerli müşteriler önce
-        total_score = (balance_norm * 0.3 + salary_norm * 0.3 + products_norm * 0.2 + 
-                      tenure_norm * 0.1 + active_norm * 0.1)
-        cluster_scores.append((i, total_score, balance_norm, salary_norm, products_norm, 
-                              tenure_norm, active_norm, stats))
-    
-    # Skora göre sırala (yüksekten düşüğe)
-    cluster_scores.sort(key=lambda x: x[1], reverse=True)
-    
-    # Her cluster için benzersiz isim ata
-    segment_templates = [
-        "💎 Elit / Servet Yönetimi",
-        "🚀 Dinamik / Aktif Müşteri", 
-        "💰 Güvenli / Birikimci",
-        "⚠️ Riskli / Pasif Müşteri",
-        "🌱 Temel Mevduat / Giriş",
-        "📊 Standart Bankacılık"
-    ]
-    
-    # Her rank için direkt olarak farklı segment ismi ata (6 farklı isim garantisi)
-    for rank, (cluster_id, total_score, bal, sal, prod, ten, act, stats) in enumerate(cluster_scores):
-        # Rank'a göre direkt isim ata - her rank farklı segment
-        # Bu şekilde 6 farklı isim garanti edilir
-        name = segment_templates[rank]
-        cluster_names[cluster_id] = name
-    
-    # Kontrol: Her cluster için benzersiz isim olduğundan emin ol
-    assert len(set(cluster_names.values())) == 6, f"Benzersiz segment sayısı 6 değil: {len(set(cluster_names.values()))}"
-
-    df['Segment_Name'] = df['Cluster_Label'].map(cluster_names)
-    return df, kmeans, scaler, cluster_names, sil_score
-
+# Ürün zenginleştirme, K-Means ve segment isimlendirme bankaci/segmentation.py'de.
+# Artefaktlar web uygulamasından önce üretilir: python -m bankaci.build
 
 # --- 4. KAYNAKLARI YÜKLEME ---
-# Cache ile optimize edilmiş yükleme (versiyon 2 - yeni segmentler için)
-@st.cache_resource(ttl=3600, show_spinner=False)
-def load_all_resources():
-    try:
-        # Dosya yollarını kontrol et
-        required_files = {
-            'credit_risk_model_20fold.pkl': 'Credit Risk Pro Model',
-            'credit_risk_lite_model.pkl': 'Credit Risk Lite Model',
-            'lending_club_cleaned.csv': 'Lending Club Dataset',
-            'churn_model_v1.pkl': 'Churn Prediction Model'
-        }
-        
-        missing_files = []
-        for filename, description in required_files.items():
-            filepath = os.path.join(PROJECT_ROOT, filename)
-            if not os.path.exists(filepath):
-                missing_files.append(f"{description} ({filename})")
-        
-        if missing_files:
-            error_msg = f"⚠️ Eksik dosyalar bulundu:\n\n"
-            error_msg += "\n".join([f"• {f}" for f in missing_files])
-            error_msg += f"\n\n📁 Arama yapılan dizin: `{PROJECT_ROOT}`"
-            error_msg += f"\n\n💡 Lütfen bu dosyaları proje kök dizinine ekleyin."
-            st.error(error_msg)
-            return None, None, None, None, None, None, None, None, None
-        
-        # PROJECT_ROOT global değişkenini kullan
-        pro_m = joblib.load(os.path.join(PROJECT_ROOT, 'credit_risk_model_20fold.pkl'))
-        lite_m = joblib.load(os.path.join(PROJECT_ROOT, 'credit_risk_lite_model.pkl'))
-        df_risk = pd.read_csv(os.path.join(PROJECT_ROOT, 'lending_club_cleaned.csv'))
-        churn_m = joblib.load(os.path.join(PROJECT_ROOT, 'churn_model_v1.pkl'))
-        
-        # İşlenmiş veri seti dosyası (cluster bilgisiyle birlikte)
-        processed_file = os.path.join(PROJECT_ROOT, 'churn_processed_with_clusters.csv')
-        # Yeni rasyonel EstimatedSalary'li veri setini kullan
-        raw_file = os.path.join(PROJECT_ROOT, 'churn_processed_data_with_rational_salary.csv')
-        
-        # Eğer cluster bilgisiyle işlenmiş dosya varsa direkt yükle
-        kmeans_file = os.path.join(PROJECT_ROOT, 'kmeans_model.pkl')
-        scaler_file = os.path.join(PROJECT_ROOT, 'scaler_model.pkl')
-        
-        # YENİ ÖZELLİKLER: Balance, EstimatedSalary, NumOfProducts, Tenure, IsActiveMember
-        expected_features = ['Balance', 'EstimatedSalary', 'NumOfProducts', 'Tenure', 'IsActiveMember']
-        
-        if os.path.exists(processed_file) and os.path.exists(kmeans_file) and os.path.exists(scaler_file):
-            try:
-                # Hızlı yükleme - cluster bilgisi ve modeller kayıtlı
-                df_churn_proc = pd.read_csv(processed_file)
-                
-                # Özellik uyumluluğunu kontrol et
-                missing_features = [f for f in expected_features if f not in df_churn_proc.columns]
-                if missing_features:
-                    raise ValueError(f"Eksik özellikler: {missing_features}")
-                
-                # Cluster names map'i oluştur
-                cluster_map = {}
-                for cluster_id in sorted(df_churn_proc['Cluster_Label'].unique()):
-                    segment_name = df_churn_proc[df_churn_proc['Cluster_Label'] == cluster_id]['Segment_Name'].iloc[0]
-                    cluster_map[cluster_id] = segment_name
-                
-                # Kayıtlı modelleri yükle (manuel segment tahmini için)
-                kmeans_m = joblib.load(kmeans_file)
-                scaler_m = joblib.load(scaler_file)
-                
-                # Özellik uyumluluğunu test et
-                test_data = df_churn_proc[expected_features].iloc[:1]
-                scaler_m.transform(test_data)  # Eğer hata verirse exception fırlatır
-                
-                # Silhouette score'u hesapla (hızlı)
-                X_scaled = scaler_m.transform(df_churn_proc[expected_features])
-                sample_size = min(2000, len(X_scaled))
-                sil_val = silhouette_score(X_scaled[:sample_size], df_churn_proc['Cluster_Label'][:sample_size])
-            except (ValueError, KeyError, AttributeError) as e:
-                # Eski model/veri uyumsuz, yeniden oluştur
-                st.warning(f"⚠️ Eski model uyumsuz, yeniden oluşturuluyor: {e}")
-                if os.path.exists(processed_file):
-                    os.remove(processed_file)
-                if os.path.exists(kmeans_file):
-                    os.remove(kmeans_file)
-                if os.path.exists(scaler_file):
-                    os.remove(scaler_file)
-                # Yeniden oluştur
-                if not os.path.exists(raw_file):
-                    st.error(f"❌ Churn veri dosyası bulunamadı: {raw_file}")
-                    df_churn_proc = pd.DataFrame()
-                    kmeans_m = None
-                    scaler_m = None
-                    cluster_map = {}
-                    sil_val = 0.0
-                else:
-                    df_churn_raw = pd.read_csv(raw_file)
-                    df_churn_proc, kmeans_m, scaler_m, cluster_map, sil_val = enhance_data_with_products(df_churn_raw)
-                    df_churn_proc.to_csv(processed_file, index=False)
-                    joblib.dump(kmeans_m, kmeans_file)
-                    joblib.dump(scaler_m, scaler_file)
-                    st.info(f"✅ Yeni cluster bilgileri ve modeller hesaplandı ve kaydedildi.")
-            else:
-                # Başarıyla yüklendi, devam et
-                pass
-        else:
-            # İlk kez çalışıyor - cluster hesapla ve kaydet
-            if not os.path.exists(raw_file):
-                st.warning(f"⚠️ Churn veri dosyası bulunamadı: {raw_file}\n\nNBA modülü çalışmayacak.")
-                df_churn_proc = pd.DataFrame()
-                kmeans_m = None
-                scaler_m = None
-                cluster_map = {}
-                sil_val = 0.0
-            else:
-                try:
-                    df_churn_raw = pd.read_csv(raw_file)
-                    df_churn_proc, kmeans_m, scaler_m, cluster_map, sil_val = enhance_data_with_products(df_churn_raw)
-                    
-                    # İşlenmiş veriyi kaydet (cluster bilgisiyle birlikte)
-                    df_churn_proc.to_csv(processed_file, index=False)
-                    
-                    # Modelleri kaydet (manuel segment tahmini için)
-                    joblib.dump(kmeans_m, kmeans_file)
-                    joblib.dump(scaler_m, scaler_file)
-                    
-                    st.info(f"✅ Cluster bilgileri ve modeller hesaplandı ve kaydedildi.")
-                except Exception as e:
-                    st.error(f"❌ Churn veri işleme hatası: {e}")
-                    df_churn_proc = pd.DataFrame()
-                    kmeans_m = None
-                    scaler_m = None
-                    cluster_map = {}
-                    sil_val = 0.0
-        
-        if 'User_ID' not in df_churn_proc.columns:
-            np.random.seed(42)
-            ids = np.random.choice(range(1000000, 9999999), size=len(df_churn_proc), replace=False)
-            df_churn_proc.insert(0, 'User_ID', ids)
-            
-        return pro_m, lite_m, df_risk, churn_m, df_churn_proc, kmeans_m, scaler_m, cluster_map, sil_val
-    except FileNotFoundError as e:
-        st.error(f"❌ Dosya bulunamadı: {e}\n\n📁 Arama yapılan dizin: `{PROJECT_ROOT}`\n\n💡 Lütfen gerekli model ve veri dosyalarını proje kök dizinine ekleyin.")
-        return None, None, None, None, None, None, None, None, None
-    except AttributeError as e:
-        if '_RemainderColsList' in str(e) or 'ColumnTransformer' in str(e):
+# Her artefakt ayrı ayrı ve ilk kullanıldığında yüklenir (lazy). Sayfalar sadece
+# ihtiyaç duydukları kaynakları ister; kredi sayfası churn/KMeans yolunu beklemez.
+# Yükleyiciler bankaci/artifacts.py'de; kayıt defteri süreç genelinde tektir ve
+# sunucu açılışındaki ısınma thread'i (bankaci/warmup.py) ile paylaşılır.
+
+# Sayfa -> ihtiyaç duyulan artefaktlar
+PAGE_RESOURCES = {
+    "🛡️ Kredi Risk Tahmini": ['pro_scorer', 'lite_scorer', 'pro_decisions', 'lite_decisions', 'df_risk'],
+    "📉 Müşteri Kayıp (Churn)": ['churn_model', 'churn_scorer', 'churn_data', 'churn_scores', 'churn_ranking'],
+    "🎯 Fırsatlar & Satış (NBA - K-Means)": ['churn_model', 'churn_data', 'churn_scores', 'nba_rules'],
+    "ℹ️ Proje Hakkında": [],
+}
+
+
+def get_resource_registry():
+    return get_registry(PROJECT_ROOT)
+
+
+# Isınma süreç başına bir kez başlar (python -m bankaci.serve ile sunucu açılışında,
+# düz `streamlit run` ile ilk oturumda); kalan artefaktlar arka planda yüklenir
+warmup_state = start_warmup(PROJECT_ROOT)
+
+
+def report_resource_errors(errors):
+    """Yükleme hatalarını sayfada kullanıcıya gösterir."""
+    # Bağımlı artefaktlar (ör. skorlar) aynı kök hatayı tekrar raporlayabilir: tekilleştir
+    unique = {}
+    for e in errors.values():
+        unique.setdefault((type(e), str(e)), e)
+    errors = dict(enumerate(unique.values()))
+    missing = [e for e in errors.values() if isinstance(e, MissingArtifactError)]
+    if missing:
+        error_msg = f"⚠️ Eksik dosyalar bulundu:\n\n"
+        error_msg += "\n".join([f"• {e}" for e in missing])
+        error_msg += f"\n\n📁 Arama yapılan dizin: `{PROJECT_ROOT}`"
+        error_msg += f"\n\n💡 Lütfen bu dosyaları proje kök dizinine ekleyin."
+        st.error(error_msg)
+    for e in errors.values():
+        if isinstance(e, MissingArtifactError):
+            continue
+        if isinstance(e, SegmentationArtifactsError):
+            st.error(f"❌ {e}\n\n"
+                     f"💡 Artefaktları üretmek için proje kök dizininde çalıştırın: `{BUILD_COMMAND}`")
+        elif isinstance(e, FileNotFoundError):
+            st.error(f"❌ Dosya bulunamadı: {e}\n\n📁 Arama yapılan dizin: `{PROJECT_ROOT}`\n\n💡 Lütfen gerekli model ve veri dosyalarını proje kök dizinine ekleyin.")
+        elif isinstance(e, AttributeError) and ('_RemainderColsList' in str(e) or 'ColumnTransformer' in str(e)):
             st.error(f"❌ Scikit-learn versiyon uyumsuzluğu hatası!\n\n"
                     f"**Hata:** {e}\n\n"
                     f"**Çözüm:** Model dosyaları farklı bir scikit-learn versiyonu ile kaydedilmiş.\n\n"
@@ -912,35 +695,33 @@ def load_all_resources():
                     f"3. Gerekirse model dosyalarını mevcut scikit-learn versiyonu ile yeniden kaydedin")
         else:
             st.error(f"❌ Dosya yükleme hatası: {e}\n\n📁 Arama yapılan dizin: `{PROJECT_ROOT}`")
-        return None, None, None, None, None, None, None, None, None
-    except Exception as e:
-        st.error(f"❌ Dosya yükleme hatası: {e}\n\n📁 Arama yapılan dizin: `{PROJECT_ROOT}`")
-        return None, None, None, None, None, None, None, None, None
 
 
-pro_model, lite_model, df_original, churn_model, df_churn, kmeans_model, scaler_model, cluster_names_map, silhouette_val = load_all_resources()
+def get_resource(name):
+    """Tek bir artefaktı döndürür; yüklenemezse None (hata sayfa yüklemesinde gösterilir)."""
+    try:
+        return get_resource_registry().get(name)
+    except Exception:
+        return None
+
+
+def load_page_resources(page_name):
+    """Seçili sayfanın ihtiyaç duyduğu artefaktları yükler; hata varsa gösterir ve sayfayı durdurur."""
+    # Bağımsız artefaktlar thread havuzunda paralel yüklenir
+    values, errors = get_resource_registry().get_many(PAGE_RESOURCES.get(page_name, []))
+    if errors:
+        # Eksik kaynakla sayfayı yarım çalıştırmak yerine hatayı gösterip dur
+        report_resource_errors(errors)
+        st.stop()
+    return values
 
 # --- 5. YARDIMCI FONKSİYONLAR ---
-PURPOSE_MAP = {"Borç Birleştirme": "debt_consolidation", "Kredi Kartı": "credit_card",
-               "Ev Tadilatı": "home_improvement", "Büyük Harcama": "major_purchase", "Küçük İşletme": "small_business",
-               "Araba": "car", "Düğün": "wedding", "Diğer": "other"}
-HOME_MAP = {"Kiracı": "RENT", "İpotekli": "MORTGAGE", "Ev Sahibi": "OWN", "Diğer": "ANY"}
-VERIF_MAP = {"Doğrulanmış": "Verified", "Kaynak Doğrulanmış": "Source Verified", "Doğrulanmamış": "Not Verified"}
-EMP_MAP = {"1 yıldan az": "< 1 year", "1 yıl": "1 year", "2 yıl": "2 years", "10 yıl ve üzeri": "10+ years"}
+# Form etiketi -> model değeri eşlemeleri bankaci/credit_features.py'de (toplu skorlama ile ortak)
 REVERSE_HOME = {v: k for k, v in HOME_MAP.items()}
 REVERSE_PURPOSE = {v: k for k, v in PURPOSE_MAP.items()}
 REVERSE_EMP = {v: k for k, v in EMP_MAP.items()}
 
 
-def clean_emp_length_input(k):
-    if pd.isna(k) or k not in EMP_MAP: return 0
-    val = EMP_MAP[k]
-    return 10 if '+' in val else (0 if '<' in val else int(re.findall(r'\d+', val)[0]))
-
-
-def map_term(t): return " 36 months" if t <= 36 else " 60 months"
-
-
 def calculate_manual_spending_score(salary, age, has_card):
     """
     İyileştirilmiş harcama skoru hesaplama:
@@ -1132,364 +913,83 @@ def get_strategy_details(strategy_name):
     })
 
 
-def advanced_strategy(row):
+def get_next_best_action(row, segment_name=None):
     """
-    Strateji Mantığı sekmesindeki mantıkla uyumlu strateji belirleme fonksiyonu.
-    Risk seviyesine ve müşteri özelliklerine göre kişiselleştirilmiş strateji önerir.
+    Segment bazlı Next Best Action önerisi (tek müşteri).
+    Kampanya listesiyle aynı motor kullanılır (bankaci/nba.py); satış ihtimali
+    müşteri değişkenlerine göre dinamik hesaplanır, jitter row['User_ID']'den türetildiği
+    için aynı müşteride her seferinde aynıdır ve kampanya listesindeki Prob ile eşleşir.
     """
-    prob = row['Risk_Probability']
-    bal = row['Balance']
-    prod = row['NumOfProducts']
-    act = row['IsActiveMember']
-    age = row.get('Age', 40)  # Yaş bilgisi varsa kullan, yoksa varsayılan 40
-    
-    # YÜKSEK RİSK (prob > 0.60)
-    if prob > 0.60:
-        if bal > 50000:
-            return "🚨 VIP MÜDAHALE"
-        elif prod >= 3:
-            return "🔄 SADELEŞTİRME"
-        else:
-            return "📞 ARAMA"
-    
-    # ORTA RİSK (0.40 < prob <= 0.60)
-    elif prob > 0.40:
-        if act == 0:  # Pasif üye
-            return "🔔 UYANDIRMA"
-        elif age < 35:  # Genç müşteri
-            return "🎁 LIFESTYLE HEDİYE"
-        else:
-            return "💳 TEŞVİK"
-    
-    # DÜŞÜK RİSK (prob <= 0.40)
-    else:
-        if bal > 100000:
-            return "💰 YATIRIM ÇAPRAZ SATIŞ"
-        else:
-            return "🤝 İLİŞKİ YÖNETİMİ"
+    return next_best_action(row, segment_name, cluster_names_map.values(), table=nba_rules)
 
 
-def calculate_sales_probability(row, segment_name=None, product_type=None):
-    """
-    Müşteri değişkenlerine göre dinamik satış ihtimali hesaplama.
-    
-    Parametreler:
-    - row: Müşteri verisi (pandas Series veya dict)
-    - segment_name: Müşteri segmenti
-    - product_type: Önerilen ürün tipi (opsiyonel)
-    
-    Hesaplama Faktörleri:
-    1. Segment bazlı base probability
-    2. Finansal güç (Balance, Salary)
-    3. Aktivite durumu (IsActiveMember)
-    4. Ürün portföyü (NumOfProducts, mevcut ürünler)
-    5. Yaş faktörü
-    6. Kredi skoru
-    7. Tenure (müşteri sadakati)
-    """
-    def safe_get(row, key, default=0):
-        try:
-            if isinstance(row, dict):
-                return row.get(key, default)
-            else:  # pandas Series
-                return row[key] if key in row.index else default
-        except:
-            return default
-    
-    # Segment bazlı base probability
-    segment_base_prob = {
-        "💎 Elit / Servet Yönetimi": 80,
-        "🚀 Dinamik / Aktif Müşteri": 75,
-        "💰 Güvenli / Birikimci": 70,
-        "📊 Standart Bankacılık": 65,
-        "🌱 Temel Mevduat / Giriş": 60,
-        "⚠️ Riskli / Pasif Müşteri": 55
-    }
-    
-    # Base probability belirleme
-    base_prob = 50  # Varsayılan
-    if segment_name:
-        for seg, prob in segment_base_prob.items():
-            if seg in segment_name:
-                base_prob = prob
-                break
-    
-    # Müşteri değişkenlerini al
-    balance = safe_get(row, 'Balance', 0)
-    salary = safe_get(row, 'EstimatedSalary', 0)
-    num_products = safe_get(row, 'NumOfProducts', 1)
-    is_active = safe_get(row, 'IsActiveMember', 0)
-    age = safe_get(row, 'Age', 40)
-    credit_score = safe_get(row, 'CreditScore', 650)
-    tenure = safe_get(row, 'Tenure', 5)
-    has_cr_card = safe_get(row, 'HasCrCard', 0)
-    has_bes = safe_get(row, 'Has_BES', 0)
-    has_yatirim = safe_get(row, 'Has_Yatirim', 0)
-    has_kredi = safe_get(row, 'Has_Kredi', 0)
-    
-    # Finansal güç faktörü (Balance)
-    balance_factor = 0
-    if balance > 100000:
-        balance_factor = 12
-    elif balance > 50000:
-        balance_factor = 8
-    elif balance > 20000:
-        balance_factor = 5
-    elif balance > 10000:
-        balance_factor = 2
-    
-    # Gelir faktörü (Salary)
-    salary_factor = 0
-    if salary > 100000:
-        salary_factor = 10
-    elif salary > 60000:
-        salary_factor = 7
-    elif salary > 40000:
-        salary_factor = 4
-    elif salary > 25000:
-        salary_factor = 2
-    
-    # Aktivite faktörü
-    activity_factor = 8 if is_active == 1 else -5
-    
-    # Ürün portföyü faktörü (daha fazla ürün = daha sadık müşteri)
-    product_factor = min(num_products * 3, 10)  # Max 10 puan
-    
-    # Yaş faktörü (25-55 yaş arası en aktif)
-    age_factor = 0
-    if 25 <= age <= 55:
-        age_factor = 5
-    elif 20 <= age < 25 or 55 < age <= 65:
-        age_factor = 2
-    elif age > 65:
-        age_factor = -3
-    
-    # Kredi skoru faktörü
-    credit_factor = 0
-    if credit_score >= 750:
-        credit_factor = 6
-    elif credit_score >= 700:
-        credit_factor = 4
-    elif credit_score >= 650:
-        credit_factor = 2
-    elif credit_score < 600:
-        credit_factor = -5
-    
-    # Tenure faktörü (müşteri sadakati)
-    tenure_factor = min(tenure * 1.5, 8)  # Max 8 puan
-    
-    # Ürün eksikliği faktörü (hangi ürün eksikse ona göre artış)
-    product_gap_factor = 0
-    if product_type:
-        if "Kredi Kartı" in product_type and has_cr_card == 0:
-            product_gap_factor = 8
-        elif "BES" in product_type and has_bes == 0:
-            product_gap_factor = 7
-        elif "Yatırım" in product_type and has_yatirim == 0:
-            product_gap_factor = 6
-        elif "Kredi" in product_type and has_kredi == 0:
-            product_gap_factor = 5
-    
-    # Toplam probability hesapla
-    total_prob = (base_prob + 
-                  balance_factor + 
-                  salary_factor + 
-                  activity_factor + 
-                  product_factor + 
-                  age_factor + 
-                  credit_factor + 
-                  tenure_factor + 
-                  product_gap_factor)
-    
-    # Ham skoru 25-80 arasına normalize et
-    normalized_prob = max(25, min(80, total_prob))
-    
-    # Çeşitlilik için random -5 ile +5 arası değişiklik ekle
-    random_variation = random.randint(-5, 5)
-    final_prob = normalized_prob + random_variation
-    
-    # Final sonucu 25-95 arasına sınırla (random ekledikten sonra sınırları aşabilir)
-    final_prob = max(25, min(95, final_prob))
-    
-    return round(final_prob)
+def session_scratch_dir():
+    """Oturumun geçici dizini; oturum kapanıp session_state bırakılınca silinir."""
+    if 'scratch_dir' not in st.session_state:
+        st.session_state['scratch_dir'] = ScratchDir()
+    return st.session_state['scratch_dir']
 
 
-def get_next_best_action(row, segment_name=None):
+def score_credit_upload(upload, kind, scorer, chunk_size, keep_columns):
     """
-    Segment bazlı Next Best Action önerileri.
-    6 segment için özelleştirilmiş ürün önerileri.
-    Satış ihtimali müşteri değişkenlerine göre dinamik hesaplanır.
+    Yüklenen başvuru dosyasını parça parça skorlar. Sonuçlar bellekte toplanmaz,
+    oturumun geçici dizinindeki bir CSV dosyasına eklenir; özet
+    session_state['credit_batch']'e yazılır.
     """
-    # Pandas Series için güvenli erişim fonksiyonu
-    def safe_get(row, key, default=0):
-        try:
-            if isinstance(row, dict):
-                return row.get(key, default)
-            else:  # pandas Series
-                return row[key] if key in row.index else default
-        except:
-            return default
-    
-    # Segment bilgisi varsa öncelikle segment bazlı öner
-    if segment_name and segment_name in cluster_names_map.values():
-        # Segment bazlı öneriler
-        
-        if "💎 Elit / Servet Yönetimi" in segment_name:
-            if safe_get(row, 'Has_Yatirim', 0) == 0:
-                product = "Özel Yatırım Danışmanlığı"
-                prob = calculate_sales_probability(row, segment_name, product)
-                return {"Product": product, "Prob": prob,
-                       "Reason": "Elit segment - Yüksek değerli müşteri için özel hizmet.",
-                       "Script": "Kişisel yatırım danışmanınızla tanışmak ister misiniz?"}
-            elif safe_get(row, 'Has_BES', 0) == 0:
-                product = "Premium BES Paketi"
-                prob = calculate_sales_probability(row, segment_name, product)
-                return {"Product": product, "Prob": prob,
-                       "Reason": "Elit müşteriler için özel emeklilik planı.",
-                       "Script": "Geleceğinizi premium seviyede planlayalım."}
-            else:
-                product = "VIP Müşteri Hizmetleri"
-                prob = calculate_sales_probability(row, segment_name, product)
-                return {"Product": product, "Prob": prob,
-                       "Reason": "Elit segment için özel avantajlar.",
-                       "Script": "Size özel avantajlardan haberdar mısınız?"}
-        
-        elif "🚀 Dinamik / Aktif Müşteri" in segment_name:
-            # Aktif müşteri + Yüksek ürün sayısı + Yüksek maaş
-            if safe_get(row, 'HasCrCard', 0) == 0:
-                product = "Premium Kredi Kartı (Mil Puan)"
-                prob = calculate_sales_probability(row, segment_name, product)
-                return {"Product": product, "Prob": prob,
-                       "Reason": "Aktif müşteri - Yüksek harcama potansiyeli, mil puan kazanma fırsatı.",
-                       "Script": "Her harcamanızda mil puan kazanın, seyahatlerinizi ücretsiz yapın!"}
-            elif safe_get(row, 'NumOfProducts', 1) < 3:
-                product = "BES + Yatırım Paketi"
-                prob = calculate_sales_probability(row, segment_name, product)
-                return {"Product": product, "Prob": prob,
-                       "Reason": "Aktif müşteri - Ürün portföyünü genişletme fırsatı.",
-                       "Script": "Geleceğinizi planlayın, birikimlerinizi değerlendirin."}
-            else:
-                product = "Lifestyle Ödül Programı"
-                prob = calculate_sales_probability(row, segment_name, product)
-                return {"Product": product, "Prob": prob,
-                       "Reason": "Aktif müşteri - Yaşam tarzına uygun ödüller.",
-                       "Script": "Konser, spor, teknoloji ürünlerinde özel indirimler."}
-        
-        elif "💰 Güvenli / Birikimci" in segment_name:
-            if safe_get(row, 'Balance', 0) > 50000 and safe_get(row, 'Has_Yatirim', 0) == 0:
-                product = "Likit Fon / Altın Yatırımı"
-                prob = calculate_sales_probability(row, segment_name, product)
-                return {"Product": product, "Prob": prob,
-                       "Reason": "Yüksek bakiye + Birikimci profil - Enflasyona karşı koruma.",
-                       "Script": "Paranızı enflasyona karşı koruyalım, değer kazandıralım."}
-            elif safe_get(row, 'EstimatedSalary', 0) > 60000:
-                product = "Vadeli Mevduat (Yüksek Faiz)"
-                prob = calculate_sales_probability(row, segment_name, product)
-                return {"Product": product, "Prob": prob,
-                       "Reason": "Birikimci segment - Güvenli ve yüksek getiri.",
-                       "Script": "Birikimlerinize yüksek faiz kazandıralım."}
-            else:
-                product = "Otomatik Birikim Planı"
-                prob = calculate_sales_probability(row, segment_name, product)
-                return {"Product": product, "Prob": prob,
-                       "Reason": "Birikimci segment - Düzenli tasarruf alışkanlığı.",
-                       "Script": "Her ay otomatik birikim yaparak hedeflerinize ulaşın."}
-        
-        elif "⚠️ Riskli / Pasif Müşteri" in segment_name:
-            # Pasif müşteri + Düşük maaş + Düşük bakiye
-            if safe_get(row, 'IsActiveMember', 1) == 0:
-                product = "Müşteri Aktivasyon Programı"
-                prob = calculate_sales_probability(row, segment_name, product)
-                return {"Product": product, "Prob": prob,
-                       "Reason": "Pasif müşteri - Aktivasyon ve ilişki güçlendirme.",
-                       "Script": "Size özel avantajlarla bankacılık deneyiminizi canlandıralım."}
-            elif safe_get(row, 'Balance', 0) < 10000:
-                product = "Dijital Bankacılık Eğitimi + Teşvik"
-                prob = calculate_sales_probability(row, segment_name, product)
-                return {"Product": product, "Prob": prob,
-                       "Reason": "Pasif müşteri - Dijital kanalları kullanma teşviki.",
-                       "Script": "Dijital bankacılık avantajlarını keşfedin, özel teşviklerden faydalanın."}
-            else:
-                product = "Finansal Danışmanlık"
-                prob = calculate_sales_probability(row, segment_name, product)
-                return {"Product": product, "Prob": prob,
-                       "Reason": "Pasif müşteri - Finansal planlama ve ilişki yönetimi.",
-                       "Script": "Ücretsiz finansal danışmanlık hizmetimizden faydalanın."}
-        
-        elif "🌱 Temel Mevduat / Giriş" in segment_name:
-            if safe_get(row, 'HasCrCard', 0) == 0:
-                product = "Temel Kredi Kartı"
-                prob = calculate_sales_probability(row, segment_name, product)
-                return {"Product": product, "Prob": prob,
-                       "Reason": "Giriş seviyesi - İlk kredi kartı fırsatı.",
-                       "Script": "İlk kredi kartınızı alın, güvenli alışveriş yapın."}
-            elif safe_get(row, 'EstimatedSalary', 0) > 30000:
-                product = "Dijital Bankacılık Eğitimi"
-                prob = calculate_sales_probability(row, segment_name, product)
-                return {"Product": product, "Prob": prob,
-                       "Reason": "Giriş seviyesi - Dijital bankacılık öğrenimi.",
-                       "Script": "Dijital bankacılık avantajlarını keşfedin."}
-            else:
-                product = "Genç Müşteri Paketi"
-                prob = calculate_sales_probability(row, segment_name, product)
-                return {"Product": product, "Prob": prob,
-                       "Reason": "Giriş segmenti - Özel genç müşteri avantajları.",
-                       "Script": "Size özel avantajlı paketlerimizi inceleyin."}
-        
-        elif "📊 Standart Bankacılık" in segment_name:
-            if safe_get(row, 'EstimatedSalary', 0) > 50000 and safe_get(row, 'Age', 30) > 25 and safe_get(row, 'Age', 30) < 55 and safe_get(row, 'Has_BES', 0) == 0:
-                product = "Bireysel Emeklilik (BES)"
-                prob = calculate_sales_probability(row, segment_name, product)
-                return {"Product": product, "Prob": prob,
-                       "Reason": "Standart segment - Gelecek planlaması.",
-                       "Script": "Devlet katkısından faydalanarak emekliliğinizi planlayın."}
-            elif safe_get(row, 'Spending_Score', 0) > 50 and safe_get(row, 'HasCrCard', 0) == 0:
-                product = "Standart Kredi Kartı"
-                prob = calculate_sales_probability(row, segment_name, product)
-                return {"Product": product, "Prob": prob,
-                       "Reason": "Orta harcama potansiyeli - Kredi kartı ihtiyacı.",
-                       "Script": "Günlük alışverişlerinizde kolaylık sağlayın."}
-            else:
-                product = "Otomatik Ödeme Sistemi"
-                prob = calculate_sales_probability(row, segment_name, product)
-                return {"Product": product, "Prob": prob,
-                       "Reason": "Standart segment - Kolaylık odaklı.",
-                       "Script": "Faturalarınızı otomatik ödeyin, zaman kazanın."}
-    
-    # Segment bilgisi yoksa genel kurallar (geriye dönük uyumluluk)
-    if safe_get(row, 'Balance', 0) > 40000 and safe_get(row, 'Has_Yatirim', 0) == 0: 
-        product = "Likit Fon / Altın"
-        prob = calculate_sales_probability(row, segment_name, product)
-        return {"Product": product, "Prob": prob,
-               "Reason": "Vadesiz hesapta yüksek atıl bakiye.",
-               "Script": "Paranızı enflasyona karşı koruyalım."}
-    if safe_get(row, 'EstimatedSalary', 0) > 50000 and safe_get(row, 'Age', 30) > 25 and safe_get(row, 'Age', 30) < 55 and safe_get(row, 'Has_BES', 0) == 0: 
-        product = "Bireysel Emeklilik (BES)"
-        prob = calculate_sales_probability(row, segment_name, product)
-        return {"Product": product, "Prob": prob, 
-               "Reason": "Gelir yüksek, gelecek güvencesi yok.",
-               "Script": "Devlet katkısından faydalanın."}
-    if safe_get(row, 'Spending_Score', 50) > 60 and safe_get(row, 'HasCrCard', 0) == 0: 
-        product = "Platinum Kredi Kartı"
-        prob = calculate_sales_probability(row, segment_name, product)
-        return {"Product": product, "Prob": prob,
-               "Reason": "Harcama potansiyeli yüksek.",
-               "Script": "Mil puan kazanmak ister misiniz?"}
-    if safe_get(row, 'CreditScore', 650) < 650 and safe_get(row, 'Balance', 0) < 5000 and safe_get(row, 'Has_Kredi', 0) == 0: 
-        product = "İhtiyaç Kredisi"
-        prob = calculate_sales_probability(row, segment_name, product)
-        return {"Product": product, "Prob": prob, 
-               "Reason": "Nakit sıkışıklığı sinyali.",
-               "Script": "3 ay ertelemeli kredi ister misiniz?"}
-    product = "Otomatik Ödeme"
-    prob = calculate_sales_probability(row, segment_name, product)
-    return {"Product": product, "Prob": prob, 
-           "Reason": "Mevcut ürünler yeterli.",
-           "Script": "Faturalarınızı otomatik ödeyelim."}
+    # Önceki toplu skorlamanın geçici dosyasını temizle
+    previous = st.session_state.pop('credit_batch', None)
+    if previous and os.path.exists(previous['path']):
+        os.remove(previous['path'])
+
+    path = session_scratch_dir().new_file(prefix='kredi_skor_', suffix='.csv')
+    writer = ChunkWriter(path, 'csv')
+    progress = st.progress(0.0, text="Başvurular skorlanıyor...")
+    rows = rejected = 0
+    risk_sum = 0.0
+    preview = None
+    completed = False
+    try:
+        upload.seek(0)
+        for chunk, done in iter_application_chunks(upload, upload.name, chunk_size):
+            scored = score_applications(scorer, chunk, kind)
+            result = pd.DataFrame({'Satir': np.arange(rows + 1, rows + len(chunk) + 1)})
+            if keep_columns:
+                result = pd.concat([result, chunk.reset_index(drop=True)], axis=1)
+            result['Risk_Probability'] = scored['Risk_Probability'].to_numpy()
+            result['Karar'] = scored['Karar'].to_numpy()
+            writer.write(result)
+            if preview is None:
+                preview = result.head(20)
+            rows += len(result)
+            rejected += int((result['Karar'] == "RED").sum())
+            risk_sum += float(result['Risk_Probability'].sum())
+            progress.progress(done if done is not None else 0.0, text=f"{rows:,} başvuru skorlandı")
+        completed = True
+    except Exception as e:
+        # CreditInputError (eksik/sayısal olmayan sütun), CSV/Parquet ayrıştırma ve beklenmeyen hatalar
+        st.error(f"❌ Dosya skorlanamadı: {e}")
+        return
+    finally:
+        writer.close()
+        if not completed:
+            # Hata veya yarıda kesilen çalıştırma (rerun): yarım sonuç dosyası bırakılmaz
+            os.remove(path)
+            progress.empty()
+    progress.progress(1.0, text=f"✅ {rows:,} başvuru skorlandı")
+    st.session_state['credit_batch'] = {
+        'path': path, 'name': upload.name, 'kind': kind, 'rows': rows, 'rejected': rejected,
+        'mean_risk': risk_sum / rows if rows else 0.0, 'preview': preview}
 
 
 # --- 6. VERİ GETİRME ---
+# Rastgele churn müşterisi seçiminin tohumu: None -> her oturum farklı sıra,
+# sabit bir sayı -> her oturumda aynı müşteri sırası (demo/test tekrarlanabilir)
+RANDOM_CUSTOMER_SEED = None
+
+
 def get_random_risk_customer():
+    # Callback sayfa gövdesinden önce çalışır; veriyi doğrudan kayıttan al
+    df_original = get_resource('df_risk')
     if df_original is None: return
     row = df_original.sample(1).iloc[0]
     st.session_state.update({'l_inc': float(row['annual_inc']), 'l_loan': float(row['loan_amnt']),
@@ -1502,7 +1002,11 @@ def get_random_risk_customer():
 
 def get_random_churn_customer():
     """Risk skorlarına göre ardışık aralıklarda müşteri seçimi"""
-    if df_churn is None or churn_model is None: 
+    # Skorlu portföy ve risk aralığı indeksi tüm oturumlarca paylaşılır (salt okunur);
+    # oturumda sadece sayaç ve rastgele sayı üreteci tutulur
+    df_with_risk = get_resource('churn_scored')
+    risk_bands = get_resource('churn_bands')
+    if df_with_risk is None or risk_bands is None:
         st.warning("Veri yükleniyor, lütfen bekleyin...")
         return
     
@@ -1515,9 +1019,11 @@ def get_random_churn_customer():
         (41, 60),     # 5. basış: [41-60]
     ]
     
-    # Session state'te sayaç başlat (döngüsel)
+    # Session state'te sayaç ve üreteç başlat (döngüsel)
     if 'churn_range_index' not in st.session_state:
         st.session_state['churn_range_index'] = 0
+    if 'churn_sample_rng' not in st.session_state:
+        st.session_state['churn_sample_rng'] = np.random.default_rng(RANDOM_CUSTOMER_SEED)
     
     # Mevcut aralığı al
     current_index = st.session_state['churn_range_index']
@@ -1527,39 +1033,26 @@ def get_random_churn_customer():
     st.session_state['churn_range_index'] = (current_index + 1) % len(risk_ranges)
     
     try:
-        # Tüm müşterilerin risk skorlarını hesapla (cache için)
-        if 'df_churn_with_risk' not in st.session_state:
-            cols_to_drop = ['User_ID', 'Has_Vadesiz', 'Has_BES', 'Has_Kredi', 'Has_Yatirim', 'Spending_Score',
-                           'Cluster_Label', 'Segment_Name']
-            X_all = df_churn.drop(columns=cols_to_drop, errors='ignore')
-            risk_probs = churn_model.predict_proba(X_all)[:, 1]
-            df_with_risk = df_churn.copy()
-            df_with_risk['Risk_Probability'] = risk_probs
-            st.session_state['df_churn_with_risk'] = df_with_risk
-        
-        df_with_risk = st.session_state['df_churn_with_risk']
-        
-        # Risk skorunu yüzde olarak hesapla
-        df_with_risk['Risk_Percent'] = df_with_risk['Risk_Probability'] * 100
-        
-        # Belirtilen aralıktaki müşterileri filtrele
-        filtered_df = df_with_risk[
-            (df_with_risk['Risk_Percent'] >= min_risk) & 
-            (df_with_risk['Risk_Percent'] <= max_risk)
-        ]
+        # Eski sürümlerden kalan oturum kopyasını bırak
+        st.session_state.pop('df_churn_with_risk', None)
+
+        # Aralıktan rastgele müşteri: ikili arama + tek rastgele sayı (frame kopyalanmaz)
+        rng = st.session_state['churn_sample_rng']
+        position = risk_bands.sample(min_risk, max_risk, rng)
         
-        if len(filtered_df) == 0:
+        if position is None:
             # Eğer bu aralıkta müşteri yoksa, en yakın aralıktan seç
             st.warning(f"⚠️ [{min_risk}-{max_risk}] aralığında müşteri bulunamadı. En yakın aralıktan seçiliyor...")
-            filtered_df = df_with_risk
+            position = risk_bands.sample(-np.inf, np.inf, rng)
         
-        # Rastgele bir müşteri seç
-        row = filtered_df.sample(n=1, random_state=None).iloc[0]
+        # Seçilen müşterinin satırı
+        row = df_with_risk.iloc[position]
         actual_risk = row['Risk_Percent']
         
         # Session state'e hızlı güncelleme
         st.session_state.update({
             'c_id': str(row['User_ID']), 
+            'c_user_id': int(row['User_ID']),
             'c_score': int(row['CreditScore']), 
             'c_geo': row['Geography'],
             'c_gen': row['Gender'], 
@@ -1616,6 +1109,32 @@ with st.sidebar:
     </div>
     """, unsafe_allow_html=True)
 
+# --- SAYFA KAYNAKLARI ---
+# Sadece seçili sayfanın ihtiyaç duyduğu artefaktlar yüklenir
+pro_scorer = lite_scorer = pro_decisions = lite_decisions = df_original = churn_model = df_churn = None
+kmeans_model = scaler_model = churn_scorer = churn_scores = churn_ranking = nba_rules = None
+cluster_names_map = {}
+silhouette_val = 0.0
+
+page_resources = load_page_resources(page)
+pro_scorer = page_resources.get('pro_scorer')
+lite_scorer = page_resources.get('lite_scorer')
+pro_decisions = page_resources.get('pro_decisions')
+lite_decisions = page_resources.get('lite_decisions')
+df_original = page_resources.get('df_risk')
+churn_model = page_resources.get('churn_model')
+churn_scorer = page_resources.get('churn_scorer')
+if 'churn_data' in page_resources:
+    churn_bundle = page_resources['churn_data']
+    df_churn = churn_bundle['df']
+    kmeans_model = churn_bundle['kmeans']
+    scaler_model = churn_bundle['scaler']
+    cluster_names_map = churn_bundle['cluster_map']
+    silhouette_val = churn_bundle['silhouette']
+churn_scores = page_resources.get('churn_scores')
+churn_ranking = page_resources.get('churn_ranking')
+nba_rules = page_resources.get('nba_rules')
+
 # =========================================================
 # SAYFA 1: KREDİ RİSK TAHMİNİ
 # =========================================================
@@ -1625,7 +1144,7 @@ if page == "🛡️ Kredi Risk Tahmini":
     with col_r1:
         st.button("🎲 Rastgele Getir", on_click=get_random_risk_customer, use_container_width=True)
 
-    t1, t2 = st.tabs(["🚀 Hızlı Analiz (Lite)", "📈 Detaylı Analiz (Pro)"])
+    t1, t2, t3 = st.tabs(["🚀 Hızlı Analiz (Lite)", "📈 Detaylı Analiz (Pro)", "📂 Toplu Skorlama"])
 
     with t1:
         c1, c2 = st.columns(2)
@@ -1638,18 +1157,17 @@ if page == "🛡️ Kredi Risk Tahmini":
         l_emp = c2.selectbox("Çalışma", list(EMP_MAP.keys()), key="l_emp")
 
         if st.button("🚀 ANALİZ ET (LITE)", type="primary", use_container_width=True):
-            if lite_model:
-                df = pd.DataFrame(
-                    {'annual_inc': [l_inc], 'loan_amnt': [l_loan], 'term': [map_term(l_term)], 'grade': [l_grade],
-                     'home_ownership': [HOME_MAP[l_home]], 'purpose': [PURPOSE_MAP[l_purp]],
-                     'emp_length': [clean_emp_length_input(l_emp)]})
-                df['loan_to_income'] = df['loan_amnt'] / (df['annual_inc'] + 1)
-                prob = float(lite_model.predict_proba(df)[0][1])
-                pred = lite_model.predict(df)[0]
+            if lite_decisions:
+                # Form etiketleri ortak özellik modülünde model girdisine çevrilir; skor derlenmiş
+                # XGBoost yolundan alınır, aynı başvurunun tekrarı önbellekten (LRU+TTL) gelir
+                record = prepare_application({
+                    'annual_inc': l_inc, 'loan_amnt': l_loan, 'term': l_term, 'grade': l_grade,
+                    'home_ownership': l_home, 'purpose': l_purp, 'emp_length': l_emp}, 'lite')
+                prob = lite_decisions.predict_one(record)
                 st.divider();
                 k1, k2, k3 = st.columns(3)
                 k1.metric("Risk Skoru", f"%{prob * 100:.1f}")
-                k2.metric("Karar", "RED" if pred == 1 else "ONAY")
+                k2.metric("Karar", "RED" if prob > DECISION_THRESHOLD else "ONAY")
                 k3.metric("Güven", "0.70")
                 st.progress(prob, text="Risk Seviyesi")
         
@@ -1727,21 +1245,17 @@ if page == "🛡️ Kredi Risk Tahmini":
             analyze_pro = st.form_submit_button("📊 ANALİZ ET (PRO)", type="primary", use_container_width=True)
 
         if analyze_pro:
-            if pro_model:
-                df = pd.DataFrame(
-                    {'loan_amnt': [p_loan], 'term': [map_term(p_term)], 'int_rate': [p_int], 'installment': [p_inst],
-                     'grade': [p_grade], 'sub_grade': ['B1'], 'emp_length': [clean_emp_length_input(p_emp)],
-                     'home_ownership': [HOME_MAP[p_home]], 'annual_inc': [p_inc],
-                     'verification_status': [VERIF_MAP[p_ver]], 'purpose': ['debt_consolidation'], 'dti': [p_dti],
-                     'revol_bal': [p_rev], 'revol_util': [40.0], 'total_acc': [p_acc]})
-                df['loan_to_income'] = df['loan_amnt'] / (df['annual_inc'] + 1)
-                df['installment_to_income'] = df['installment'] / ((df['annual_inc'] / 12) + 1)
-                df['balance_income_ratio'] = df['revol_bal'] / (df['annual_inc'] + 1)
-                prob = float(pro_model.predict_proba(df)[0][1])
+            if pro_decisions:
+                # Formda sorulmayan sub_grade/purpose/revol_util PRO_DEFAULTS ile doldurulur
+                record = prepare_application({
+                    'loan_amnt': p_loan, 'term': p_term, 'int_rate': p_int, 'installment': p_inst, 'grade': p_grade,
+                    'emp_length': p_emp, 'home_ownership': p_home, 'annual_inc': p_inc,
+                    'verification_status': p_ver, 'dti': p_dti, 'revol_bal': p_rev, 'total_acc': p_acc}, 'pro')
+                prob = pro_decisions.predict_one(record)
                 st.divider();
                 k1, k2, k3 = st.columns(3)
                 k1.metric("Risk Skoru", f"%{prob * 100:.1f}");
-                k2.metric("Karar", "RED" if prob > 0.5 else "ONAY");
+                k2.metric("Karar", "RED" if prob > DECISION_THRESHOLD else "ONAY");
                 k3.metric("Güven", "0.70")
                 st.progress(prob, text="Kredi Risk Seviyesi")
         
@@ -1816,6 +1330,67 @@ if page == "🛡️ Kredi Risk Tahmini":
             Büyük tutarlı krediler, kurumsal müşteriler veya detaylı risk analizi gerektiren durumlarda kullanılır.
             """)
 
+    with t3:
+        st.markdown("Binlerce başvuruyu tek seferde skorlayın. Dosya parça parça okunur ve skorlanır; "
+                    "sonuçlar diske yazılır, dosyanın tamamı bellekte tutulmaz.")
+        b1, b2 = st.columns(2)
+        batch_file = b1.file_uploader("Başvuru Dosyası (CSV / Parquet)", type=['csv', 'parquet'])
+        batch_kind = b2.radio("Model", ["Lite", "Pro"], horizontal=True)
+        batch_chunk = b2.selectbox("Parça Boyutu (satır)", [10000, 50000, 100000], index=1)
+        batch_keep = b2.checkbox("Başvuru sütunlarını da çıktıya ekle", value=False)
+        with st.expander("📄 Beklenen Sütunlar", expanded=False):
+            st.markdown("""
+            - **Lite:** `annual_inc`, `loan_amnt`, `term`, `grade`, `home_ownership`, `purpose`, `emp_length`
+            - **Pro:** `loan_amnt`, `term`, `int_rate`, `installment`, `grade`, `emp_length`, `home_ownership`,
+              `annual_inc`, `verification_status`, `dti`, `revol_bal`, `total_acc`
+              (opsiyonel: `sub_grade`, `purpose`, `revol_util` — yoksa formdaki varsayılanlar kullanılır)
+            - `term` ay (36) veya `" 36 months"`; `emp_length` `"10+ years"` veya formdaki etiketler;
+              ev durumu / amaç / teyit alanları model değerleri (`RENT`) veya formdaki etiketler (`Kiracı`) olabilir
+            - Türetilmiş oranlar (`loan_to_income`, `installment_to_income`, `balance_income_ratio`) otomatik hesaplanır
+            """)
+
+        batch_scorer = lite_scorer if batch_kind == "Lite" else pro_scorer
+        if st.button("📂 TOPLU SKORLA", type="primary", use_container_width=True, disabled=batch_file is None):
+            if batch_scorer:
+                score_credit_upload(batch_file, batch_kind.lower(), batch_scorer, batch_chunk, batch_keep)
+
+        batch_result = st.session_state.get('credit_batch')
+        if batch_result and os.path.exists(batch_result['path']):
+            st.divider()
+            k1, k2, k3 = st.columns(3)
+            k1.metric("Skorlanan Başvuru", f"{batch_result['rows']:,}")
+            k2.metric("RED Oranı", f"%{batch_result['rejected'] / max(batch_result['rows'], 1) * 100:.1f}")
+            k3.metric("Ortalama Risk", f"%{batch_result['mean_risk'] * 100:.1f}")
+            st.caption(f"📄 {batch_result['name']} · {batch_result['kind'].title()} model · ilk 20 satır")
+            if batch_result['preview'] is not None:
+                st.dataframe(batch_result['preview'].style.format({'Risk_Probability': '{:.1%}'}),
+                             use_container_width=True, hide_index=True)
+            with open(batch_result['path'], 'rb') as result_file:
+                st.download_button("📥 Sonuçları İndir (CSV)", data=result_file,
+                                   file_name=f"KrediRiskSkorlari_{batch_result['kind']}.csv", mime="text/csv",
+                                   use_container_width=True)
+
+    # Yönetici görünümü: form kararları önbelleğinin (bankaci/decision_cache.py) durumu
+    if ADMIN_MODE:
+        st.divider()
+        with st.expander("🛠️ Yönetici: Karar Önbelleği", expanded=False):
+            st.caption(f"Lite/Pro form kararları model başına LRU+TTL önbellekte tutulur (en fazla {MAX_ENTRIES:,} "
+                       f"kayıt, {TTL_SECONDS // 60} dk). Model dosyası değişince önbellek otomatik olarak boşalır.")
+            # Temizleme tablodan önce: aynı çalıştırmada güncel sayaçlar gösterilir
+            if st.button("🧹 Önbelleği Temizle", key="clear_decision_cache"):
+                for decisions in (lite_decisions, pro_decisions):
+                    decisions.cache.clear()
+                st.toast("Karar önbelleği temizlendi", icon="🧹")
+            cache_rows = []
+            for label, decisions in (("Lite", lite_decisions), ("Pro", pro_decisions)):
+                stats = decisions.stats()
+                cache_rows.append({
+                    'Model': label, 'Kayıt': f"{stats['entries']:,} / {stats['maxsize']:,}",
+                    'İsabet (Hit)': stats['hits'], 'Iska (Miss)': stats['misses'],
+                    'İsabet Oranı': f"%{stats['hit_rate'] * 100:.1f}", 'Süresi Dolan': stats['expired'],
+                    'Çıkarılan': stats['evictions'], 'Model Hash': (stats['model_hash'] or "-")[:12]})
+            st.table(pd.DataFrame(cache_rows).set_index('Model'))
+
 # =========================================================
 # SAYFA 2: MÜŞTERİ KAYIP (CHURN)
 # =========================================================
@@ -1846,35 +1421,17 @@ elif page == "📉 Müşteri Kayıp (Churn)":
         if st.button("🔍 KAYIP RİSKİNİ HESAPLA", type="primary", use_container_width=True):
             if churn_model:
                 age_grp = 'Young' if c_age <= 30 else 'Adult' if c_age <= 45 else 'Middle' if c_age <= 60 else 'Senior'
-                input_df = pd.DataFrame(
-                    {'CreditScore': [c_score], 'Geography': [c_geo], 'Gender': [c_gen], 'Age': [c_age], 'Tenure': [5],
-                     'Balance': [c_bal], 'NumOfProducts': [c_prod], 'HasCrCard': [1 if c_card == "Evet" else 0],
-                     'IsActiveMember': [1 if c_active == "Aktif" else 0], 'EstimatedSalary': [c_sal],
-                     'Balance_per_Product': [c_bal / (c_prod + 0.1)], 'Age_Group': [age_grp],
-                     'Credit_Score_Age_Ratio': [c_score / (c_age + 1)],
-                     'Is_High_Value_Active': [1 if (c_active == "Aktif" and c_bal > 70000) else 0]})
-                prob = float(churn_model.predict_proba(input_df)[0][1])
-                
-                # advanced_strategy fonksiyonu ile aynı mantık
-                if prob > 0.60:
-                    if c_bal > 50000:
-                        strategy_text = "🚨 VIP MÜDAHALE"
-                    elif c_prod >= 3:
-                        strategy_text = "🔄 SADELEŞTİRME"
-                    else:
-                        strategy_text = "📞 ARAMA"
-                elif prob > 0.40:
-                    if c_active == "Pasif":
-                        strategy_text = "🔔 UYANDIRMA"
-                    elif c_age < 35:
-                        strategy_text = "🎁 LIFESTYLE HEDİYE"
-                    else:
-                        strategy_text = "💳 TEŞVİK"
-                else:  # prob <= 0.40
-                    if c_bal > 100000:
-                        strategy_text = "💰 YATIRIM ÇAPRAZ SATIŞ"
-                    else:
-                        strategy_text = "🤝 İLİŞKİ YÖNETİMİ"
+                record = {'CreditScore': c_score, 'Geography': c_geo, 'Gender': c_gen, 'Age': c_age, 'Tenure': 5,
+                          'Balance': c_bal, 'NumOfProducts': c_prod, 'HasCrCard': 1 if c_card == "Evet" else 0,
+                          'IsActiveMember': 1 if c_active == "Aktif" else 0, 'EstimatedSalary': c_sal,
+                          'Balance_per_Product': c_bal / (c_prod + 0.1), 'Age_Group': age_grp,
+                          'Credit_Score_Age_Ratio': c_score / (c_age + 1),
+                          'Is_High_Value_Active': 1 if (c_active == "Aktif" and c_bal > 70000) else 0}
+                # Derlenmiş tek kayıt yolu: DataFrame/Pipeline yükü olmadan predict_proba ile aynı skor
+                prob = churn_scorer.predict_one(record)
+                
+                # Toplu risk listesiyle aynı strateji motoru
+                strategy_text = customer_strategy(prob, c_bal, c_prod, 1 if c_active == "Aktif" else 0, c_age)
                 st.divider();
                 res1, res2 = st.columns([1, 2])
                 with res1:
@@ -1953,13 +1510,12 @@ elif page == "📉 Müşteri Kayıp (Churn)":
             col_list1, _ = st.columns([1, 3])
             with col_list1:
                 top_n = st.selectbox("Görüntülenecek Müşteri Sayısı", [10, 100, 500, 1000], index=1)
-            all_probs = churn_model.predict_proba(df_churn.drop(
-                columns=['User_ID', 'Has_Vadesiz', 'Has_BES', 'Has_Kredi', 'Has_Yatirim', 'Spending_Score',
-                         'Cluster_Label', 'Segment_Name'], errors='ignore'))[:, 1]
-            df_res = df_churn.copy();
-            df_res['Risk_Probability'] = all_probs;
-            df_res['Strategy'] = df_res.apply(advanced_strategy, axis=1)
-            df_top = df_res.sort_values('Risk_Probability', ascending=False).head(top_n)
+            # Risk sıralaması ve stratejiler skor sürümü başına bir kez hazırlanır; burada
+            # sadece ilk N müşteri dilimlenir
+            top_positions = churn_ranking.top(top_n)
+            df_top = df_churn.iloc[top_positions].assign(Risk_Probability=churn_ranking.scores[top_positions])
+            df_top['Strategy'] = pd.Categorical.from_codes(churn_ranking.strategy_codes[top_positions],
+                                                           categories=STRATEGIES)
             
             # CSV verisini önceden hazırla (buton için)
             csv = df_top[['User_ID', 'Risk_Probability', 'Strategy']].to_csv(index=False).encode('utf-8-sig')
@@ -1978,9 +1534,7 @@ elif page == "📉 Müşteri Kayıp (Churn)":
 
     with tab_analytics:
         if churn_model and df_churn is not None:
-            all_probs_all = churn_model.predict_proba(df_churn.drop(
-                columns=['User_ID', 'Has_Vadesiz', 'Has_BES', 'Has_Kredi', 'Has_Yatirim', 'Spending_Score',
-                         'Cluster_Label', 'Segment_Name'], errors='ignore'))[:, 1]
+            all_probs_all = churn_scores
             df_analysis = df_churn.copy()
             df_analysis['Risk_Probability'] = all_probs_all
             age_order = ['Young', 'Adult', 'Middle', 'Senior']
@@ -2457,7 +2011,8 @@ elif page == "🎯 Fırsatlar & Satış (NBA - K-Means)":
                                 'Has_Yatirim': s.get('has_yatirim', 0), 'Has_BES': s.get('has_bes', 0),
                                 'HasCrCard': 1 if s.get('c_card') == "Evet" else 0, 'Has_Kredi': s.get('has_kredi', 0),
                                 'CreditScore': s.get('c_score', 650), 'NumOfProducts': s.get('c_prod', 1),
-                                'Tenure': s.get('c_tenure', 5), 'IsActiveMember': 1 if s.get('c_active') == "Aktif" else 0}
+                                'Tenure': s.get('c_tenure', 5), 'IsActiveMember': 1 if s.get('c_active') == "Aktif" else 0,
+                                'User_ID': s.get('c_user_id') or "ID_YOK"}
                 segment_name, cust_id = s.get('c_segment', "Bilinmiyor"), s.get('c_id', "ID_YOK")
         else:
             # Session state'ten değerleri al veya varsayılan kullan
@@ -2521,7 +2076,8 @@ elif page == "🎯 Fırsatlar & Satış (NBA - K-Means)":
                     'CreditScore': m_score,
                     'NumOfProducts': m_prod,
                     'Tenure': st.session_state.get('manual_tenure', 5),
-                    'IsActiveMember': 1 if st.session_state.get('manual_active', True) else 0
+                    'IsActiveMember': 1 if st.session_state.get('manual_active', True) else 0,
+                    'User_ID': "Manuel-001"
                 }
                 
                 # --- MANUEL SEGMENT TAHMİNİ ---
@@ -2710,10 +2266,7 @@ elif page == "🎯 Fırsatlar & Satış (NBA - K-Means)":
             st.subheader("📂 Segment Bazlı Kampanya Yönetimi")
             
             # --- SEGMENT DASHBOARD PANEL ---
-            cols_to_drop = ['User_ID', 'Has_Vadesiz', 'Has_BES', 'Has_Kredi', 'Has_Yatirim', 'Spending_Score',
-                            'Cluster_Label', 'Segment_Name']
-            X_all = df_churn.drop(columns=cols_to_drop, errors='ignore')
-            all_risk_scores = churn_model.predict_proba(X_all)[:, 1]
+            all_risk_scores = churn_scores
             df_dash = df_churn.copy()
             df_dash['Risk_Probability'] = all_risk_scores
 
@@ -2786,19 +2339,10 @@ elif page == "🎯 Fırsatlar & Satış (NBA - K-Means)":
                 display_segment_name = selected_segment
 
 
-            def get_nba_product_only(row): 
-                # Pandas Series için güvenli erişim
-                try:
-                    if isinstance(row, dict):
-                        segment = row.get('Segment_Name', None)
-                    else:  # pandas Series
-                        segment = row['Segment_Name'] if 'Segment_Name' in row.index else None
-                except:
-                    segment = None
-                return get_next_best_action(row, segment_name=segment)['Product']
-
-
-            filtered_df['Onerilen_Urun'] = filtered_df.apply(get_nba_product_only, axis=1)
+            # Tüm liste için öneriler tek seferde (vektörel) hesaplanır
+            nba_df = next_best_actions(filtered_df, filtered_df['Segment_Name'], cluster_names_map.values(),
+                                       table=nba_rules)
+            filtered_df['Onerilen_Urun'] = nba_df['Product']
 
             st.write(f"**{display_segment_name}** için **{len(filtered_df)}** müşteri bulundu.")
             
@@ -2834,7 +2378,32 @@ elif page == "🎯 Fırsatlar & Satış (NBA - K-Means)":
             
             st.download_button(label=button_label, data=csv_camp,
                                file_name=file_name, mime="text/csv")
-            
+
+            # Çoklu teklif kampanyası: müşteri x ürün olasılık matrisinden en iyi k teklif
+            st.markdown("##### 🧺 Çoklu Teklif Listesi")
+            col_k, _ = st.columns([1, 3])
+            with col_k:
+                offers_per_customer = st.selectbox("Müşteri Başına Teklif Sayısı", [1, 2, 3], index=2)
+            offers_df = ranked_offers(filtered_df, filtered_df['Segment_Name'], cluster_names_map.values(),
+                                      k=offers_per_customer, table=nba_rules)
+            offers_csv = filtered_df.loc[offers_df.index, ['User_ID', 'Segment_Name']].assign(
+                Sira=offers_df['Rank'].to_numpy(), Teklif=offers_df['Product'].to_numpy(),
+                Satis_Ihtimali=offers_df['Prob'].to_numpy())
+            for emoji in ['💎 ', '🚀 ', '💰 ', '⚠️ ', '🌱 ', '📊 ']:
+                offers_csv['Segment_Name'] = offers_csv['Segment_Name'].str.replace(emoji, '', regex=False)
+            st.caption(f"{len(filtered_df):,} müşteri için toplam {len(offers_df):,} uygun teklif "
+                       f"(1. sıra NBA önerisi, diğerleri satış ihtimaline göre; en fazla {offers_per_customer} / müşteri).")
+            st.download_button(label=f"📥 Çoklu Teklif Listesini İndir (Top {offers_per_customer})",
+                               data=offers_csv.to_csv(index=False).encode('utf-8-sig'),
+                               file_name=file_name.replace("Campaign_", f"Campaign_Top{offers_per_customer}_"),
+                               mime="text/csv")
+
+            # Karar tablosu kural isabetleri (bu liste için; hiç tetiklenmeyen kurallar dahil)
+            with st.expander("📐 Karar Tablosu Kural İsabetleri", expanded=False):
+                st.caption(f"Kurallar `bankaci/nba_rules.json` dosyasından okunur; dosya değişince "
+                           f"sunucu yeniden başlatılmadan yeniden yüklenir. Sürüm: {nba_rules.version}")
+                st.table(nba_rules.hit_report(nba_df['Rule']))
+
             # Silhouette Score Hakkında Bilgi
             st.markdown("---")
             with st.expander("ℹ️ Silhouette Score (Silüet Skoru) Hakkında Bilgi", expanded=False):
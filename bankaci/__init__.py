@@ -0,0 +1,6 @@
+"""
+Bankacı Plus çekirdek modülleri.
+
+Bu paket Streamlit'ten bağımsızdır; app.py, komut satırı araçları ve
+benchmark scriptleri aynı kodu buradan kullanır.
+"""
@@ -0,0 +1,147 @@
+"""
+Uygulamanın çalışma zamanı artefaktları ve süreç genelindeki kayıt defteri.
+
+Yükleyiciler Streamlit'e bağlı değildir; aynı kayıt defteri hem web
+uygulaması hem de sunucu açılışındaki ısınma (warm-up) thread'i tarafından
+kullanılır. Böylece ısınmada yüklenen modeller ilk oturuma hazır gelir.
+"""
+
+import os
+import threading
+
+import joblib
+import pandas as pd
+
+from bankaci.decision_cache import CachedCreditScorer, load_model_file
+from bankaci.ids import assign_user_ids
+from bankaci.inference import churn_scorer, credit_scorer
+from bankaci.resources import ResourceRegistry, require_file
+from bankaci.scoring import SCORES_FILENAME, RiskBandIndex, RiskRanking, load_or_score, scored_portfolio
+from bankaci.manifest import MANIFEST_FILENAME
+from bankaci.nba import RULES_PATH, load_decision_table
+from bankaci.segmentation import (KMEANS_FILENAME, PROCESSED_FILENAME, SCALER_FILENAME,
+                                  SegmentationArtifactsError, load_artifacts as load_segmentation_artifacts)
+from bankaci.snapshot import import_csv
+from bankaci.strategy import portfolio_strategy_codes
+
+PRO_MODEL_FILENAME = 'credit_risk_model_20fold.pkl'
+LITE_MODEL_FILENAME = 'credit_risk_lite_model.pkl'
+RISK_DATA_FILENAME = 'lending_club_cleaned.csv'
+CHURN_MODEL_FILENAME = 'churn_model_v1.pkl'
+PROCESSED_CSV_FILENAME = 'churn_processed_with_clusters.csv'
+
+# Kayıtlı tüm artefaktlar (ısınma sırası)
+ARTIFACT_NAMES = ['pro_model_file', 'lite_model_file', 'pro_model', 'lite_model', 'pro_scorer', 'lite_scorer', 'pro_decisions', 'lite_decisions',
+                  'df_risk', 'churn_model', 'churn_scorer', 'churn_data', 'churn_scores', 'churn_scored',
+                  'churn_ranking', 'churn_bands', 'nba_rules']
+
+
+def load_churn_segmentation(root):
+    """
+    İşlenmiş churn verisi + KMeans/scaler + segment haritası + silüet skoru.
+    Artefaktlar sadece okunur; KMeans burada eğitilmez. Eksik veya ham veriyle
+    uyumsuz artefaktlar `python -m bankaci.build` ile üretilir.
+    """
+    processed_file = os.path.join(root, PROCESSED_FILENAME)
+    # CSV sadece içe aktarma yolu: snapshot yoksa CSV'den bir kez dönüştürülür
+    processed_csv = os.path.join(root, PROCESSED_CSV_FILENAME)
+
+    if not os.path.exists(processed_file) and os.path.exists(processed_csv):
+        try:
+            import_csv(processed_csv, processed_file)
+        except ValueError as e:
+            raise SegmentationArtifactsError(f"İşlenmiş CSV snapshot'a dönüştürülemedi: {e}") from e
+
+    # Eksik/uyumsuz artefaktlarda hata fırlatılır (önbelleğe alınmaz, sayfada gösterilir)
+    bundle = load_segmentation_artifacts(root)
+
+    df_churn_proc = bundle['df']
+    if 'User_ID' not in df_churn_proc.columns:
+        # Satır sırasından türetilen, yeniden başlatmada değişmeyen benzersiz kimlikler (O(n))
+        df_churn_proc.insert(0, 'User_ID', assign_user_ids(len(df_churn_proc)))
+
+    return bundle
+
+
+def build_registry(root):
+    """
+    root dizinindeki artefaktlar için yükleyicileri kaydeder. Dosyası değişen
+    artefakt (ör. `python -m bankaci.build` sonrası) ve ona bağlı olanlar arka
+    planda yeniden yüklenir; bu sırada oturumlar eski değerleri kullanır.
+    """
+    registry = ResourceRegistry()
+
+    def path(filename):
+        return os.path.join(root, filename)
+
+    def load_churn_scores():
+        # (model hash'i, veri hash'i) anahtarıyla diske yazılır; yeniden başlatmada tekrar skorlanmaz
+        scores, _ = load_or_score(registry.get('churn_model'), registry.get('churn_data')['df'],
+                                  path(CHURN_MODEL_FILENAME), path(PROCESSED_FILENAME),
+                                  path(SCORES_FILENAME))
+        return scores
+
+    def load_scored_portfolio():
+        # Risk skorlu portföy: süreç genelinde tek, paylaşılan ve salt okunur kopya
+        return scored_portfolio(registry.get('churn_data')['df'], registry.get('churn_scores'))
+
+    def load_churn_ranking():
+        # Skor sürümü başına bir kez: azalan risk sırası + müşteri başına strateji kodu
+        scores = registry.get('churn_scores')
+        return RiskRanking(scores, portfolio_strategy_codes(registry.get('churn_data')['df'], scores))
+
+    # Kredi modelleri: (model, dosya hash'i) aynı okumadan; karar önbelleği bu hash ile anahtarlanır
+    registry.register('pro_model_file', lambda: load_model_file(
+        require_file(path(PRO_MODEL_FILENAME), 'Credit Risk Pro Model')),
+        files=[path(PRO_MODEL_FILENAME)])
+    registry.register('lite_model_file', lambda: load_model_file(
+        require_file(path(LITE_MODEL_FILENAME), 'Credit Risk Lite Model')),
+        files=[path(LITE_MODEL_FILENAME)])
+    registry.register('pro_model', lambda: registry.get('pro_model_file')[0], deps=['pro_model_file'])
+    registry.register('lite_model', lambda: registry.get('lite_model_file')[0], deps=['lite_model_file'])
+    # Kredi formları (düşük gecikmeli tekil skor) ve toplu skorlama için derlenmiş XGBoost yolu;
+    # model değişince yeniden derlenir
+    registry.register('pro_scorer', lambda: credit_scorer(registry.get('pro_model')), deps=['pro_model'])
+    registry.register('lite_scorer', lambda: credit_scorer(registry.get('lite_model')), deps=['lite_model'])
+    # Formlardaki tekil kararlar için model başına LRU+TTL önbellek; model dosyası değişince
+    # skorlayıcıyla birlikte boş bir önbellek (yeni hash ile) yüklenir
+    registry.register('pro_decisions', lambda: CachedCreditScorer(
+        registry.get('pro_scorer'), registry.get('pro_model_file')[1]), deps=['pro_model_file', 'pro_scorer'])
+    registry.register('lite_decisions', lambda: CachedCreditScorer(
+        registry.get('lite_scorer'), registry.get('lite_model_file')[1]), deps=['lite_model_file', 'lite_scorer'])
+    registry.register('df_risk', lambda: pd.read_csv(
+        require_file(path(RISK_DATA_FILENAME), 'Lending Club Dataset')),
+        files=[path(RISK_DATA_FILENAME)])
+    registry.register('churn_model', lambda: joblib.load(
+        require_file(path(CHURN_MODEL_FILENAME), 'Churn Prediction Model')),
+        files=[path(CHURN_MODEL_FILENAME)])
+    # Tekil müşteri skorlaması için derlenmiş çıkarım yolu (model değişince yeniden derlenir)
+    registry.register('churn_scorer', lambda: churn_scorer(registry.get('churn_model')), deps=['churn_model'])
+    # Ham veri burada izlenmez: ham veri değişince yeniden build gerekir, build
+    # bitip manifest yazıldığında yeni artefaktlar yüklenir
+    registry.register('churn_data', lambda: load_churn_segmentation(root),
+                      files=[path(PROCESSED_FILENAME), path(KMEANS_FILENAME),
+                             path(SCALER_FILENAME), path(MANIFEST_FILENAME)])
+    registry.register('churn_scores', load_churn_scores, deps=['churn_model', 'churn_data'])
+    registry.register('churn_scored', load_scored_portfolio, deps=['churn_data', 'churn_scores'])
+    registry.register('churn_ranking', load_churn_ranking, deps=['churn_data', 'churn_scores'])
+    # Rastgele müşteri seçimi için risk yüzdesi indeksi (skorlu portföydeki Risk_Percent ile aynı)
+    registry.register('churn_bands', lambda: RiskBandIndex(registry.get('churn_scores') * 100),
+                      deps=['churn_scores'])
+    # NBA karar tablosu: dosya düzenlenince sunucu yeniden başlatılmadan yeniden derlenir;
+    # geçersiz tablo yüklenemezse önceki tablo kullanılmaya devam eder
+    registry.register('nba_rules', lambda: load_decision_table(RULES_PATH), files=[RULES_PATH])
+    return registry
+
+
+_registries = {}
+_registries_guard = threading.Lock()
+
+
+def get_registry(root):
+    """Süreç genelinde root başına tek kayıt defteri (web oturumları + ısınma thread'i)."""
+    root = os.path.abspath(root)
+    with _registries_guard:
+        if root not in _registries:
+            _registries[root] = build_registry(root)
+        return _registries[root]
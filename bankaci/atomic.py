@@ -0,0 +1,132 @@
+"""
+Süreçler arası dosya kilidi ve atomik dosya yazımı.
+
+Artefakt yeniden oluşturma (KMeans + snapshot + manifest) aynı anda sadece bir
+süreçte/oturumda çalışmalı, diğerleri kilidi beklemeli veya önceki sürümle
+devam etmeli. Yazımlar önce aynı dizindeki geçici dosyaya yapılır ve
+os.replace ile tek adımda yerine konur; yarım yazılmış dosya hiç görünmez.
+"""
+
+import os
+import secrets
+import stat
+import threading
+import time
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+# Yeni dosyaların istenen izni; çekirdek umask'ı uygular (open() ile oluşturulmuş gibi, genelde 0644)
+NEW_FILE_MODE = 0o666
+
+
+class FileLock:
+    """
+    Kilit dosyası üzerinden özel (exclusive) kilit.
+
+    Unix'te flock, Windows'ta msvcrt.locking kullanılır. Aynı süreçteki
+    thread'ler ek olarak bir threading.Lock ile sıraya girer.
+    """
+
+    _thread_locks = {}
+    _thread_locks_guard = threading.Lock()
+
+    def __init__(self, path, poll_interval=0.2):
+        self.path = os.path.abspath(path)
+        self.poll_interval = poll_interval
+        self._fd = None
+        with FileLock._thread_locks_guard:
+            self._thread_lock = FileLock._thread_locks.setdefault(self.path, threading.Lock())
+
+    def _try_lock_file(self):
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+        except OSError:
+            os.close(fd)
+            return False
+        self._fd = fd
+        return True
+
+    def acquire(self, blocking=True, timeout=None):
+        """Kilidi alır; alınamazsa (blocking=False veya süre doldu) False döndürür."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        if not self._thread_lock.acquire(blocking, -1 if timeout is None or not blocking else timeout):
+            return False
+        while not self._try_lock_file():
+            if not blocking or (deadline is not None and time.monotonic() >= deadline):
+                self._thread_lock.release()
+                return False
+            time.sleep(self.poll_interval)
+        return True
+
+    def release(self):
+        if self._fd is None:
+            return
+        try:
+            if fcntl is not None:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+            else:
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(self._fd)
+            self._fd = None
+            self._thread_lock.release()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+
+
+def _create_temp(path):
+    """
+    Hedefle aynı dizinde benzersiz, boş bir geçici dosya oluşturur. mkstemp'in aksine
+    dosya 0600 değil, normal bir dosya gibi NEW_FILE_MODE & ~umask izniyle açılır
+    (umask'ı okumak için süreç genelinde değiştirmek gerekmez). Hedef zaten varsa
+    izinleri geçici dosyaya kopyalanır; yerine konan dosya aynı izinlerle kalır.
+    """
+    directory, name = os.path.split(os.path.abspath(path))
+    while True:
+        tmp = os.path.join(directory, f".{name}.{secrets.token_hex(6)}.tmp")
+        try:
+            fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_EXCL, NEW_FILE_MODE)
+        except FileExistsError:
+            continue
+        os.close(fd)
+        break
+    try:
+        os.chmod(tmp, stat.S_IMODE(os.stat(path).st_mode))
+    except FileNotFoundError:
+        pass
+    return tmp
+
+
+@contextmanager
+def atomic_path(path):
+    """
+    Hedefle aynı dizinde geçici bir dosya yolu verir; blok hatasız biterse
+    geçici dosya os.replace ile hedefin yerine konur, hata olursa silinir.
+
+        with atomic_path('kmeans_model.pkl') as tmp:
+            joblib.dump(model, tmp)
+    """
+    # Artefaktlar diğer süreç/kullanıcılarca da okunur: geçici dosya 0600 değil, normal izinlerle
+    tmp = _create_temp(path)
+    try:
+        yield tmp
+        os.replace(tmp, path)
+    except BaseException:
+        if os.path.exists(tmp):
+            os.remove(tmp)
+        raise
@@ -0,0 +1,182 @@
+"""
+Büyük müşteri dosyaları için başsız (headless) churn toplu skorlama.
+
+    python -m bankaci.batch musteriler.csv skorlar.csv
+    python -m bankaci.batch musteriler.parquet skorlar.parquet --chunk-size 200000 --all-columns
+
+Girdi (CSV veya Parquet) sabit boyutlu parçalar halinde okunur. Her parçada
+türetilmiş özellikler (Balance_per_Product, Age_Group, Credit_Score_Age_Ratio,
+Is_High_Value_Active) hesaplanır, churn modeli ile skorlanır ve aksiyon
+stratejisi atanır. Sonuçlar parça parça yazılır; bellek kullanımı dosya
+boyutundan bağımsız olarak tek parça ile sınırlıdır. Çıktı geçici dosyaya
+yazılır ve iş hatasız bitince hedefin yerine konur.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import joblib
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from bankaci.atomic import atomic_path
+from bankaci.inference import churn_scorer
+from bankaci.scoring import add_engineered_features
+from bankaci.strategy import STRATEGIES, portfolio_strategy_codes
+
+CHURN_MODEL_FILENAME = 'churn_model_v1.pkl'
+CHUNK_SIZE = 100000
+# Çıktıya taşınan müşteri anahtarı sütunları (girdide hangisi varsa)
+KEY_COLUMNS = ['User_ID', 'CustomerId']
+# Türetilmiş özellikler için girdide bulunması gereken ham sütunlar
+REQUIRED_COLUMNS = ['CreditScore', 'Geography', 'Gender', 'Age', 'Tenure', 'Balance', 'NumOfProducts',
+                    'HasCrCard', 'IsActiveMember', 'EstimatedSalary']
+
+
+class BatchInputError(ValueError):
+    """Girdi dosyası okunamıyor veya gerekli sütunlar eksik."""
+
+
+def _file_format(path):
+    ext = os.path.splitext(path)[1].lower()
+    if ext == '.csv':
+        return 'csv'
+    if ext in ('.parquet', '.pq'):
+        return 'parquet'
+    raise BatchInputError(f"Desteklenmeyen dosya uzantısı: {path} (.csv veya .parquet)")
+
+
+def iter_chunks(path, chunk_size=CHUNK_SIZE):
+    """Girdiyi en fazla chunk_size satırlık DataFrame parçaları olarak okur."""
+    if _file_format(path) == 'csv':
+        yield from pd.read_csv(path, chunksize=chunk_size)
+    else:
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunk_size):
+            yield batch.to_pandas()
+
+
+def score_chunk(scorer, chunk, all_columns=False):
+    """Tek parçanın skorları: müşteri anahtarı + Risk_Probability + Strategy."""
+    missing = [col for col in REQUIRED_COLUMNS if col not in chunk.columns]
+    if missing:
+        raise BatchInputError(f"Girdide eksik sütunlar: {', '.join(missing)}")
+    features = add_engineered_features(chunk)
+    probs = np.asarray(scorer.predict(features), dtype='float64')
+    codes = portfolio_strategy_codes(features, probs)
+    if all_columns:
+        out = features.reset_index(drop=True)
+    else:
+        out = chunk[[col for col in KEY_COLUMNS if col in chunk.columns]].reset_index(drop=True)
+    out['Risk_Probability'] = probs
+    out['Strategy'] = np.asarray(STRATEGIES, dtype=object)[codes]
+    return out, codes
+
+
+class ChunkWriter:
+    """Parçaları sırayla aynı CSV/Parquet dosyasına ekler."""
+
+    def __init__(self, path, file_format):
+        self.path = path
+        self.format = file_format
+        self._started = False
+        self._parquet = None
+
+    def write(self, df):
+        if self.format == 'csv':
+            df.to_csv(self.path, mode='a' if self._started else 'w', header=not self._started, index=False)
+        else:
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            if self._parquet is None:
+                self._parquet = pq.ParquetWriter(self.path, table.schema)
+            # İlk parçanın şeması esas alınır (ör. sonraki parçada NaN'lı tamsayı sütunu)
+            self._parquet.write_table(table.cast(self._parquet.schema))
+        self._started = True
+
+    def close(self):
+        if self._parquet is not None:
+            self._parquet.close()
+
+
+def score_file(model, input_path, output_path, chunk_size=CHUNK_SIZE, all_columns=False, progress=None):
+    """
+    input_path'teki müşterileri parça parça skorlayıp output_path'e yazar.
+    progress(parça_no, toplam_satır) her parçadan sonra çağrılır.
+    Dönüş: {'rows', 'chunks', 'strategy_counts', 'mean_risk'}
+    """
+    scorer = churn_scorer(model)
+    # Uzantılar çıktı dosyası açılmadan doğrulanır
+    _file_format(input_path)
+    output_format = _file_format(output_path)
+    rows = chunks = 0
+    risk_sum = 0.0
+    strategy_counts = np.zeros(len(STRATEGIES), dtype=np.int64)
+    with atomic_path(output_path) as tmp:
+        writer = ChunkWriter(tmp, output_format)
+        try:
+            for chunk in iter_chunks(input_path, chunk_size):
+                out, codes = score_chunk(scorer, chunk, all_columns)
+                writer.write(out)
+                chunks += 1
+                rows += len(out)
+                risk_sum += float(np.nansum(out['Risk_Probability'].to_numpy()))
+                strategy_counts += np.bincount(codes, minlength=len(STRATEGIES))
+                if progress is not None:
+                    progress(chunks, rows)
+            if chunks == 0:
+                # Boş girdide de başlıklı (boş) bir çıktı dosyası üret
+                writer.write(pd.DataFrame({'Risk_Probability': pd.Series(dtype='float64'),
+                                           'Strategy': pd.Series(dtype=object)}))
+        finally:
+            writer.close()
+    return {'rows': rows, 'chunks': chunks,
+            'strategy_counts': dict(zip(STRATEGIES, strategy_counts.tolist())),
+            'mean_risk': risk_sum / rows if rows else float('nan')}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Müşteri dosyasını parça parça churn modeliyle skorlar")
+    parser.add_argument('input', help="Girdi dosyası (.csv veya .parquet)")
+    parser.add_argument('output', help="Çıktı dosyası (.csv veya .parquet)")
+    parser.add_argument('--model', default=CHURN_MODEL_FILENAME, help="Churn modeli (joblib)")
+    parser.add_argument('--chunk-size', type=int, default=CHUNK_SIZE, help="Parça başına satır sayısı")
+    parser.add_argument('--all-columns', action='store_true',
+                        help="Girdi ve türetilmiş sütunları da çıktıya yaz (varsayılan: anahtar + skor + strateji)")
+    args = parser.parse_args(argv)
+
+    print("=" * 80)
+    print("CHURN TOPLU SKORLAMA")
+    print("=" * 80)
+    print(f"   Girdi: {args.input}")
+    print(f"   Çıktı: {args.output}")
+    print(f"   Parça boyutu: {args.chunk_size:,}")
+    print()
+
+    start = time.perf_counter()
+
+    def progress(chunk_no, rows):
+        print(f"   {chunk_no:>5}. parça | {rows:>12,} satır | {time.perf_counter() - start:>8.1f} sn")
+
+    try:
+        model = joblib.load(args.model)
+        summary = score_file(model, args.input, args.output, args.chunk_size, args.all_columns, progress)
+    except (OSError, BatchInputError) as e:
+        print(f"HATA: {e}")
+        return 1
+    total = time.perf_counter() - start
+
+    print()
+    print(f"   Toplam: {summary['rows']:,} müşteri, {summary['chunks']} parça, {total:.1f} sn "
+          f"({summary['rows'] / total if total else 0:,.0f} satır/sn)")
+    print(f"   Ortalama risk: {summary['mean_risk']:.1%}")
+    print("   Strateji dağılımı:")
+    for name, count in summary['strategy_counts'].items():
+        print(f"     {name:<28} {count:>12,}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,97 @@
+"""
+Çalışma zamanı artefaktlarını web uygulamasından bağımsız olarak üretir.
+
+    python -m bankaci.build                  # proje kök dizininde
+    python -m bankaci.build --root /app --n-init 10000
+
+Üretilenler: işlenmiş churn snapshot'ı (Parquet), kmeans_model.pkl,
+scaler_model.pkl, segmentation_manifest.json ve (churn_model_v1.pkl varsa)
+portföy risk skorları. Her aşamanın süresi raporlanır.
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import joblib
+
+from bankaci.segmentation import (N_INIT, SegmentationArtifactsError, artifact_files,
+                                  build_artifacts)
+from bankaci.manifest import MANIFEST_FILENAME
+from bankaci.scoring import SCORES_FILENAME, load_or_score
+
+CHURN_MODEL_FILENAME = 'churn_model_v1.pkl'
+
+STAGE_LABELS = {
+    'kilit_bekleme': 'Kilit bekleme',
+    'ham_veri_okuma': 'Ham veri okuma',
+    'urun_zenginlestirme': 'Ürün zenginleştirme',
+    'olcekleme': 'Ölçekleme (MinMaxScaler)',
+    'kmeans': 'K-Means eğitimi',
+    'silhouette': 'Silüet skoru',
+    'isimlendirme': 'Segment isimlendirme',
+    'yazma': 'Snapshot + modeller + manifest yazımı',
+    'skorlama': 'Churn portföy skorlama',
+}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bankacı Plus segmentasyon artefaktlarını üretir")
+    parser.add_argument('--root', default=os.getcwd(), help="Artefaktların bulunduğu proje kök dizini")
+    parser.add_argument('--n-init', type=int, default=N_INIT, help="K-Means başlangıç noktası sayısı")
+    parser.add_argument('--lock-timeout', type=float, default=None,
+                        help="Başka bir build çalışıyorsa en fazla bu kadar bekle (sn)")
+    args = parser.parse_args(argv)
+
+    print("=" * 80)
+    print("BANKACI PLUS ARTEFAKT BUILD")
+    print("=" * 80)
+    print(f"   Kök dizin: {args.root}")
+    print(f"   n_init: {args.n_init}")
+    print()
+
+    timings = {}
+    start = time.perf_counter()
+    try:
+        df, kmeans, scaler, cluster_names, sil_score = build_artifacts(
+            args.root, n_init=args.n_init, timings=timings, lock_timeout=args.lock_timeout)
+    except SegmentationArtifactsError as e:
+        print(f"HATA: {e}")
+        return 1
+
+    # Portföy skorlarını önceden hesapla (uygulama açılışta tekrar skorlamaz)
+    files = artifact_files(args.root)
+    model_path = os.path.join(args.root, CHURN_MODEL_FILENAME)
+    if os.path.exists(model_path):
+        stage_start = time.perf_counter()
+        load_or_score(joblib.load(model_path), df, model_path, files['processed'],
+                      os.path.join(args.root, SCORES_FILENAME))
+        timings['skorlama'] = time.perf_counter() - stage_start
+    total = time.perf_counter() - start
+
+    print("Aşama süreleri:")
+    print("-" * 80)
+    for key, label in STAGE_LABELS.items():
+        if key in timings:
+            print(f"   {label:<40} {timings[key]:>9.2f} sn")
+    print(f"   {'TOPLAM':<40} {total:>9.2f} sn")
+    print()
+
+    print(f"   Kayıt sayısı: {len(df)}")
+    print(f"   Silhouette Score: {sil_score:.4f}")
+    for cluster_id in sorted(cluster_names):
+        print(f"     {cluster_id}. {cluster_names[cluster_id]}")
+    print()
+
+    print("Üretilen dosyalar:")
+    for key in ('processed', 'kmeans', 'scaler'):
+        print(f"   {files[key]}")
+    print(f"   {os.path.join(args.root, MANIFEST_FILENAME)}")
+    if 'skorlama' in timings:
+        print(f"   {os.path.join(args.root, SCORES_FILENAME)}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
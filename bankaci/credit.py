@@ -0,0 +1,49 @@
+"""
+Kredi risk modelleri (Lite/Pro) için toplu başvuru skorlama.
+
+Yüklenen başvuru dosyası (CSV veya Parquet) parça parça okunur; her parça
+bankaci/credit_features.py'deki dönüşümlerle (tekil formla aynı) model girdisine
+çevrilir ve derlenmiş kredi modeliyle (bankaci.inference.credit_scorer) tek
+vektörel çağrıda skorlanır.
+"""
+
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+
+from bankaci.credit_features import CreditInputError, prepare_applications
+
+# Formdaki karar eşiği (olasılık > 0.5 -> RED)
+DECISION_THRESHOLD = 0.5
+
+CHUNK_SIZE = 50000
+
+
+def score_applications(scorer, df, kind):
+    """Bir parça başvurunun risk olasılığı ve kararı (scorer: credit_scorer(model), tek vektörel çağrı)."""
+    features = prepare_applications(df, kind)
+    probs = scorer.predict(features)
+    return pd.DataFrame({'Risk_Probability': probs,
+                         'Karar': np.where(probs > DECISION_THRESHOLD, "RED", "ONAY")}, index=df.index)
+
+
+def iter_application_chunks(source, name, chunk_size=CHUNK_SIZE):
+    """
+    Yüklenen dosyayı parçalar halinde okur. source: dosya yolu veya dosya nesnesi,
+    name: biçimi belirleyen dosya adı. (parça, okunan_oran) çiftleri üretir.
+    """
+    ext = name.rsplit('.', 1)[-1].lower()
+    if ext == 'csv':
+        size = getattr(source, 'size', None)
+        for chunk in pd.read_csv(source, chunksize=chunk_size):
+            # CSV'de toplam satır bilinmez; ilerleme okunan bayt oranından hesaplanır
+            done = min(source.tell() / size, 1.0) if size else None
+            yield chunk, done
+    elif ext in ('parquet', 'pq'):
+        parquet = pq.ParquetFile(source)
+        total, rows = parquet.metadata.num_rows, 0
+        for batch in parquet.iter_batches(batch_size=chunk_size):
+            rows += batch.num_rows
+            yield batch.to_pandas(), rows / total if total else 1.0
+    else:
+        raise CreditInputError(f"Desteklenmeyen dosya türü: {name} (.csv veya .parquet)")
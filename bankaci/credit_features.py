@@ -0,0 +1,176 @@
+"""
+Kredi risk modelleri (Lite/Pro) için ortak özellik mühendisliği.
+
+Form etiketi -> model değeri eşlemeleri (HOME/PURPOSE/VERIF/EMP_MAP), vade ve
+çalışma süresi dönüşümleri ve türetilmiş oranlar (loan_to_income,
+installment_to_income, balance_income_ratio) tek yerde tanımlıdır. Eğitim
+scriptleri, uygulamadaki Lite/Pro formları ve toplu skorlama aynı fonksiyonları
+kullanır; dönüşümler tüm sütun üzerinde tek geçişte çalışır (tek satırlık form
+da bir satırlık DataFrame olarak aynı yoldan geçer).
+
+Girdi hem Lending Club biçimini (lending_club_cleaned.csv: term=" 36 months",
+emp_length="10+ years", home_ownership="RENT") hem de formdaki Türkçe
+etiketleri (vade ay olarak, "1 yıldan az", "Kiracı" ...) kabul eder.
+"""
+
+import re
+
+import numpy as np
+import pandas as pd
+
+PURPOSE_MAP = {"Borç Birleştirme": "debt_consolidation", "Kredi Kartı": "credit_card",
+               "Ev Tadilatı": "home_improvement", "Büyük Harcama": "major_purchase", "Küçük İşletme": "small_business",
+               "Araba": "car", "Düğün": "wedding", "Diğer": "other"}
+HOME_MAP = {"Kiracı": "RENT", "İpotekli": "MORTGAGE", "Ev Sahibi": "OWN", "Diğer": "ANY"}
+VERIF_MAP = {"Doğrulanmış": "Verified", "Kaynak Doğrulanmış": "Source Verified", "Doğrulanmamış": "Not Verified"}
+EMP_MAP = {"1 yıldan az": "< 1 year", "1 yıl": "1 year", "2 yıl": "2 years", "10 yıl ve üzeri": "10+ years"}
+
+LITE_COLUMNS = ['annual_inc', 'loan_amnt', 'term', 'grade', 'home_ownership', 'purpose', 'emp_length']
+PRO_COLUMNS = ['loan_amnt', 'term', 'int_rate', 'installment', 'grade', 'sub_grade', 'emp_length',
+               'home_ownership', 'annual_inc', 'verification_status', 'purpose', 'dti', 'revol_bal',
+               'revol_util', 'total_acc']
+# Sayısal olması gereken ham girdi sütunları (term/emp_length metin de olabilir, ayrıca çözülür)
+NUMERIC_COLUMNS = ['annual_inc', 'loan_amnt', 'int_rate', 'installment', 'dti', 'revol_bal', 'revol_util',
+                   'total_acc']
+# Pro formunda sorulmayan alanlar formda bu sabitlerle doldurulur; dosyada yoksa aynısı kullanılır
+PRO_DEFAULTS = {'sub_grade': 'B1', 'purpose': 'debt_consolidation', 'revol_util': 40.0}
+
+
+class CreditInputError(ValueError):
+    """Başvurular model girdisine çevrilemiyor (eksik/sayısal olmayan sütun, desteklenmeyen dosya türü)."""
+
+
+def emp_length_to_years(value):
+    """Lending Club çalışma süresi metni -> yıl ("10+ years" -> 10, "< 1 year" -> 0, "3 years" -> 3)."""
+    return 10 if '+' in value else (0 if '<' in value else int(re.findall(r'\d+', value)[0]))
+
+
+def clean_emp_length_input(k):
+    """Formdaki çalışma süresi etiketi -> yıl; bilinmeyen/boş etiket 0."""
+    if pd.isna(k) or k not in EMP_MAP: return 0
+    return emp_length_to_years(EMP_MAP[k])
+
+
+def map_term(t): return " 36 months" if t <= 36 else " 60 months"
+
+
+def emp_years(value):
+    """Tek çalışma süresi değeri -> yıl: form etiketi, Lending Club metni veya sayı; tanınmayan/boş 0."""
+    if isinstance(value, str):
+        value = EMP_MAP.get(value, value)
+        return emp_length_to_years(value) if re.search(r'\d', value) else 0
+    return 0 if pd.isna(value) else int(value)
+
+
+def term_label(value):
+    """Tek vade değeri: ay (12..60) veya " 36 months" metni -> " 36 months"/" 60 months"; boşsa None."""
+    if isinstance(value, str):
+        match = re.search(r'\d+', value)
+        value = float(match.group()) if match else np.nan
+    if pd.isna(value):
+        return None
+    return " 36 months" if value <= 36 else " 60 months"
+
+
+def emp_length_years(values):
+    """
+    emp_years'ın sütun hali. Form etiketleri ("2 yıl"), Lending Club metinleri
+    ("2 years") ve sayılar kabul edilir; tanınmayan/boş değerler 0.
+    """
+    values = pd.Series(values)
+    numeric = pd.to_numeric(values, errors='coerce')
+    # Metin değerler tekil (unique) olarak bir kez çözülür
+    text = values[numeric.isna() & values.notna()].astype(str)
+    lookup = {label: emp_years(label) for label in text.unique()}
+    years = numeric.copy()
+    years[text.index] = text.map(lookup).astype('float64')
+    return years.fillna(0).astype('int64').to_numpy()
+
+
+def term_labels(values):
+    """term_label'ın sütun hali (tüm sütun tek geçişte)."""
+    values = pd.Series(values)
+    months = pd.to_numeric(values, errors='coerce')
+    text = values[months.isna() & values.notna()].astype(str)
+    months[text.index] = pd.to_numeric(text.str.extract(r'(\d+)', expand=False), errors='coerce')
+    labels = np.where(months <= 36, " 36 months", " 60 months").astype(object)
+    labels[months.isna().to_numpy()] = None
+    return labels
+
+
+def map_labels(values, mapping):
+    """Form etiketini model değerine çevirir; zaten model değeriyse olduğu gibi bırakır."""
+    values = pd.Series(values)
+    return values.map(lambda v: mapping.get(v, v)).to_numpy(dtype=object)
+
+
+def add_ratio_features(df):
+    """Türetilmiş oranlar (eğitim ve formla aynı formüller); kaynak sütunu olmayan oran eklenmez."""
+    ratios = {}
+    if 'loan_amnt' in df.columns:
+        ratios['loan_to_income'] = df['loan_amnt'] / (df['annual_inc'] + 1)
+    if 'installment' in df.columns:
+        ratios['installment_to_income'] = df['installment'] / ((df['annual_inc'] / 12) + 1)
+    if 'revol_bal' in df.columns:
+        ratios['balance_income_ratio'] = df['revol_bal'] / (df['annual_inc'] + 1)
+    return df.assign(**ratios)
+
+
+def _input_schema(kind, available):
+    """Model türünün girdi sütunları ve varsayılanları; eksik zorunlu sütunda CreditInputError."""
+    columns = LITE_COLUMNS if kind == 'lite' else PRO_COLUMNS
+    defaults = {} if kind == 'lite' else PRO_DEFAULTS
+    missing = [col for col in columns if col not in available and col not in defaults]
+    if missing:
+        raise CreditInputError(f"Dosyada eksik sütunlar: {', '.join(missing)}")
+    return columns, defaults
+
+
+def prepare_applications(df, kind):
+    """
+    Başvuruları modelin girdi biçimine getirir (kind: 'lite' veya 'pro').
+    Eksik zorunlu sütunda veya sayısal olmayan değerde CreditInputError verir.
+    """
+    columns, defaults = _input_schema(kind, df.columns)
+    out = pd.DataFrame(index=df.index)
+    for col in columns:
+        out[col] = df[col] if col in df.columns else defaults[col]
+    for col in NUMERIC_COLUMNS:
+        if col in out.columns:
+            try:
+                out[col] = pd.to_numeric(out[col], errors='raise')
+            except (ValueError, TypeError) as e:
+                raise CreditInputError(f"'{col}' sütununda sayısal olmayan değer var: {e}") from e
+    out['term'] = term_labels(out['term'])
+    out['emp_length'] = emp_length_years(out['emp_length'])
+    out['home_ownership'] = map_labels(out['home_ownership'], HOME_MAP)
+    out['purpose'] = map_labels(out['purpose'], PURPOSE_MAP)
+    if 'verification_status' in out.columns:
+        out['verification_status'] = map_labels(out['verification_status'], VERIF_MAP)
+    out = add_ratio_features(out)
+    if kind == 'lite':
+        # Lite modeli sadece kredi/gelir oranını kullanır
+        out = out.drop(columns=['installment_to_income', 'balance_income_ratio'], errors='ignore')
+    return out
+
+
+def prepare_application(fields, kind):
+    """
+    prepare_applications'ın tek başvuru hali: DataFrame kurmadan model girdisi
+    dict'i (derlenmiş kredi modeliyle tekil skorlama için). fields: sütun -> değer.
+    """
+    columns, defaults = _input_schema(kind, fields)
+    record = {col: fields[col] if col in fields else defaults[col] for col in columns}
+    record['term'] = term_label(record['term'])
+    record['emp_length'] = emp_years(record['emp_length'])
+    record['home_ownership'] = HOME_MAP.get(record['home_ownership'], record['home_ownership'])
+    record['purpose'] = PURPOSE_MAP.get(record['purpose'], record['purpose'])
+    if 'verification_status' in record:
+        record['verification_status'] = VERIF_MAP.get(record['verification_status'],
+                                                      record['verification_status'])
+    # add_ratio_features ile aynı formüller
+    record['loan_to_income'] = record['loan_amnt'] / (record['annual_inc'] + 1)
+    if kind == 'pro':
+        record['installment_to_income'] = record['installment'] / ((record['annual_inc'] / 12) + 1)
+        record['balance_income_ratio'] = record['revol_bal'] / (record['annual_inc'] + 1)
+    return record
@@ -0,0 +1,121 @@
+"""
+Kredi risk kararları için sınırlı LRU + TTL önbellek (memoization).
+
+Kredi uzmanları aynı başvuruyu Lite/Pro formlarından tekrar tekrar gönderir.
+Her model için ayrı bir önbellek tutulur; anahtar, normalize edilmiş model
+girdisi (prepare_application çıktısı, modelin sütun sırasında) ve model
+dosyasının sha256 hash'idir. Böylece etiket farkları ("Kiracı" / "RENT",
+36 / " 36 months") aynı kayda düşer, farklı bir model dosyasının sonucu ise
+asla servis edilmez.
+
+Önbellek kayıt defterinde ilgili skorlayıcıya bağlıdır (deps): model dosyası
+değişince model, derlenmiş skorlayıcı ve boş bir önbellek birlikte yeniden
+yüklenir. Hash, modelin yüklendiği baytların kendisinden hesaplanır
+(load_model_file); dosya yükleme ile hash arasında değişse bile önbellek
+anahtarı servis edilen modelle tutarlı kalır.
+"""
+
+import hashlib
+import io
+import numbers
+import threading
+import time
+from collections import OrderedDict
+
+import joblib
+
+# Model başına en fazla kayıt ve bir kaydın geçerlilik süresi (sn)
+MAX_ENTRIES = 4096
+TTL_SECONDS = 15 * 60
+
+
+class LRUTTLCache:
+    """
+    En fazla maxsize kayıt tutan, kayıtları ttl saniye sonra geçersiz sayan
+    thread güvenli önbellek. Dolunca en uzun süredir kullanılmayan kayıt çıkarılır.
+    """
+
+    def __init__(self, maxsize=MAX_ENTRIES, ttl=TTL_SECONDS, clock=time.monotonic):
+        if maxsize < 1:
+            raise ValueError("maxsize en az 1 olmalı")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        # anahtar -> (son geçerlilik anı, değer); sıra: en eski kullanılan başta
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.expired = self.evictions = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get_or_compute(self, key, compute):
+        """Anahtarın geçerli değeri; yoksa veya süresi dolduysa compute() ile hesaplanıp saklanır."""
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[1]
+                del self._entries[key]
+                self.expired += 1
+            self.misses += 1
+        # Model çağrısı kilit dışında: diğer oturumlar beklemez
+        value = compute()
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {'entries': len(self._entries), 'maxsize': self.maxsize, 'ttl': self.ttl,
+                    'hits': self.hits, 'misses': self.misses, 'expired': self.expired,
+                    'evictions': self.evictions, 'hit_rate': self.hits / lookups if lookups else 0.0}
+
+
+class CachedCreditScorer:
+    """
+    Kredi skorlayıcısının (credit_scorer) tekil skorlarını önbelleğe alan sarmalayıcı.
+    Toplu skorlama (predict) önbelleğe alınmaz, doğrudan skorlayıcıya gider.
+    """
+
+    def __init__(self, scorer, model_hash, maxsize=MAX_ENTRIES, ttl=TTL_SECONDS):
+        self.scorer = scorer
+        self.model_hash = model_hash
+        self.cache = LRUTTLCache(maxsize, ttl)
+
+    def key(self, record):
+        """Normalize edilmiş anahtar: (model hash'i, modelin sütun sırasında girdi değerleri)."""
+        values = []
+        for col in self.scorer.input_columns:
+            value = record[col]
+            # 60000 / 60000.0 / np.float64(60000) aynı anahtar
+            values.append(float(value) if isinstance(value, numbers.Real) else value)
+        return (self.model_hash, tuple(values))
+
+    def predict_one(self, record):
+        return self.cache.get_or_compute(self.key(record), lambda: self.scorer.predict_one(record))
+
+    def predict(self, df, num_threads=0):
+        return self.scorer.predict(df, num_threads)
+
+    def stats(self):
+        return {**self.cache.stats(), 'model_hash': self.model_hash}
+
+
+def load_model_file(path):
+    """Model dosyasını tek okumada yükler: (model, aynı baytların sha256 hash'i)."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    return joblib.load(io.BytesIO(data)), hashlib.sha256(data).hexdigest()
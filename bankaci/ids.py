@@ -0,0 +1,41 @@
+"""
+Deterministik, O(n) müşteri kimliği (User_ID) üretimi.
+
+Kimlik, satır anahtarından (portföydeki satır sırası) bir afin eşleme ile
+türetilir:
+
+    User_ID = ID_MIN + (ID_MULTIPLIER * anahtar + ID_OFFSET) mod ID_SPACE
+
+ID_MULTIPLIER ile ID_SPACE aralarında asal olduğundan eşleme [0, ID_SPACE)
+üzerinde birebirdir: farklı anahtarlar her zaman farklı kimlik alır. Kimlikler
+yeniden başlatmada değişmez; veri sonuna eklenen satırlar yeni anahtar alır,
+mevcut satırların kimliği korunur. Bellek ve süre portföy boyutuyla orantılıdır.
+"""
+
+import math
+
+import numpy as np
+
+# Eski davranışla aynı aralık: range(1000000, 9999999)
+ID_MIN = 1_000_000
+ID_SPACE = 8_999_999  # = 2999 * 3001
+ID_MULTIPLIER = 2_654_435_761  # Knuth çarpanı; ID_SPACE ile aralarında asal
+ID_OFFSET = 4_242_424
+
+assert math.gcd(ID_MULTIPLIER, ID_SPACE) == 1
+
+
+def user_ids_for_keys(keys):
+    """Satır anahtarlarından (0 <= anahtar < ID_SPACE) kimlik dizisi üretir."""
+    keys = np.asarray(keys, dtype=np.int64)
+    if keys.size and (keys.min() < 0 or keys.max() >= ID_SPACE):
+        raise ValueError(f"Satır anahtarı [0, {ID_SPACE}) aralığında olmalı")
+    # Çarpım taşmasın diye önce mod alınır (her iki çarpan da < ID_SPACE < 2**24)
+    return ID_MIN + ((ID_MULTIPLIER % ID_SPACE) * keys + ID_OFFSET) % ID_SPACE
+
+
+def assign_user_ids(n_rows, start=0):
+    """İlk satırın anahtarı start olmak üzere n_rows satır için kimlik üretir."""
+    if start + n_rows > ID_SPACE:
+        raise ValueError(f"En fazla {ID_SPACE:,} müşteriye benzersiz kimlik atanabilir")
+    return user_ids_for_keys(np.arange(start, start + n_rows, dtype=np.int64))
@@ -0,0 +1,252 @@
+"""
+Churn ve kredi risk modelleri için düşük gecikmeli çıkarım (inference) yolu.
+
+`churn_model` ve kredi modelleri (Lite/Pro) sklearn Pipeline'dır:
+ColumnTransformer (StandardScaler + OneHotEncoder) ve sırasıyla LGBMClassifier /
+XGBClassifier. Tek kayıt için bu zincirin süresinin çoğu tek satırlık DataFrame
+ve transformer katmanlarında geçer. Burada ön işleme yükleme sırasında düz numpy
+dizilerine derlenir (ortalama/ölçek ve kategori -> sütun haritaları); skor
+doğrudan booster'dan alınır (LightGBM predict, XGBoost inplace_predict). Sonuç
+`predict_proba` ile birebir aynıdır. Kazanç tekil kayıttadır; toplu skorlamada
+süreyi ağaç gezintisi belirlediğinden fark küçüktür.
+
+Kredi pipeline'ları seyrek (CSR) çıktı üretir; XGBoost seyrek girdide
+saklanmayan sıfırları eksik değer sayar. Derlenmiş kredi yolu bu yüzden yoğun
+dizide sıfırları NaN olarak yazar. LightGBM seyrek sıfırları sıfır saydığından
+churn tarafında seyrek çıktı desteklenmez.
+
+Desteklenmeyen bir pipeline (farklı transformer, sınıflandırıcı vb.) derlenemez;
+`churn_scorer` / `credit_scorer` bu durumda aynı arayüzle pipeline'ı kullanan
+yedeğe döner.
+"""
+
+import numpy as np
+import pandas as pd
+from lightgbm import LGBMClassifier
+from sklearn.compose import ColumnTransformer
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import OneHotEncoder, StandardScaler
+from xgboost import XGBClassifier
+
+
+class UnsupportedModelError(ValueError):
+    """Pipeline derlenmiş çıkarım yolunun desteklediği yapıda değil."""
+
+
+class CompiledColumnLayout:
+    """
+    ColumnTransformer(StandardScaler, OneHotEncoder) çıktısının numpy karşılığı.
+    Kayıtlar dict (sütun adı -> değer) veya `input_columns` sırasında tuple
+    olarak verilir; toplu skorlama için DataFrame.
+
+    sparse: pipeline seyrek çıktı üretiyorsa True; sıfır değerler (seyrek
+    matriste saklanmayanlar) NaN olarak yazılır.
+    """
+
+    def __init__(self, numeric_columns, mean, scale, categorical_columns, categories, sparse=False):
+        self.numeric_columns = list(numeric_columns)
+        self.categorical_columns = list(categorical_columns)
+        self.input_columns = self.numeric_columns + self.categorical_columns
+        self._mean = np.asarray(mean, dtype='float64')
+        self._scale = np.asarray(scale, dtype='float64')
+        self._categories = [np.asarray(cats, dtype=object) for cats in categories]
+        # Her kategorik sütun için değer -> çıktı sütunu (OneHotEncoder sırası)
+        offset = len(self.numeric_columns)
+        self._category_index = []
+        for cats in self._categories:
+            self._category_index.append({value: offset + i for i, value in enumerate(cats)})
+            offset += len(cats)
+        self.n_features = offset
+        self.sparse = sparse
+        self._empty = np.nan if sparse else 0.0
+
+    def _record_values(self, record):
+        if isinstance(record, dict):
+            return [record[col] for col in self.input_columns]
+        if len(record) != len(self.input_columns):
+            raise ValueError(f"{len(self.input_columns)} değer bekleniyordu ({', '.join(self.input_columns)}), "
+                             f"{len(record)} verildi")
+        return record
+
+    def transform_one(self, record):
+        """Tek kaydın model girdisi (1 x n_features); ColumnTransformer çıktısıyla aynı."""
+        values = self._record_values(record)
+        n_numeric = len(self.numeric_columns)
+        row = np.full((1, self.n_features), self._empty, dtype='float64')
+        numeric = np.array(values[:n_numeric], dtype='float64')
+        # StandardScaler ile aynı işlem sırası: önce ortalama çıkarılır, sonra ölçeğe bölünür
+        numeric -= self._mean
+        numeric /= self._scale
+        if self.sparse:
+            numeric[numeric == 0] = np.nan
+        row[0, :n_numeric] = numeric
+        # Bilinmeyen kategori (handle_unknown='ignore') tüm sütunları boş (0/NaN) bırakır
+        for lookup, value in zip(self._category_index, values[n_numeric:]):
+            column = lookup.get(value)
+            if column is not None:
+                row[0, column] = 1.0
+        return row
+
+    def transform(self, df):
+        """DataFrame'in model girdisi (len(df) x n_features), tek vektörel geçişte."""
+        n_numeric = len(self.numeric_columns)
+        features = np.full((len(df), self.n_features), self._empty, dtype='float64')
+        numeric = df[self.numeric_columns].to_numpy(dtype='float64', copy=True)
+        numeric -= self._mean
+        numeric /= self._scale
+        if self.sparse:
+            numeric[numeric == 0] = np.nan
+        features[:, :n_numeric] = numeric
+        rows = np.arange(len(df))
+        for col, cats, lookup in zip(self.categorical_columns, self._categories, self._category_index):
+            # Bilinmeyen kategori ve NaN -> -1 (handle_unknown='ignore': sütunlar boş kalır)
+            codes = pd.Index(cats).get_indexer(df[col])
+            known = codes >= 0
+            features[rows[known], lookup[cats[0]] + codes[known]] = 1.0
+        return features
+
+
+class CompiledChurnModel(CompiledColumnLayout):
+    """Derlenmiş churn modeli (LightGBM booster)."""
+
+    def __init__(self, numeric_columns, mean, scale, categorical_columns, categories, booster):
+        super().__init__(numeric_columns, mean, scale, categorical_columns, categories)
+        self._booster = booster
+
+    def predict_one(self, record):
+        """Tek müşterinin churn olasılığı (predict_proba(...)[0][1] ile aynı)."""
+        # Tek satırda iş parçacığı başlatmak hesaplamadan pahalı; tek thread ile tahmin
+        return float(self._booster.predict(self.transform_one(record), num_threads=1)[0])
+
+    def predict(self, df, num_threads=0):
+        """Portföyün churn olasılıkları (predict_proba(df)[:, 1] ile aynı)."""
+        return self._booster.predict(self.transform(df), num_threads=num_threads)
+
+
+class CompiledCreditModel(CompiledColumnLayout):
+    """
+    Derlenmiş kredi risk modeli (XGBoost booster, inplace_predict). Kayıtlar
+    bankaci.credit_features.prepare_application(s) çıktısıdır (türetilmiş oranlar dahil).
+    """
+
+    def __init__(self, numeric_columns, mean, scale, categorical_columns, categories, sparse, booster,
+                 iteration_range):
+        super().__init__(numeric_columns, mean, scale, categorical_columns, categories, sparse)
+        self._booster = booster
+        self._iteration_range = iteration_range
+
+    def _predict(self, features):
+        return self._booster.inplace_predict(features, iteration_range=self._iteration_range, missing=np.nan)
+
+    def predict_one(self, record):
+        """Tek başvurunun risk olasılığı (predict_proba(...)[0][1] ile aynı)."""
+        return float(self._predict(self.transform_one(record))[0])
+
+    def predict(self, df, num_threads=0):
+        """Başvuruların risk olasılıkları (predict_proba(df)[:, 1] ile aynı, float32)."""
+        # Booster'ın thread ayarı (n_jobs) eğitimdeki gibi kalır
+        return self._predict(self.transform(df))
+
+
+class PipelineModel:
+    """Derlenemeyen modeller için aynı arayüzle sklearn pipeline yolu."""
+
+    def __init__(self, model, input_columns):
+        self.model = model
+        self.input_columns = list(input_columns)
+
+    def predict_one(self, record):
+        if not isinstance(record, dict):
+            record = dict(zip(self.input_columns, record))
+        return float(self.model.predict_proba(pd.DataFrame([record]))[0][1])
+
+    def predict(self, df, num_threads=0):
+        return self.model.predict_proba(df)[:, 1]
+
+
+def _compile_preprocessor(model):
+    """
+    Pipeline(ColumnTransformer(StandardScaler, OneHotEncoder), sınıflandırıcı) yapısını
+    çözer: (CompiledColumnLayout argümanları, sınıflandırıcı). Başka bir yapıda
+    UnsupportedModelError verir.
+    """
+    if not isinstance(model, Pipeline) or len(model.steps) != 2:
+        raise UnsupportedModelError("Model iki adımlı bir sklearn Pipeline değil")
+    preprocessor, classifier = model.steps[0][1], model.steps[1][1]
+    if not isinstance(preprocessor, ColumnTransformer):
+        raise UnsupportedModelError("Ön işleme bir ColumnTransformer değil")
+
+    remainder = [transformer for name, transformer, _ in preprocessor.transformers_ if name == 'remainder']
+    if any(transformer != 'drop' for transformer in remainder):
+        raise UnsupportedModelError("remainder='drop' olmayan ColumnTransformer desteklenmiyor")
+    # Çıktı sütun sırası transformer sırasıdır: önce sayısal, sonra kategorik
+    fitted = [(transformer, columns) for name, transformer, columns in preprocessor.transformers_
+              if name != 'remainder']
+    if (len(fitted) != 2 or not isinstance(fitted[0][0], StandardScaler)
+            or not isinstance(fitted[1][0], OneHotEncoder)):
+        raise UnsupportedModelError("Ön işleme (StandardScaler, OneHotEncoder) sırasında değil")
+    (scaler, numeric_columns), (encoder, categorical_columns) = fitted
+    if encoder.drop_idx_ is not None or getattr(encoder, '_infrequent_enabled', False):
+        raise UnsupportedModelError("drop/seyrek kategori ayarlı OneHotEncoder desteklenmiyor")
+    mean = scaler.mean_ if scaler.with_mean else np.zeros(len(numeric_columns))
+    scale = scaler.scale_ if scaler.with_std else np.ones(len(numeric_columns))
+    layout = dict(numeric_columns=numeric_columns, mean=mean, scale=scale,
+                  categorical_columns=categorical_columns, categories=encoder.categories_)
+    return layout, preprocessor.sparse_output_, classifier
+
+
+def compile_churn_model(model):
+    """
+    Pipeline(ColumnTransformer(StandardScaler, OneHotEncoder), LGBMClassifier)
+    yapısındaki modeli derler; başka bir yapıda UnsupportedModelError verir.
+    """
+    layout, sparse, classifier = _compile_preprocessor(model)
+    if sparse:
+        raise UnsupportedModelError("Seyrek çıktılı ColumnTransformer churn modelinde desteklenmiyor")
+    if not isinstance(classifier, LGBMClassifier) or classifier.objective_ != 'binary':
+        raise UnsupportedModelError("Sınıflandırıcı ikili LGBMClassifier değil")
+
+    compiled = CompiledChurnModel(booster=classifier.booster_, **layout)
+    if compiled.n_features != classifier.booster_.num_feature():
+        raise UnsupportedModelError("Derlenen sütun sayısı modelle uyuşmuyor")
+    return compiled
+
+
+def compile_credit_model(model):
+    """
+    Pipeline(ColumnTransformer(StandardScaler, OneHotEncoder), XGBClassifier)
+    yapısındaki kredi modelini derler; başka bir yapıda UnsupportedModelError verir.
+    """
+    layout, sparse, classifier = _compile_preprocessor(model)
+    if not isinstance(classifier, XGBClassifier) or classifier.get_params()['objective'] != 'binary:logistic':
+        raise UnsupportedModelError("Sınıflandırıcı ikili (binary:logistic) XGBClassifier değil")
+    # Seyrek girdide saklanmayan sıfırlar NaN (eksik) olarak yazıldığından eksik değer NaN olmalı
+    if not np.isnan(classifier.missing):
+        raise UnsupportedModelError("missing=NaN olmayan XGBClassifier desteklenmiyor")
+    booster = classifier.get_booster()
+    # predict_proba ile aynı ağaç aralığı: erken durdurma varsa en iyi iterasyona kadar
+    try:
+        iteration_range = (0, classifier.best_iteration + 1)
+    except AttributeError:
+        iteration_range = (0, 0)
+
+    compiled = CompiledCreditModel(sparse=sparse, booster=booster, iteration_range=iteration_range, **layout)
+    if compiled.n_features != booster.num_features():
+        raise UnsupportedModelError("Derlenen sütun sayısı modelle uyuşmuyor")
+    return compiled
+
+
+def churn_scorer(model):
+    """Derlenmiş çıkarım yolu; model derlenemiyorsa pipeline'a dönen yedek."""
+    try:
+        return compile_churn_model(model)
+    except UnsupportedModelError:
+        return PipelineModel(model, getattr(model, 'feature_names_in_', []))
+
+
+def credit_scorer(model):
+    """Kredi modeli için derlenmiş çıkarım yolu; derlenemiyorsa pipeline'a dönen yedek."""
+    try:
+        return compile_credit_model(model)
+    except UnsupportedModelError:
+        return PipelineModel(model, getattr(model, 'feature_names_in_', []))
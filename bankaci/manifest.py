@@ -0,0 +1,105 @@
+"""
+Segmentasyon artefaktları için sürümlü manifest.
+
+Manifest, `kmeans_model.pkl` ve `scaler_model.pkl` ile aynı dizinde durur ve
+şunları saklar:
+
+- her artefaktın içerik hash'i (sha256),
+- KMeans/scaler'ın eğitildiği özellik listesi,
+- cluster -> segment adı haritası,
+- silüet skoru.
+
+Hash'ler tutuyorsa açılışta cluster haritası, tam veri dönüşümü ve silüet
+skoru yeniden hesaplanmaz; değerler doğrudan manifestten okunur.
+"""
+
+import hashlib
+import json
+import os
+
+from bankaci.atomic import atomic_path
+
+MANIFEST_FILENAME = 'segmentation_manifest.json'
+MANIFEST_FORMAT_VERSION = 1
+
+# Ham veri değiştiyse ya da özellik listesi farklıysa tam yeniden oluşturma gerekir;
+# diğer uyuşmazlıklarda sadece meta veriler yeniden hesaplanır
+FULL_REBUILD_KEYS = ('raw', 'features')
+
+
+def file_sha256(path, chunk_size=1 << 20):
+    """Dosyanın sha256 hash'ini döndürür; dosya yoksa None."""
+    if not os.path.exists(path):
+        return None
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def build_manifest(artifact_files, features, cluster_map, silhouette):
+    """
+    artifact_files: {'processed': yol, 'kmeans': yol, 'scaler': yol, 'raw': yol}
+    cluster_map: {cluster_id: segment_adı}
+    """
+    return {
+        'version': MANIFEST_FORMAT_VERSION,
+        'hashes': {name: file_sha256(path) for name, path in artifact_files.items()},
+        'features': list(features),
+        # JSON anahtarları string olmak zorunda; okunurken int'e geri çevrilir
+        'cluster_map': {str(int(k)): str(v) for k, v in cluster_map.items()},
+        'silhouette': float(silhouette),
+    }
+
+
+def write_manifest(path, artifact_files, features, cluster_map, silhouette):
+    manifest = build_manifest(artifact_files, features, cluster_map, silhouette)
+    with atomic_path(path) as tmp:
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(manifest, f, ensure_ascii=False, indent=2)
+    return manifest
+
+
+def load_manifest(path):
+    """Manifesti okur; yoksa, bozuksa veya sürümü farklıysa None döndürür."""
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if not isinstance(manifest, dict) or manifest.get('version') != MANIFEST_FORMAT_VERSION:
+        return None
+    return manifest
+
+
+def manifest_cluster_map(manifest):
+    return {int(k): v for k, v in manifest['cluster_map'].items()}
+
+
+def stale_entries(manifest, artifact_files, features):
+    """
+    Manifestle uyuşmayan girdilerin listesini döndürür (boş liste = her şey güncel).
+    Manifest yoksa sadece meta veriler eski sayılır (mevcut artefaktlar doğrulanıp
+    manifest yazılır). Ham veri dosyası diskte yoksa (sadece işlenmiş
+    artefaktlarla dağıtım) karşılaştırmaya katılmaz.
+    """
+    if manifest is None:
+        return ['manifest']
+
+    stale = []
+    hashes = manifest.get('hashes', {})
+    for name, path in artifact_files.items():
+        if name == 'raw' and not os.path.exists(path):
+            continue
+        if hashes.get(name) is None or hashes.get(name) != file_sha256(path):
+            stale.append(name)
+    if manifest.get('features') != list(features):
+        stale.append('features')
+    return stale
+
+
+def needs_full_rebuild(stale):
+    return any(key in stale for key in FULL_REBUILD_KEYS)
@@ -0,0 +1,551 @@
+"""
+Next Best Action (NBA) ve satış ihtimali motoru (toplu / vektörel).
+
+Segment bazlı ürün önerisi kuralları deklaratif bir karar tablosunda
+(nba_rules.json) durur; tablo yüklenirken koşullar vektörel maskelere
+derlenir. Kurallar ve satış ihtimali skoru tüm portföye dizi işlemleriyle
+uygulanır: segment isimleri bir kez (benzersiz değer başına) çözülür,
+kurallar np.select ile ilk eşleşme sırasıyla seçilir. Tek müşteri paneli de
+aynı motoru tek satırlık frame ile çağırır.
+
+Satış ihtimaline eklenen çeşitlilik (jitter) motordan ayrıdır. Varsayılan
+jitter (müşteri anahtarı, ürün, seed) üçlüsünden deterministik türetilir:
+aynı müşteri ve ürün için her çalıştırmada, her süreçte ve portföy hangi
+parçalara bölünürse bölünsün aynı değer çıkar; global RNG kullanılmaz.
+"""
+
+import json
+import operator
+import os
+import threading
+import zlib
+
+import numpy as np
+import pandas as pd
+
+# Segment bazlı base probability (ilk eşleşen segment adı kullanılır)
+SEGMENT_BASE_PROB = {
+    "💎 Elit / Servet Yönetimi": 80,
+    "🚀 Dinamik / Aktif Müşteri": 75,
+    "💰 Güvenli / Birikimci": 70,
+    "📊 Standart Bankacılık": 65,
+    "🌱 Temel Mevduat / Giriş": 60,
+    "⚠️ Riskli / Pasif Müşteri": 55,
+}
+DEFAULT_BASE_PROB = 50
+
+# Ham skor bu aralığa normalize edilir; jitter sonrası sonuç PROB_MIN-PROB_MAX arasında kalır
+NORMALIZED_MAX = 80
+PROB_MIN = 25
+PROB_MAX = 95
+# Çeşitlilik için eklenen değişimin aralığı (uç değerler dahil)
+JITTER_MIN = -5
+JITTER_MAX = 5
+# Deterministik jitter seed'i; değiştirmek tüm portföyün jitter'ını yeniden dağıtır
+JITTER_SEED = 0
+
+# Ürün önerisi kuralları (karar tablosu); kod değişikliği gerekmeden düzenlenebilir
+RULES_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'nba_rules.json')
+
+
+class DecisionTableError(ValueError):
+    """Karar tablosu dosyası okunamadığında veya geçersiz olduğunda fırlatılır."""
+
+
+# Koşul operatörleri (tablo dosyasındaki "op" alanı)
+OPERATORS = {
+    '==': operator.eq,
+    '!=': operator.ne,
+    '<': operator.lt,
+    '<=': operator.le,
+    '>': operator.gt,
+    '>=': operator.ge,
+}
+
+# Koşullarda kullanılabilen müşteri sütunları; yazım hatalı bir sütun varsayılan
+# değere düşüp kuralı sessizce değiştirmesin diye yüklemede reddedilir
+RULE_COLUMNS = frozenset({
+    'Age', 'Balance', 'CreditScore', 'EstimatedSalary', 'HasCrCard', 'Has_BES', 'Has_Kredi',
+    'Has_Vadesiz', 'Has_Yatirim', 'IsActiveMember', 'NumOfProducts', 'Spending_Score', 'Tenure',
+})
+
+
+def _compile_condition(clauses, rule_id):
+    """[{column, op, value, default}, ...] -> c(sütun, varsayılan) alan maske fonksiyonu (VE)."""
+    compiled = []
+    for clause in clauses:
+        try:
+            op = OPERATORS[clause['op']]
+            compiled.append((clause['column'], float(clause.get('default', 0)), op, float(clause['value'])))
+        except KeyError as e:
+            raise DecisionTableError(f"'{rule_id}' kuralında geçersiz koşul: {clause} ({e})") from e
+        except (TypeError, ValueError) as e:
+            raise DecisionTableError(f"'{rule_id}' kuralında sayısal olmayan değer: {clause}") from e
+        if clause['column'] not in RULE_COLUMNS:
+            raise DecisionTableError(f"'{rule_id}' kuralında bilinmeyen sütun: {clause['column']}")
+
+    def condition(c):
+        mask = None
+        for column, default, op, value in compiled:
+            clause_mask = op(c(column, default), value)
+            mask = clause_mask if mask is None else mask & clause_mask
+        return mask
+    return condition
+
+
+class DecisionTable:
+    """
+    Deklaratif NBA karar tablosu (bankaci/nba_rules.json).
+
+    Her segmentin kuralları sırayla denenir; koşulları (VE) sağlanan ilk kural
+    seçilir, son kural koşulsuzdur (varsayılan). Segment kuralları uygulanmayan
+    müşterilere "general" kuralları uygulanır. Koşullar yüklemede maske
+    fonksiyonlarına derlenir; her kuralın isabet sayısı süreç boyunca tutulur.
+    """
+
+    def __init__(self, data, source=None):
+        self.source = source
+        self.version = data.get('version')
+        try:
+            segment_sets = [(entry['segment'], entry['rules']) for entry in data['segments']]
+            general = data['general']
+        except (KeyError, TypeError) as e:
+            raise DecisionTableError(f"Karar tablosunda eksik alan: {e}") from e
+
+        # Kural kümeleri: segment kuralları (dosyadaki sırayla) + en sonda genel kurallar
+        self.segments = [segment for segment, _ in segment_sets]
+        self.rule_sets = []
+        self.rules = []
+        for segment, rules in segment_sets + [(None, general)]:
+            self.rule_sets.append(self._compile_rules(segment, rules))
+        self.general_rule_set = len(self.rule_sets) - 1
+        # Kural -> ait olduğu kural kümesi
+        self.rule_set_index = np.empty(len(self.rules), dtype=np.int16)
+        for rule_set, rule_range in enumerate(self.rule_sets):
+            self.rule_set_index[list(rule_range)] = rule_set
+
+        ids = [rule['id'] for rule in self.rules]
+        duplicates = sorted({rule_id for rule_id in ids if ids.count(rule_id) > 1})
+        if duplicates:
+            raise DecisionTableError(f"Tekrarlanan kural kimlikleri: {', '.join(duplicates)}")
+
+        self.hits = np.zeros(len(self.rules), dtype=np.int64)
+        self._hits_lock = threading.Lock()
+
+    def _compile_rules(self, segment, rules):
+        name = segment or 'general'
+        if not rules:
+            raise DecisionTableError(f"'{name}' için kural tanımlanmamış")
+        if rules[-1].get('when'):
+            raise DecisionTableError(f"'{name}' kümesinin son kuralı koşulsuz (varsayılan) olmalı")
+        first = len(self.rules)
+        for i, rule in enumerate(rules):
+            try:
+                rule_id = rule.get('id') or f"{name}#{i + 1}"
+                self.rules.append({
+                    'id': rule_id,
+                    'segment': segment,
+                    'product': rule['product'],
+                    'reason': rule['reason'],
+                    'script': rule['script'],
+                    'when': _compile_condition(rule['when'], rule_id) if rule.get('when') else None,
+                })
+            except KeyError as e:
+                raise DecisionTableError(f"'{name}' kümesindeki {i + 1}. kuralda eksik alan: {e}") from e
+        return range(first, len(self.rules))
+
+    def rule_set_for(self, segment):
+        """Segment adına uyan ilk segment kümesi (alt metin eşleşmesi); yoksa genel kurallar."""
+        return next((i for i, seg in enumerate(self.segments) if seg in segment), self.general_rule_set)
+
+    def choose(self, columns, row_rule_sets):
+        """Her satır için seçilen kuralın (self.rules) indeksini döndürür (ilk eşleşen kural)."""
+        actions = np.empty(columns.size, dtype=np.int16)
+        for rule_set, rule_range in enumerate(self.rule_sets):
+            index = np.flatnonzero(row_rule_sets == rule_set)
+            if not len(index):
+                continue
+            conditional = list(rule_range)[:-1]
+            if not conditional:
+                actions[index] = rule_range[-1]
+                continue
+            sub = columns.subset(index)
+            conditions = [self.rules[i]['when'](sub) for i in conditional]
+            actions[index] = np.select(conditions, np.array(conditional, dtype=np.int16),
+                                       default=rule_range[-1])
+        self.record_hits(actions)
+        return actions
+
+    def record_hits(self, actions):
+        counts = np.bincount(actions, minlength=len(self.rules))
+        with self._hits_lock:
+            self.hits += counts
+
+    def hit_report(self, rule_ids=None):
+        """
+        Kural başına isabet sayısı (tablodaki sırayla, hiç isabet almayan kurallar dahil).
+        rule_ids verilirse (ör. next_best_actions çıktısındaki 'Rule' sütunu) sadece
+        onların sayımı, verilmezse süreç başından beri toplam isabet raporlanır.
+        """
+        if rule_ids is None:
+            with self._hits_lock:
+                hits = self.hits.copy()
+        else:
+            counts = pd.Series(rule_ids).value_counts()
+            hits = np.array([int(counts.get(rule['id'], 0)) for rule in self.rules])
+        return pd.DataFrame({
+            'Kural': [rule['id'] for rule in self.rules],
+            'Segment': [rule['segment'] or 'Genel' for rule in self.rules],
+            'Ürün': [rule['product'] for rule in self.rules],
+            'İsabet': hits,
+        })
+
+    def column(self, field):
+        return [rule[field] for rule in self.rules]
+
+
+def load_decision_table(path=RULES_PATH):
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+    except ValueError as e:
+        raise DecisionTableError(f"Karar tablosu okunamadı ({os.path.basename(path)}): {e}") from e
+    return DecisionTable(data, source=path)
+
+
+_default_table = None
+_default_table_guard = threading.Lock()
+
+
+def default_decision_table():
+    """Paketle gelen karar tablosu (süreç başına bir kez yüklenir)."""
+    global _default_table
+    with _default_table_guard:
+        if _default_table is None:
+            _default_table = load_decision_table()
+        return _default_table
+
+
+def _py_min(a, b):
+    # Python min() ile aynı: eşitlik/NaN durumunda ilk argüman döner
+    return np.where(b < a, b, a)
+
+
+def _py_max(a, b):
+    return np.where(b > a, b, a)
+
+
+class _Columns:
+    """Müşteri sütunlarına float dizi olarak erişim; sütun yoksa varsayılan değer."""
+
+    def __init__(self, df, index=None, cache=None):
+        self.df = df
+        self.index = index
+        self._cache = {} if cache is None else cache
+        self.size = len(df) if index is None else len(index)
+
+    def __call__(self, name, default):
+        key = (name, default)
+        if key not in self._cache:
+            if name in self.df.columns:
+                self._cache[key] = self.df[name].to_numpy(dtype='float64', na_value=np.nan)
+            else:
+                self._cache[key] = np.full(len(self.df), default, dtype='float64')
+        values = self._cache[key]
+        return values if self.index is None else values[self.index]
+
+    def subset(self, index):
+        return _Columns(self.df, index, self._cache)
+
+
+def _segment_lookup(table, segment, known_segments):
+    """Tek bir segment adı için (kural kümesi, base probability)."""
+    if not isinstance(segment, str) or not segment:
+        return table.general_rule_set, DEFAULT_BASE_PROB
+    base_prob = next((prob for seg, prob in SEGMENT_BASE_PROB.items() if seg in segment), DEFAULT_BASE_PROB)
+    rule_set = table.general_rule_set
+    if segment in known_segments:
+        rule_set = table.rule_set_for(segment)
+    return rule_set, base_prob
+
+
+def _resolve_segments(table, segments, known_segments, n_rows):
+    """Satır başına kural kümesi ve base probability; her benzersiz segment bir kez çözülür."""
+    known_segments = set(known_segments)
+    codes, uniques = pd.factorize(pd.Series(segments, dtype=object).to_numpy(), use_na_sentinel=True)
+    lookups = [_segment_lookup(table, seg, known_segments) for seg in uniques]
+    # Son eleman: NaN/None segment (factorize kodu -1)
+    lookups.append((table.general_rule_set, DEFAULT_BASE_PROB))
+    rule_sets = np.array([rule_set for rule_set, _ in lookups], dtype=np.int16)
+    base_probs = np.array([prob for _, prob in lookups], dtype='float64')
+    if len(codes) != n_rows:
+        raise ValueError("Segment sayısı müşteri sayısıyla aynı olmalı")
+    return rule_sets[codes], base_probs[codes]
+
+
+def _product_flags(products):
+    return {
+        'Kredi Kartı': np.array(["Kredi Kartı" in p for p in products]),
+        'BES': np.array(["BES" in p for p in products]),
+        'Yatırım': np.array(["Yatırım" in p for p in products]),
+        'Kredi': np.array(["Kredi" in p for p in products]),
+    }
+
+
+def customer_score(columns, base_prob):
+    """
+    Satış ihtimalinin müşteriye bağlı (ürüne bağlı olmayan) kısmı: segment base
+    probability + bakiye, maaş, aktivite, ürün sayısı, yaş, kredi skoru ve müşteri süresi.
+    """
+    c = columns
+    balance = c('Balance', 0)
+    salary = c('EstimatedSalary', 0)
+    num_products = c('NumOfProducts', 1)
+    age = c('Age', 40)
+    credit_score = c('CreditScore', 650)
+
+    # Finansal güç (Balance) ve gelir (Salary) faktörleri
+    balance_factor = np.select([balance > 100000, balance > 50000, balance > 20000, balance > 10000],
+                               [12, 8, 5, 2], 0)
+    salary_factor = np.select([salary > 100000, salary > 60000, salary > 40000, salary > 25000],
+                              [10, 7, 4, 2], 0)
+    activity_factor = np.where(c('IsActiveMember', 0) == 1, 8, -5)
+    # Ürün portföyü faktörü (daha fazla ürün = daha sadık müşteri), max 10 puan
+    product_factor = _py_min(num_products * 3, 10)
+    # Yaş faktörü (25-55 yaş arası en aktif)
+    age_factor = np.select([(age >= 25) & (age <= 55),
+                            ((age >= 20) & (age < 25)) | ((age > 55) & (age <= 65)),
+                            age > 65],
+                           [5, 2, -3], 0)
+    credit_factor = np.select([credit_score >= 750, credit_score >= 700, credit_score >= 650, credit_score < 600],
+                              [6, 4, 2, -5], 0)
+    # Tenure faktörü (müşteri sadakati), max 8 puan
+    tenure_factor = _py_min(c('Tenure', 5) * 1.5, 8)
+
+    return (base_prob + balance_factor + salary_factor + activity_factor + product_factor
+            + age_factor + credit_factor + tenure_factor)
+
+
+def product_gap_factor(columns, product_flags, matrix=False):
+    """
+    Ürün eksikliği faktörü (hangi ürün eksikse ona göre artış).
+    product_flags satır başına (matrix=False) veya aday ürün başına (matrix=True,
+    sonuç müşteri x ürün) bayraklardır.
+    """
+    c = columns
+    owned = [c('HasCrCard', 0) == 0, c('Has_BES', 0) == 0, c('Has_Yatirim', 0) == 0, c('Has_Kredi', 0) == 0]
+    flags = [product_flags['Kredi Kartı'], product_flags['BES'], product_flags['Yatırım'], product_flags['Kredi']]
+    if matrix:
+        owned = [o[:, None] for o in owned]
+        flags = [f[None, :] for f in flags]
+    return np.select([f & o for f, o in zip(flags, owned)],
+                     [np.int8(8), np.int8(7), np.int8(6), np.int8(5)], np.int8(0))
+
+
+def finalize_probability(total_prob, jitter=0):
+    # Ham skoru 25-80 arasına normalize et, jitter sonrası 25-95 arasına sınırla
+    normalized_prob = _py_max(PROB_MIN, _py_min(NORMALIZED_MAX, total_prob))
+    final_prob = _py_max(PROB_MIN, _py_min(PROB_MAX, normalized_prob + jitter))
+    return np.round(final_prob).astype(np.int64)
+
+
+def sales_probability_scores(columns, base_prob, product_flags, jitter=0):
+    """
+    Satış ihtimali (25-95, tam sayı). Faktörler: segment base probability, bakiye,
+    maaş, aktivite, ürün sayısı, yaş, kredi skoru, müşteri süresi ve önerilen
+    ürünün müşteride eksik olması. jitter normalize edilmiş skora eklenir.
+    product_flags: _product_flags ile önerilen ürünler için satır başına bayraklar.
+    """
+    total_prob = customer_score(columns, base_prob) + product_gap_factor(columns, product_flags)
+    return finalize_probability(total_prob, jitter)
+
+
+def _mix64(x):
+    # splitmix64 sonlandırıcısı (uint64 taşmaları bilinçli olarak sarar)
+    with np.errstate(over='ignore'):
+        x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        return x ^ (x >> np.uint64(31))
+
+
+def _product_hash(product):
+    return zlib.crc32(product.encode('utf-8'))
+
+
+def _key_hashes(keys, seed):
+    # Tek satırlık frame'lerde User_ID object dtype gelebilir; toplu hesapla aynı hash için tipi çöz
+    keys = pd.Series(np.asarray(keys)).infer_objects().to_numpy()
+    seed_hash = _mix64(np.array([seed], dtype=np.uint64))[0]
+    return _mix64(pd.util.hash_array(keys) ^ seed_hash)
+
+
+def _jitter_from_hashes(key_hashes, product_hashes):
+    # Diziler yayınlanabilir (broadcast): müşteri x ürün matrisi için [:, None] ve [None, :]
+    h = _mix64(key_hashes ^ product_hashes)
+    span = np.uint64(JITTER_MAX - JITTER_MIN + 1)
+    return JITTER_MIN + (h % span).astype(np.int64)
+
+
+def _hashed_jitter(keys, product_hashes, seed):
+    return _jitter_from_hashes(_key_hashes(keys, seed), product_hashes)
+
+
+def deterministic_jitter(keys, products, seed=JITTER_SEED):
+    """
+    (müşteri anahtarı, ürün, seed) üçlüsünden JITTER_MIN..JITTER_MAX arası jitter.
+    keys: satır başına müşteri anahtarı (ör. User_ID); products: satır başına ürün adı.
+    """
+    codes, uniques = pd.factorize(np.asarray(products, dtype=object))
+    product_hashes = np.array([_product_hash(p) for p in uniques], dtype=np.uint64)[codes]
+    return _hashed_jitter(keys, product_hashes, seed)
+
+
+def _categorical(values, actions):
+    categories = list(dict.fromkeys(values))
+    codes = np.array([categories.index(v) for v in values], dtype=np.int16)
+    return pd.Categorical.from_codes(codes[actions], categories=categories)
+
+
+def next_best_actions(df, segments, known_segments=(), jitter=None, keys=None, seed=JITTER_SEED, table=None):
+    """
+    Her müşteri için önerilen ürün (Product), satış ihtimali (Prob), neden
+    (Reason), satış scripti (Script) ve seçilen kural (Rule); df ile aynı
+    index'e sahip DataFrame.
+
+    segments: satır başına segment adı (None: segment yok, genel kurallar).
+    known_segments: segment kurallarının uygulandığı segment isimleri (cluster haritası).
+    jitter: satış ihtimaline eklenen değişim (skaler veya satır başına dizi). None ise
+        (keys, önerilen ürün, seed) üçlüsünden deterministik türetilir.
+    keys: satır başına müşteri anahtarı; verilmezse User_ID sütunu, o da yoksa index.
+    table: karar tablosu (DecisionTable); verilmezse paketle gelen tablo kullanılır.
+    """
+    if table is None:
+        table = default_decision_table()
+    columns = _Columns(df)
+    row_rule_sets, base_prob = _resolve_segments(table, segments, known_segments, len(df))
+    actions = table.choose(columns, row_rule_sets)
+    products = table.column('product')
+    flags = {name: values[actions] for name, values in _product_flags(products).items()}
+    if jitter is None:
+        if keys is None:
+            keys = df['User_ID'].to_numpy() if 'User_ID' in df.columns else df.index.to_numpy()
+        product_hashes = np.array([_product_hash(p) for p in products], dtype=np.uint64)
+        jitter = _hashed_jitter(keys, product_hashes[actions], seed)
+    return pd.DataFrame({
+        'Product': _categorical(products, actions),
+        'Prob': sales_probability_scores(columns, base_prob, flags, jitter),
+        'Reason': _categorical(table.column('reason'), actions),
+        'Script': _categorical(table.column('script'), actions),
+        'Rule': _categorical(table.column('id'), actions),
+    }, index=df.index)
+
+
+def next_best_action(record, segment_name=None, known_segments=(), key=None, seed=JITTER_SEED, table=None):
+    """
+    Tek müşteri önerisi (dict): next_best_actions ile aynı motor ve aynı jitter.
+    key verilmezse record['User_ID'] kullanılır; anahtar yoksa ValueError verilir
+    (tek satırlık frame'in index'i her müşteride 0 olduğundan jitter aynı kalırdı).
+    """
+    if key is None:
+        if record.get('User_ID') is None:
+            raise ValueError("Tek müşteri önerisi için müşteri anahtarı (User_ID) gerekli")
+        key = record['User_ID']
+    rec = next_best_actions(pd.DataFrame([record]), [segment_name], known_segments, keys=[key],
+                            seed=seed, table=table).iloc[0]
+    return {"Product": rec['Product'], "Prob": int(rec['Prob']), "Reason": rec['Reason'],
+            "Script": rec['Script'], "Rule": rec['Rule']}
+
+
+def offer_matrix(df, segments, known_segments=(), keys=None, seed=JITTER_SEED, table=None):
+    """
+    Müşteri x aday teklif satış ihtimali matrisi. Sütunlar karar tablosundaki
+    kurallardır (table.rules sırasıyla). Bir teklif, müşterinin kural kümesine
+    aitse ve koşulları sağlanıyorsa uygundur (koşulsuz varsayılan kural her zaman
+    uygundur). Dönüş: (olasılıklar [n x k, int], uygunluk [n x k, bool]).
+
+    Olasılık, tek öneriyle aynı faktörlerden (ürün eksikliği dahil) ve aynı
+    (müşteri, ürün, seed) jitter'ından hesaplanır: NBA'nın seçtiği teklifin
+    matristeki değeri next_best_actions çıktısındaki Prob ile aynıdır.
+    """
+    if table is None:
+        table = default_decision_table()
+    columns = _Columns(df)
+    row_rule_sets, base_prob = _resolve_segments(table, segments, known_segments, len(df))
+
+    eligible = row_rule_sets[:, None] == table.rule_set_index[None, :]
+    for i, rule in enumerate(table.rules):
+        if rule['when'] is not None:
+            eligible[:, i] &= rule['when'](columns)
+
+    products = table.column('product')
+    flags = _product_flags(products)
+    total_prob = customer_score(columns, base_prob)[:, None] + product_gap_factor(columns, flags, matrix=True)
+    if keys is None:
+        keys = df['User_ID'].to_numpy() if 'User_ID' in df.columns else df.index.to_numpy()
+    product_hashes = np.array([_product_hash(p) for p in products], dtype=np.uint64)
+    jitter = _jitter_from_hashes(_key_hashes(keys, seed)[:, None], product_hashes[None, :])
+    return finalize_probability(total_prob, jitter), eligible
+
+
+def _top_k(probs, eligible, k):
+    """
+    Her satırda en iyi k uygun teklif; (indeksler, geçerli). İlk sırada NBA önerisi
+    (satırın ilk uygun kuralı), ardından diğerleri olasılığa göre (eşitlikte tablodaki sıra).
+    """
+    n_offers = probs.shape[1]
+    k = min(k, n_offers)
+    # Tek bir tam sayı skoru: önce olasılık, eşitlikte tablodaki önceki kural; uygun değilse -1
+    score = np.where(eligible, probs * n_offers + (n_offers - 1 - np.arange(n_offers)), -1)
+    # Uygunluk satırın kendi kural kümesiyle sınırlı ve kurallar sıralı olduğundan ilk uygun
+    # sütun next_best_actions'ın seçtiği kuraldır (varsayılan kural hep uygun); en üste alınır
+    if len(score):
+        score[np.arange(len(score)), eligible.argmax(axis=1)] = (int(probs.max()) + 1) * n_offers
+    # Kısmi sıralama: sadece en iyi k aday seçilir, sonra kendi aralarında sıralanır
+    top = np.argpartition(-score, k - 1, axis=1)[:, :k]
+    top_scores = np.take_along_axis(score, top, axis=1)
+    order = np.argsort(-top_scores, axis=1, kind='stable')
+    top = np.take_along_axis(top, order, axis=1)
+    return top, np.take_along_axis(top_scores, order, axis=1) >= 0
+
+
+def ranked_offers(df, segments, known_segments=(), k=3, keys=None, seed=JITTER_SEED, table=None,
+                  chunk_size=200000):
+    """
+    Müşteri başına k uygun teklif (uzun format). Rank 1 NBA önerisidir
+    (next_best_actions ile aynı ürün ve Prob); sonraki sıralar kalan uygun teklifler
+    arasında satış ihtimaline göredir. Dönüş sütunları: Rank (1..k), Product, Prob,
+    Reason, Script, Rule; index her müşteri için df.index değeri tekrarlanır. k teklif
+    sayısından büyükse teklif sayısına indirilir; uygun teklif sayısı k'dan az olan
+    müşteriler daha az satır alır. Bellek chunk_size satırlık parçalarla sınırlanır.
+    """
+    if k < 1:
+        raise ValueError(f"Müşteri başına teklif sayısı (k) en az 1 olmalı: {k}")
+    if table is None:
+        table = default_decision_table()
+    segments = pd.Series(segments, dtype=object).to_numpy()
+    if keys is None:
+        keys = df['User_ID'].to_numpy() if 'User_ID' in df.columns else df.index.to_numpy()
+    keys = np.asarray(keys)
+
+    rows, offers, probs_out, ranks = [], [], [], []
+    for start in range(0, len(df), chunk_size):
+        stop = min(start + chunk_size, len(df))
+        probs, eligible = offer_matrix(df.iloc[start:stop], segments[start:stop], known_segments,
+                                       keys=keys[start:stop], seed=seed, table=table)
+        top, valid = _top_k(probs, eligible, k)
+        row_idx, rank_idx = np.nonzero(valid)
+        rows.append(start + row_idx)
+        offers.append(top[row_idx, rank_idx])
+        probs_out.append(probs[row_idx, top[row_idx, rank_idx]])
+        ranks.append(rank_idx + 1)
+
+    rows = np.concatenate(rows) if rows else np.empty(0, dtype=np.int64)
+    offers = np.concatenate(offers).astype(np.int16) if offers else np.empty(0, dtype=np.int16)
+    return pd.DataFrame({
+        'Rank': np.concatenate(ranks) if ranks else np.empty(0, dtype=np.int64),
+        'Product': _categorical(table.column('product'), offers),
+        'Prob': np.concatenate(probs_out) if probs_out else np.empty(0, dtype=np.int64),
+        'Reason': _categorical(table.column('reason'), offers),
+        'Script': _categorical(table.column('script'), offers),
+        'Rule': _categorical(table.column('id'), offers),
+    }, index=df.index[rows])
@@ -0,0 +1,142 @@
+"""
+Çok süreçli (multi-process) portföy skorlama.
+
+Portföy parçalara (shard) bölünür; her parça bir süreç havuzunda churn
+olasılığı (derlenmiş churn modeli), aksiyon stratejisi ve NBA önerisi ile
+skorlanır, sonuçlar girdi sırasıyla birleştirilir. Her işçi süreç churn
+modelini ve karar tablosunu başlangıçta bir kez yükler.
+
+İşçi başına thread bütçesi (threads_per_worker) LightGBM'e ve threadpoolctl ile
+BLAS/OpenMP havuzlarına uygulanır; böylece işçi sayısı x thread sayısı çekirdek
+sayısını aşmaz (oversubscription olmaz). NBA jitter'ı müşteri anahtarından
+türetildiğinden sonuç parça sayısından bağımsızdır.
+"""
+
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import joblib
+import numpy as np
+import pandas as pd
+from threadpoolctl import threadpool_limits
+
+from bankaci.inference import churn_scorer
+from bankaci.nba import RULES_PATH, load_decision_table, next_best_actions
+from bankaci.segmentation import SEGMENT_TEMPLATES
+from bankaci.strategy import STRATEGIES, portfolio_strategy_codes
+
+# İşçi başına en az bu kadar satır (küçük parçalarda süreç iletişimi skorlamadan pahalı)
+MIN_SHARD_ROWS = 20000
+# Yük dengesi için işçi başına parça sayısı
+SHARDS_PER_WORKER = 4
+
+# İşçi sürecin durumu (_init_worker ile bir kez kurulur)
+_worker = None
+
+
+class _ScoringState:
+    """Bir süreçteki skorlama kaynakları: derlenmiş model, karar tablosu, ayarlar."""
+
+    def __init__(self, model_path, rules_path, known_segments, threads):
+        self.scorer = churn_scorer(joblib.load(model_path))
+        self.table = load_decision_table(rules_path)
+        self.known_segments = list(known_segments)
+        self.threads = threads
+
+
+def _init_worker(model_path, rules_path, known_segments, threads):
+    global _worker
+    # BLAS/OpenMP havuzları süreç ömrü boyunca işçi bütçesiyle sınırlı kalır
+    _worker = (_ScoringState(model_path, rules_path, known_segments, threads), threadpool_limits(threads))
+
+
+def _score_in_worker(shard):
+    return score_shard(_worker[0], shard)
+
+
+def score_shard(state, shard):
+    """Tek parçanın skorları (shard ile aynı index)."""
+    probs = np.asarray(state.scorer.predict(shard, num_threads=state.threads), dtype='float64')
+    out = pd.DataFrame({'Risk_Probability': probs}, index=shard.index)
+    out['Strategy'] = pd.Categorical.from_codes(portfolio_strategy_codes(shard, probs), categories=STRATEGIES)
+    if 'Segment_Name' in shard.columns:
+        actions = next_best_actions(shard, shard['Segment_Name'], state.known_segments, table=state.table)
+        out['NBA_Product'] = actions['Product']
+        out['NBA_Prob'] = actions['Prob']
+        out['NBA_Rule'] = actions['Rule']
+    return out
+
+
+def default_workers():
+    return os.cpu_count() or 1
+
+
+def split_shards(n_rows, workers, shard_size=None):
+    """[başlangıç, bitiş) satır aralıkları; shard_size verilmezse işçi başına SHARDS_PER_WORKER parça."""
+    if shard_size is None:
+        shard_size = max(MIN_SHARD_ROWS, -(-n_rows // (workers * SHARDS_PER_WORKER)))
+    return [(start, min(start + shard_size, n_rows)) for start in range(0, n_rows, shard_size)]
+
+
+class ParallelPortfolioScorer:
+    """
+    Kalıcı işçi havuzu ile portföy skorlayıcı. İşçiler (ve modelleri) bir kez
+    başlatılır, birden çok score() çağrısında yeniden kullanılır:
+
+        with ParallelPortfolioScorer('churn_model_v1.pkl', workers=4) as scorer:
+            scores = scorer.score(df_churn)
+
+    workers: işçi süreç sayısı (varsayılan: çekirdek sayısı); 1 ise havuz kurulmaz,
+        skorlama çağıran süreçte yapılır.
+    threads_per_worker: işçi başına thread bütçesi (varsayılan: çekirdek / işçi, en az 1).
+    """
+
+    def __init__(self, model_path, workers=None, threads_per_worker=None,
+                 known_segments=SEGMENT_TEMPLATES, rules_path=RULES_PATH):
+        self.workers = max(1, workers or default_workers())
+        self.threads_per_worker = threads_per_worker or max(1, default_workers() // self.workers)
+        self._init_args = (model_path, rules_path, list(known_segments), self.threads_per_worker)
+        self._pool = None
+        self._state = None
+
+    def __enter__(self):
+        if self.workers == 1:
+            self._state = _ScoringState(*self._init_args)
+        else:
+            # spawn: ebeveyndeki thread'ler (kayıt defteri, OpenMP) fork ile kopyalanıp kilitlenmesin
+            self._pool = ProcessPoolExecutor(max_workers=self.workers,
+                                             mp_context=multiprocessing.get_context('spawn'),
+                                             initializer=_init_worker, initargs=self._init_args)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def score(self, df, shard_size=None):
+        """
+        df_churn biçimindeki portföyün skorları: df ile aynı index ve sırada
+        Risk_Probability, Strategy ve (Segment_Name varsa) NBA_Product, NBA_Prob, NBA_Rule.
+        """
+        shards = [df.iloc[start:stop] for start, stop in split_shards(len(df), self.workers, shard_size)]
+        if self._pool is None:
+            if self._state is None:
+                raise RuntimeError("Skorlayıcı 'with' bloğu içinde kullanılmalı")
+            with threadpool_limits(self.threads_per_worker):
+                results = [score_shard(self._state, shard) for shard in shards or [df]]
+        else:
+            # map sonuçları girdi sırasıyla döndürür
+            results = list(self._pool.map(_score_in_worker, shards or [df]))
+        return pd.concat(results)
+
+
+def score_portfolio_parallel(df, model_path, workers=None, threads_per_worker=None, shard_size=None,
+                             known_segments=SEGMENT_TEMPLATES, rules_path=RULES_PATH):
+    """Portföyü tek seferlik bir işçi havuzunda skorlar (bkz. ParallelPortfolioScorer)."""
+    with ParallelPortfolioScorer(model_path, workers, threads_per_worker, known_segments, rules_path) as scorer:
+        return scorer.score(df, shard_size)
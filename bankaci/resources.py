@@ -0,0 +1,265 @@
+"""
+Sayfa bazlı, tembel (lazy) kaynak yükleme kaydı.
+
+Her artefakt (model, veri seti) bir isimle kaydedilir; ilk kullanıldığında
+yüklenir ve ayrı ayrı önbelleğe alınır. Sayfalar yalnızca ihtiyaç duydukları
+artefaktları ister, böylece örneğin kredi sayfası churn/KMeans yeniden
+oluşturma maliyetini hiç ödemez.
+
+Yenileme "stale-while-revalidate" ile yapılır: artefakt dosyası değiştiğinde
+eski değer servis edilmeye devam eder, tek bir arka plan thread'i yeni değeri
+(ve ona bağlı artefaktları) yükler, ardından değerler tek seferde değiştirilir.
+"""
+
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+class MissingArtifactError(FileNotFoundError):
+    """Bir artefakt dosyası proje dizininde bulunamadığında fırlatılır."""
+
+    def __init__(self, filename, description):
+        super().__init__(f"{description} ({filename})")
+        self.filename = filename
+        self.description = description
+
+    def __str__(self):
+        # OSError, filename atanınca "[Errno None] ..." biçimine geçer; mesajı sabit tut
+        return f"{self.description} ({self.filename})"
+
+
+def require_file(path, description):
+    """Dosya yoksa MissingArtifactError fırlatır, varsa yolu döndürür."""
+    if not os.path.exists(path):
+        raise MissingArtifactError(os.path.basename(path), description)
+    return path
+
+
+def file_fingerprint(path):
+    """Dosyanın (mtime_ns, boyut) parmak izi; dosya yoksa None."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+class ResourceRegistry:
+    """
+    İsimle kaydedilen artefakt yükleyicileri için süreç genelinde önbellek.
+
+    - Her artefakt ilk get() çağrısında yüklenir (lazy).
+    - Aynı artefaktı aynı anda isteyen oturumlar tek bir yüklemeyi bekler.
+    - Hata veren yüklemeler önbelleğe alınmaz; bir sonraki istekte tekrar denenir.
+    - files ile kaydedilen artefaktlar, dosyalardan biri değişince (mtime/boyut)
+      arka planda yenilenir; yenileme bitene kadar eski değer servis edilir.
+      deps ile bağlı artefaktlar (ör. skorlar -> model) aynı yenilemede yeniden
+      yüklenir ve hepsi birlikte değiştirilir. Bağımlılıklar önce kaydedilmelidir.
+    - max_age (sn) verilirse dosya değişmese de bu süreden eski değer yenilenir.
+    - Başarısız bir yenilemeden sonra artefakt, dosyaları yeniden değişene (veya
+      max_age tekrar dolana) kadar yeniden denenmez; bozuk bir dosya her kontrolde
+      arka planda tekrar tekrar yüklenmez.
+
+    check_interval: dosya parmak izlerinin en sık kontrol edilme aralığı (sn).
+    """
+
+    def __init__(self, check_interval=2.0):
+        self.check_interval = check_interval
+        self._loaders = {}
+        self._files = {}
+        self._deps = {}
+        self._max_age = {}
+        # Yüklü değerler: her değişiklikte yeni sözlük atanır (okuyucular kilitsiz okur)
+        self._values = {}
+        self._stamps = {}
+        # Başarısız yenilemenin damgası (zaman, parmak izleri): aynı dosyalarla tekrar denenmez
+        self._failed = {}
+        self._locks = {}
+        self._guard = threading.Lock()
+        self._last_check = time.monotonic()
+        self._check_lock = threading.Lock()
+        self._refresh_thread = None
+        # Yenileme thread'inde henüz değiştirilmemiş (hazırlanan) değerler
+        self._local = threading.local()
+        self.refresh_count = 0
+        self.last_refresh_error = None
+
+    def register(self, name, loader, files=(), deps=(), max_age=None):
+        with self._guard:
+            self._loaders[name] = loader
+            self._files[name] = tuple(files)
+            self._deps[name] = tuple(deps)
+            self._max_age[name] = max_age
+            self._locks[name] = threading.Lock()
+            self._values = {k: v for k, v in self._values.items() if k != name}
+            self._stamps.pop(name, None)
+            self._failed.pop(name, None)
+
+    def names(self):
+        return list(self._loaders)
+
+    def is_loaded(self, name):
+        return name in self._values
+
+    def get(self, name):
+        staged = getattr(self._local, 'staged', None)
+        if staged is not None and name in staged:
+            return staged[name]
+        values = self._values
+        if name in values:
+            self._maybe_check()
+            return values[name]
+        if name not in self._loaders:
+            raise KeyError(f"Kayıtlı olmayan kaynak: {name}")
+        with self._locks[name]:
+            # Kilidi beklerken başka bir oturum yüklemiş olabilir
+            if name not in self._values:
+                stamp = self._stamp(name)
+                value = self._loaders[name]()
+                with self._guard:
+                    self._values = {**self._values, name: value}
+                    self._stamps[name] = stamp
+            return self._values[name]
+
+    def get_many(self, names, max_workers=None, initializer=None):
+        """
+        İstenen artefaktları thread havuzunda paralel yükler; (değerler, hatalar)
+        sözlük çifti döndürür. Toplam süre artefaktların toplamı değil, en yavaşı
+        kadardır (yükleme çoğunlukla dosya I/O ve açma işi). Birbirine bağlı
+        artefaktlar (ör. skorlar -> model + veri) isim kilitleri sayesinde tek kez yüklenir.
+
+        initializer: her işçi thread'inde bir kez çağrılır (ör. Streamlit bağlamını eklemek için).
+        """
+        names = list(names)
+        # Yüklü değerler aynı sürümden okunur (yenileme arada değer değiştirse bile)
+        current = self._values
+        if names and all(name in current for name in names):
+            self._maybe_check()
+            return {name: current[name] for name in names}, {}
+        pending = [name for name in names if name not in current]
+        if len(pending) <= 1:
+            return self._get_serial(names)
+
+        values, errors = {}, {}
+        with ThreadPoolExecutor(max_workers=max_workers or len(pending),
+                                thread_name_prefix='resource-loader',
+                                initializer=initializer) as pool:
+            futures = {name: pool.submit(self.get, name) for name in names}
+            for name, future in futures.items():
+                try:
+                    values[name] = future.result()
+                except Exception as e:
+                    errors[name] = e
+        return values, errors
+
+    def _get_serial(self, names):
+        values, errors = {}, {}
+        for name in names:
+            try:
+                values[name] = self.get(name)
+            except Exception as e:
+                errors[name] = e
+        return values, errors
+
+    def invalidate(self, name=None):
+        """Tek bir artefaktı veya (name=None ise) tüm önbelleği boşaltır."""
+        with self._guard:
+            if name is None:
+                self._values = {}
+                self._stamps.clear()
+                self._failed.clear()
+            else:
+                self._values = {k: v for k, v in self._values.items() if k != name}
+                self._stamps.pop(name, None)
+                self._failed.pop(name, None)
+
+    # --- Stale-while-revalidate ---
+
+    def _stamp(self, name):
+        return time.monotonic(), tuple(file_fingerprint(path) for path in self._files[name])
+
+    def _is_stale(self, name):
+        loaded_at, fingerprints = self._stamps[name]
+        max_age = self._max_age[name]
+        current = tuple(file_fingerprint(path) for path in self._files[name])
+        failed = self._failed.get(name)
+        if failed is not None:
+            failed_at, failed_fingerprints = failed
+            # Son yenileme bu dosyalarla başarısız oldu: dosyalar değişene veya max_age dolana kadar bekle
+            if current == failed_fingerprints and (max_age is None or time.monotonic() - failed_at < max_age):
+                return False
+        if max_age is not None and time.monotonic() - loaded_at >= max_age:
+            return True
+        return fingerprints != current
+
+    def _with_dependents(self, names):
+        """Değişen artefaktlara yüklü bağımlılarını ekler (kayıt sırasında)."""
+        names = set(names)
+        changed = True
+        while changed:
+            changed = False
+            for name in self._values:
+                if name not in names and names.intersection(self._deps[name]):
+                    names.add(name)
+                    changed = True
+        return [name for name in self._loaders if name in names]
+
+    def _maybe_check(self):
+        if time.monotonic() - self._last_check >= self.check_interval:
+            self.check_for_changes()
+
+    def check_for_changes(self):
+        """
+        Yüklü artefaktların dosyalarını kontrol eder; değişen varsa tek bir arka plan
+        yenilemesi başlatır. Yenilenecek isimleri döndürür (yenileme zaten sürüyorsa boş).
+        """
+        # Aynı anda gelen oturumlardan sadece biri kontrol eder, diğerleri beklemez
+        if not self._check_lock.acquire(blocking=False):
+            return []
+        try:
+            self._last_check = time.monotonic()
+            if self._refresh_thread is not None and self._refresh_thread.is_alive():
+                return []
+            stale = [name for name in list(self._values) if name in self._stamps and self._is_stale(name)]
+            if not stale:
+                return []
+            names = self._with_dependents(stale)
+            self._refresh_thread = threading.Thread(target=self._refresh, args=(names,),
+                                                    name='resource-refresh', daemon=True)
+            self._refresh_thread.start()
+            return names
+        finally:
+            self._check_lock.release()
+
+    def wait_for_refresh(self, timeout=None):
+        thread = self._refresh_thread
+        if thread is not None:
+            thread.join(timeout)
+
+    def _refresh(self, names):
+        # Yeni değerler önce bu thread'e özel hazırlanır; bağımlı yükleyiciler
+        # get() ile hazırlanan yeni değerleri görür, diğer oturumlar eskisini
+        staged, stamps = {}, {}
+        self._local.staged = staged
+        try:
+            for name in names:
+                stamps[name] = self._stamp(name)
+                staged[name] = self._loaders[name]()
+        except Exception as e:
+            # Eski değerler servis edilmeye devam eder; dosyalar tekrar değişince yeniden denenir
+            with self._guard:
+                for name in names:
+                    self._failed[name] = stamps[name] if name in stamps else self._stamp(name)
+            self.last_refresh_error = e
+            return
+        finally:
+            self._local.staged = None
+        with self._guard:
+            self._values = {**self._values, **staged}
+            self._stamps.update(stamps)
+            for name in names:
+                self._failed.pop(name, None)
+        self.refresh_count += 1
+        self.last_refresh_error = None
@@ -0,0 +1,171 @@
+"""
+Churn portföyü için kalıcı risk skorları.
+
+`churn_model.predict_proba` tüm portföy üzerinde bir kez çalıştırılır ve sonuç
+(model hash'i, veri hash'i) çifti ile birlikte işlenmiş veri setinin yanına
+yazılır. Yeniden başlatmada hash'ler tutuyorsa skorlar diskten okunur; model
+veya veri değiştiyse otomatik olarak yeniden hesaplanır.
+"""
+
+import json
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from bankaci.atomic import atomic_path
+from bankaci.manifest import file_sha256
+
+SCORES_FILENAME = 'churn_scores.parquet'
+SCORES_FORMAT_VERSION = 1
+SCORES_METADATA_KEY = b'bankaci.scores'
+
+# Churn modeline girmeyen (segmentasyon/NBA) sütunlar
+NON_FEATURE_COLUMNS = ['User_ID', 'Has_Vadesiz', 'Has_BES', 'Has_Kredi', 'Has_Yatirim', 'Spending_Score',
+                       'Cluster_Label', 'Segment_Name']
+
+
+# Türetilmiş özellikler (tekil müşteri formuyla aynı kurallar)
+AGE_GROUPS = ['Young', 'Adult', 'Middle', 'Senior']
+# Eğitimdeki pd.cut aralıkları: (0, 30], (30, 45], (45, 60], (60, 100]
+AGE_GROUP_BINS = [0, 30, 45, 60, 100]
+# Akış halinde skorlamada portföy ortalaması bilinmez; formdaki sabit eşik kullanılır
+HIGH_VALUE_BALANCE = 70000
+
+
+def add_engineered_features(df):
+    """
+    Ham müşteri kayıtlarına modelin türetilmiş özelliklerini ekler:
+    Balance_per_Product, Age_Group, Credit_Score_Age_Ratio, Is_High_Value_Active.
+    Her satır sadece kendi değerlerine bağlıdır (parça parça skorlamada sonuç aynı).
+    """
+    return df.assign(
+        Balance_per_Product=df['Balance'] / (df['NumOfProducts'] + 0.1),
+        # Eğitimle aynı: aralık dışındaki (<= 0, > 100) ve eksik yaşta yaş grubu eksik kalır
+        Age_Group=pd.cut(df['Age'], bins=AGE_GROUP_BINS, labels=AGE_GROUPS),
+        Credit_Score_Age_Ratio=df['CreditScore'] / (df['Age'] + 1),
+        Is_High_Value_Active=((df['IsActiveMember'] == 1) & (df['Balance'] > HIGH_VALUE_BALANCE)).astype('int8'),
+    )
+
+
+def churn_features(df):
+    return df.drop(columns=NON_FEATURE_COLUMNS, errors='ignore')
+
+
+def score_portfolio(model, df):
+    """Tüm portföy için churn olasılıkları (Risk_Probability)."""
+    return model.predict_proba(churn_features(df))[:, 1]
+
+
+def scored_portfolio(df, scores):
+    """
+    Risk_Probability ve Risk_Percent sütunlarıyla skorlu portföy.
+    Süreç genelinde tek kopya olarak paylaşılır; çağıranlar bu frame'i değiştirmemeli.
+    """
+    scored = df.assign(Risk_Probability=np.asarray(scores, dtype='float64'))
+    scored['Risk_Percent'] = scored['Risk_Probability'] * 100
+    return scored
+
+
+def read_scores(path, model_hash, data_hash, rows):
+    """Kayıtlı skorları okur; dosya yoksa veya anahtar uyuşmuyorsa None döndürür."""
+    try:
+        table = pq.read_table(path)
+    except (OSError, pa.ArrowException):
+        return None
+    raw = (table.schema.metadata or {}).get(SCORES_METADATA_KEY)
+    if raw is None:
+        return None
+    stored = json.loads(raw.decode('utf-8'))
+    if (stored.get('version') != SCORES_FORMAT_VERSION or stored.get('model_hash') != model_hash
+            or stored.get('data_hash') != data_hash or table.num_rows != rows):
+        return None
+    return table.column('Risk_Probability').to_numpy()
+
+
+def write_scores(path, scores, model_hash, data_hash):
+    table = pa.table({'Risk_Probability': np.asarray(scores, dtype='float64')})
+    stored = {'version': SCORES_FORMAT_VERSION, 'model_hash': model_hash, 'data_hash': data_hash}
+    table = table.replace_schema_metadata({SCORES_METADATA_KEY: json.dumps(stored).encode('utf-8')})
+    with atomic_path(path) as tmp:
+        pq.write_table(table, tmp)
+
+
+def load_or_score(model, df, model_path, data_path, scores_path):
+    """
+    (model dosyası hash'i, işlenmiş veri hash'i) anahtarıyla skorları diskten okur;
+    anahtar uyuşmuyorsa portföyü yeniden skorlar ve diske yazar.
+    Dönüş: (skorlar, diskten_mi)
+    """
+    model_hash = file_sha256(model_path)
+    data_hash = file_sha256(data_path)
+    scores = read_scores(scores_path, model_hash, data_hash, len(df))
+    if scores is not None:
+        return scores, True
+
+    scores = score_portfolio(model, df)
+    # Hash'ler hesaplanamıyorsa (dosya yok) skorlar sadece bellekte kalır
+    if model_hash is not None and data_hash is not None:
+        write_scores(scores_path, scores, model_hash, data_hash)
+    return scores, False
+
+
+class RiskRanking:
+    """
+    Portföyün azalan risk sıralaması. Skorlar (model/veri sürümü) değişince bir
+    kez kurulur; top-N listesi her yeniden çalıştırmada sıralama yerine dizi
+    dilimiyle bulunur.
+    """
+
+    def __init__(self, scores, strategy_codes=None):
+        self.scores = np.asarray(scores, dtype='float64')
+        # Eşit skorlarda portföy sırası korunur (kararlı sıralama); NaN skorlar en sonda
+        self.order = np.argsort(-self.scores, kind='stable')
+        # Müşteri başına strateji kodu (bankaci.strategy.STRATEGIES sırası)
+        self.strategy_codes = strategy_codes
+
+    def __len__(self):
+        return len(self.order)
+
+    def top(self, n):
+        """En riskli n müşterinin portföydeki konumları (azalan risk)."""
+        return self.order[:max(n, 0)]
+
+
+class RiskBandIndex:
+    """
+    Risk yüzdesi (Risk_Percent) aralıklarından rastgele müşteri seçimi için indeks.
+    Skorlu portföy başına bir kez kurulur: sıralı risk değerleri + satır konumları.
+    Bir aralıktan seçim iki ikili arama ve tek rastgele tamsayıdır (O(log n)).
+    """
+
+    def __init__(self, risk_percent):
+        risk_percent = np.asarray(risk_percent, dtype='float64')
+        # NaN risk hiçbir aralığa girmez
+        positions = np.flatnonzero(~np.isnan(risk_percent))
+        order = np.argsort(risk_percent[positions], kind='stable')
+        self.positions = positions[order]
+        self.values = risk_percent[self.positions]
+
+    def __len__(self):
+        return len(self.positions)
+
+    def band(self, low, high):
+        """[low, high] (iki uç dahil) aralığındaki müşterilerin sıralı dizideki başlangıç/bitiş sınırı."""
+        return (int(np.searchsorted(self.values, low, side='left')),
+                int(np.searchsorted(self.values, high, side='right')))
+
+    def count(self, low, high):
+        start, stop = self.band(low, high)
+        return max(stop - start, 0)
+
+    def sample(self, low, high, rng=None):
+        """
+        Aralıktan rastgele bir müşterinin portföydeki konumu; aralık boşsa None.
+        rng: np.random.Generator veya tohum (seed); aynı tohum aynı müşteri sırasını verir.
+        """
+        start, stop = self.band(low, high)
+        if stop <= start:
+            return None
+        return int(self.positions[np.random.default_rng(rng).integers(start, stop)])
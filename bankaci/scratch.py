@@ -0,0 +1,58 @@
+"""
+Oturum başına geçici çalışma dizinleri.
+
+Web oturumlarının ürettiği büyük ara dosyalar (ör. kredi toplu skorlama
+sonuçları) ortak bir kök altında oturum başına bir dizine yazılır. Dizin,
+sahibi olan ScratchDir nesnesi çöp toplandığında (oturum kapanıp
+session_state bırakıldığında) veya süreç kapanırken silinir. Süreç çökerse
+geride kalan dizinler, yeni bir dizin açılırken yaş sınırına göre süpürülür.
+"""
+
+import os
+import shutil
+import tempfile
+import time
+import weakref
+
+SCRATCH_ROOT = os.path.join(tempfile.gettempdir(), 'bankaci_oturum')
+# Bu süredir dokunulmamış oturum dizinleri sahipsiz sayılır (sn)
+MAX_AGE_SECONDS = 24 * 3600
+
+
+def sweep_stale(root=SCRATCH_ROOT, max_age=MAX_AGE_SECONDS):
+    """root altında max_age saniyedir değişmemiş oturum dizinlerini siler; silinen sayısını döndürür."""
+    removed = 0
+    now = time.time()
+    try:
+        names = os.listdir(root)
+    except OSError:
+        return 0
+    for name in names:
+        path = os.path.join(root, name)
+        try:
+            if now - os.stat(path).st_mtime < max_age:
+                continue
+        except OSError:
+            continue
+        shutil.rmtree(path, ignore_errors=True)
+        removed += 1
+    return removed
+
+
+class ScratchDir:
+    """Bir oturuma ait geçici dizin; nesne toplanınca veya cleanup() ile silinir."""
+
+    def __init__(self, root=SCRATCH_ROOT, max_age=MAX_AGE_SECONDS):
+        os.makedirs(root, exist_ok=True)
+        sweep_stale(root, max_age)
+        self.path = tempfile.mkdtemp(prefix='oturum_', dir=root)
+        self._finalizer = weakref.finalize(self, shutil.rmtree, self.path, True)
+
+    def new_file(self, prefix='', suffix=''):
+        """Dizinde boş bir dosya oluşturup yolunu döndürür (dizinin mtime'ı da güncellenir)."""
+        fd, path = tempfile.mkstemp(prefix=prefix, suffix=suffix, dir=self.path)
+        os.close(fd)
+        return path
+
+    def cleanup(self):
+        self._finalizer()
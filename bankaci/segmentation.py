@@ -0,0 +1,332 @@
+"""
+NBA müşteri segmentasyonu: ürün zenginleştirme, K-Means kümeleme ve segment
+isimlendirme.
+
+app.py, komut satırı build aracı (`python -m bankaci.build`) ve
+models/train_nba_kmeans.py aynı kodu buradan kullanır. Web uygulaması
+artefaktları sadece okur; eksik veya eski artefaktlar build aracıyla
+önceden üretilir.
+"""
+
+import os
+import time
+from contextlib import contextmanager
+
+import joblib
+import numpy as np
+import pandas as pd
+from sklearn.cluster import KMeans
+from sklearn.metrics import silhouette_score
+from sklearn.preprocessing import MinMaxScaler
+
+from bankaci.atomic import FileLock, atomic_path
+from bankaci.ids import assign_user_ids
+from bankaci.manifest import (MANIFEST_FILENAME, load_manifest, manifest_cluster_map,
+                              needs_full_rebuild, stale_entries, write_manifest)
+from bankaci.snapshot import read_snapshot, write_snapshot
+
+# YENİ ÖZELLİKLER: Balance, EstimatedSalary, NumOfProducts, Tenure, IsActiveMember
+SEGMENTATION_FEATURES = ['Balance', 'EstimatedSalary', 'NumOfProducts', 'Tenure', 'IsActiveMember']
+
+N_CLUSTERS = 6
+N_INIT = 10000  # 10,000 farklı başlangıç noktası
+MAX_ITER = 300
+
+# Centroid skoruna göre sıralanan kümelere sırayla verilen isimler (6 farklı isim garantisi)
+SEGMENT_TEMPLATES = [
+    "💎 Elit / Servet Yönetimi",
+    "🚀 Dinamik / Aktif Müşteri",
+    "💰 Güvenli / Birikimci",
+    "⚠️ Riskli / Pasif Müşteri",
+    "🌱 Temel Mevduat / Giriş",
+    "📊 Standart Bankacılık"
+]
+
+RAW_FILENAME = 'churn_processed_data_with_rational_salary.csv'
+PROCESSED_FILENAME = 'churn_processed_with_clusters.parquet'
+KMEANS_FILENAME = 'kmeans_model.pkl'
+SCALER_FILENAME = 'scaler_model.pkl'
+
+# Yeniden oluşturma kilidi: KMeans/snapshot/manifest yazımı aynı anda tek süreçte çalışır
+LOCK_FILENAME = '.segmentation.lock'
+# Kilidi en fazla bu kadar bekle (sn); süre dolarsa diskteki önceki sürümle devam et
+LOCK_TIMEOUT = 900
+
+BUILD_COMMAND = 'python -m bankaci.build'
+
+
+class SegmentationArtifactsError(RuntimeError):
+    """Segmentasyon artefaktları eksik veya ham veriyle uyumsuz olduğunda fırlatılır."""
+
+
+def artifact_files(root):
+    return {
+        # İşlenmiş veri seti snapshot'ı (cluster bilgisiyle birlikte, sütunlu format)
+        'processed': os.path.join(root, PROCESSED_FILENAME),
+        'kmeans': os.path.join(root, KMEANS_FILENAME),
+        'scaler': os.path.join(root, SCALER_FILENAME),
+        # Yeni rasyonel EstimatedSalary'li veri seti
+        'raw': os.path.join(root, RAW_FILENAME),
+    }
+
+
+@contextmanager
+def _stage(timings, name):
+    start = time.perf_counter()
+    yield
+    if timings is not None:
+        timings[name] = time.perf_counter() - start
+
+
+# --- ÜRÜN ZENGİNLEŞTİRME ---
+def calculate_age_score(age):
+    if age <= 35:
+        return 30  # Gençler: Yüksek harcama potansiyeli
+    elif age <= 45:
+        return 25  # Genç-orta yaş: Yüksek harcama
+    elif age <= 55:
+        return 20  # Orta yaş: Orta harcama
+    elif age <= 65:
+        return 15  # Orta-ileri yaş: Düşük-orta harcama
+    else:
+        return 10  # İleri yaş: Düşük ama sıfır olmayan harcama
+
+
+def assign_extra_products(row):
+    current_count = 1 + row['HasCrCard']
+    target_count = row['NumOfProducts']
+    has_bes, has_kredi, has_yatirim = 0, 0, 0
+    while current_count < target_count:
+        if row['Balance'] > 50000 and has_yatirim == 0: has_yatirim = 1; current_count += 1; continue
+        if row['EstimatedSalary'] > 60000 and row[
+            'Age'] > 28 and has_bes == 0: has_bes = 1; current_count += 1; continue
+        if row['CreditScore'] < 650 and has_kredi == 0: has_kredi = 1; current_count += 1; continue
+        options = [];
+        if has_bes == 0: options.append('BES')
+        if has_kredi == 0: options.append('Kredi')
+        if has_yatirim == 0: options.append('Yatırım')
+        if not options: break
+        choice = np.random.choice(options)
+        if choice == 'BES':
+            has_bes = 1
+        elif choice == 'Kredi':
+            has_kredi = 1
+        elif choice == 'Yatırım':
+            has_yatirim = 1
+        current_count += 1
+    return pd.Series([has_bes, has_kredi, has_yatirim])
+
+
+def enrich_products(df):
+    """Spending_Score ve sahip olunan ürün bayraklarını (Has_*) ekler."""
+    np.random.seed(42)
+    # Maaş skoru: Sabit maksimum (200,000$) ile normalize edilmiş, max 50 puan
+    MAX_SALARY = 200000.0
+    salary_score = (df['EstimatedSalary'] / MAX_SALARY * 50).clip(0, 50)
+
+    # Yaş skoru: Yaş gruplarına göre daha mantıklı bir dağılım
+    age_score = df['Age'].apply(calculate_age_score)
+
+    # Kredi kartı skoru: Kredi kartı varsa +20 puan
+    cc_score = df['HasCrCard'] * 20
+
+    # Rastgele gürültü kaldırıldı - daha deterministik skor
+    df['Spending_Score'] = (salary_score + age_score + cc_score).clip(1, 100).astype(int)
+    df['Has_Vadesiz'] = 1
+    df[['Has_BES', 'Has_Kredi', 'Has_Yatirim']] = df.apply(assign_extra_products, axis=1)
+    return df
+
+
+# --- KÜMELEME ---
+def fit_kmeans(X_scaled, n_init=N_INIT, random_state=42):
+    # n_init=10000 ile en az 10000 farklı başlangıç noktası denenir, en iyi varyasyon seçilir
+    kmeans = KMeans(n_clusters=N_CLUSTERS, random_state=random_state, n_init=n_init, max_iter=MAX_ITER)
+    labels = kmeans.fit_predict(X_scaled)
+    return kmeans, labels
+
+
+def sample_silhouette(X_scaled, labels):
+    # Model Doğrulama: Silüet Skoru (ilk 2000 satır)
+    sample_size = min(2000, len(X_scaled))
+    return silhouette_score(X_scaled[:sample_size], labels[:sample_size])
+
+
+def name_clusters(centroids):
+    """
+    Kümeleri finansal özelliklerine göre isimlendirir (Centroid analizi).
+    center[0] = Balance, center[1] = EstimatedSalary, center[2] = NumOfProducts,
+    center[3] = Tenure, center[4] = IsActiveMember (hepsi normalize)
+    """
+    # Toplam skor: Yüksek değerli müşteriler önce
+    cluster_scores = []
+    for i, center in enumerate(centroids):
+        total_score = (center[0] * 0.3 + center[1] * 0.3 + center[2] * 0.2 +
+                       center[3] * 0.1 + center[4] * 0.1)
+        cluster_scores.append((i, total_score))
+    cluster_scores.sort(key=lambda x: x[1], reverse=True)
+
+    # Her rank için direkt olarak farklı segment ismi ata
+    cluster_names = {cluster_id: SEGMENT_TEMPLATES[rank] for rank, (cluster_id, _) in enumerate(cluster_scores)}
+
+    # Kontrol: Her cluster için benzersiz isim olduğundan emin ol
+    assert len(set(cluster_names.values())) == N_CLUSTERS, \
+        f"Benzersiz segment sayısı {N_CLUSTERS} değil: {len(set(cluster_names.values()))}"
+    return cluster_names
+
+
+def enhance_data_with_products(df, n_init=N_INIT, timings=None):
+    """
+    Ürün zenginleştirme + ölçekleme + K-Means + silüet + segment isimlendirme.
+    timings sözlüğü verilirse her aşamanın süresi (sn) içine yazılır.
+    Dönüş: (df, kmeans, scaler, cluster_names, sil_score)
+    """
+    with _stage(timings, 'urun_zenginlestirme'):
+        df = enrich_products(df)
+
+    with _stage(timings, 'olcekleme'):
+        scaler = MinMaxScaler()
+        X_scaled = scaler.fit_transform(df[SEGMENTATION_FEATURES])
+
+    with _stage(timings, 'kmeans'):
+        kmeans, labels = fit_kmeans(X_scaled, n_init=n_init)
+        df['Cluster_Label'] = labels
+
+    with _stage(timings, 'silhouette'):
+        sil_score = sample_silhouette(X_scaled, df['Cluster_Label'])
+
+    with _stage(timings, 'isimlendirme'):
+        cluster_names = name_clusters(kmeans.cluster_centers_)
+        df['Segment_Name'] = df['Cluster_Label'].map(cluster_names)
+
+    return df, kmeans, scaler, cluster_names, sil_score
+
+
+# --- ARTEFAKT OKUMA / ÜRETME ---
+def read_artifacts(files, manifest, stale):
+    """
+    Kayıtlı artefaktları okur. stale boşsa segment haritası ve silüet skoru
+    manifestten gelir; değilse doğrulanıp yeniden hesaplanır (dosya yazılmaz).
+    Uyumsuzlukta ValueError/KeyError/AttributeError fırlatır.
+    """
+    # Hızlı yükleme - cluster bilgisi ve modeller kayıtlı (şema doğrulamalı snapshot)
+    df = read_snapshot(files['processed'])
+
+    # Kayıtlı modelleri yükle (manuel segment tahmini için)
+    kmeans = joblib.load(files['kmeans'])
+    scaler = joblib.load(files['scaler'])
+
+    if not stale:
+        # Hash'ler tutuyor: segment haritası ve silüet skoru manifestten
+        cluster_map = manifest_cluster_map(manifest)
+        sil_val = manifest['silhouette']
+    else:
+        # Manifest yok/eski: meta verileri doğrula ve yeniden hesapla
+        missing_features = [f for f in SEGMENTATION_FEATURES if f not in df.columns]
+        if missing_features:
+            raise ValueError(f"Eksik özellikler: {missing_features}")
+
+        # Cluster names map'i oluştur (her cluster'ın ilk segment adı)
+        first_names = df.groupby('Cluster_Label', observed=True)['Segment_Name'].first()
+        cluster_map = {int(cid): str(name) for cid, name in first_names.sort_index().items()}
+
+        # Özellik uyumluluğunu test et
+        scaler.transform(df[SEGMENTATION_FEATURES].iloc[:1])  # Eğer hata verirse exception fırlatır
+
+        # Silhouette score'u hesapla (ilk 2000 satır yeterli)
+        sample_size = min(2000, len(df))
+        X_scaled = scaler.transform(df[SEGMENTATION_FEATURES].iloc[:sample_size])
+        sil_val = silhouette_score(X_scaled, df['Cluster_Label'][:sample_size])
+
+    return {'df': df, 'kmeans': kmeans, 'scaler': scaler,
+            'cluster_map': cluster_map, 'silhouette': sil_val}
+
+
+def _built(files):
+    return all(os.path.exists(files[k]) for k in ('processed', 'kmeans', 'scaler'))
+
+
+def load_artifacts(root, lock_timeout=LOCK_TIMEOUT):
+    """
+    Web uygulaması için okuma yolu; KMeans hiçbir zaman burada eğitilmez.
+
+    - Manifest güncelse kilitsiz okunur, hiçbir şey yeniden hesaplanmaz.
+    - Sadece manifest eksik/eskiyse kilit altında meta veriler yeniden hesaplanıp
+      manifest yazılır (saniyeler). Kilit süre içinde alınamazsa manifest yazılmadan okunur.
+    - Artefaktlar eksikse veya ham veri/özellik listesi değiştiyse
+      SegmentationArtifactsError fırlatılır; build aracı çalıştırılmalıdır.
+    """
+    files = artifact_files(root)
+    manifest_file = os.path.join(root, MANIFEST_FILENAME)
+
+    if not _built(files):
+        missing = [os.path.basename(files[k]) for k in ('processed', 'kmeans', 'scaler')
+                   if not os.path.exists(files[k])]
+        raise SegmentationArtifactsError(f"Segmentasyon artefaktları eksik: {', '.join(missing)}")
+
+    manifest = load_manifest(manifest_file)
+    stale = stale_entries(manifest, files, SEGMENTATION_FEATURES)
+    if not stale:
+        return read_artifacts(files, manifest, stale)
+    if needs_full_rebuild(stale):
+        raise SegmentationArtifactsError(f"Segmentasyon artefaktları ham veriyle uyumsuz: {stale}")
+
+    lock = FileLock(os.path.join(root, LOCK_FILENAME))
+    if not lock.acquire(timeout=lock_timeout):
+        return read_artifacts(files, manifest, stale)
+    try:
+        # Kilidi beklerken başka bir süreç manifesti yazmış olabilir: tekrar kontrol et
+        manifest = load_manifest(manifest_file)
+        stale = stale_entries(manifest, files, SEGMENTATION_FEATURES)
+        if needs_full_rebuild(stale):
+            raise SegmentationArtifactsError(f"Segmentasyon artefaktları ham veriyle uyumsuz: {stale}")
+        bundle = read_artifacts(files, manifest, stale)
+        if stale:
+            write_manifest(manifest_file, files, SEGMENTATION_FEATURES,
+                           bundle['cluster_map'], bundle['silhouette'])
+        return bundle
+    finally:
+        lock.release()
+
+
+def build_artifacts(root, n_init=N_INIT, timings=None, lock_timeout=None):
+    """
+    Tüm segmentasyon artefaktlarını üretir: işlenmiş snapshot, KMeans, scaler, manifest.
+    Kilit altında çalışır (single-flight); dosyalar atomik olarak yerine konur ve
+    manifest en son yazılır. Dönüş: (df, kmeans, scaler, cluster_names, sil_score)
+    """
+    files = artifact_files(root)
+    manifest_file = os.path.join(root, MANIFEST_FILENAME)
+    if not os.path.exists(files['raw']):
+        raise SegmentationArtifactsError(f"Churn veri dosyası bulunamadı: {files['raw']}")
+
+    lock = FileLock(os.path.join(root, LOCK_FILENAME))
+    with _stage(timings, 'kilit_bekleme'):
+        acquired = lock.acquire(timeout=lock_timeout)
+    if not acquired:
+        raise SegmentationArtifactsError("Başka bir build çalışıyor, kilit alınamadı")
+    try:
+        with _stage(timings, 'ham_veri_okuma'):
+            df_raw = pd.read_csv(files['raw'])
+
+        df, kmeans, scaler, cluster_names, sil_score = enhance_data_with_products(
+            df_raw, n_init=n_init, timings=timings)
+        if 'User_ID' not in df.columns:
+            # Kimlikler snapshot'a yazılır; uygulama açılışta tekrar üretmez
+            df.insert(0, 'User_ID', assign_user_ids(len(df)))
+
+        with _stage(timings, 'yazma'):
+            # İşlenmiş veriyi snapshot olarak kaydet (cluster bilgisiyle birlikte, atomik)
+            df = write_snapshot(df, files['processed'])
+
+            # Modelleri kaydet (manuel segment tahmini için)
+            with atomic_path(files['kmeans']) as tmp:
+                joblib.dump(kmeans, tmp)
+            with atomic_path(files['scaler']) as tmp:
+                joblib.dump(scaler, tmp)
+
+            # Manifest en son yazılır: yeni sürümün tamamlandığını işaretler
+            write_manifest(manifest_file, files, SEGMENTATION_FEATURES, cluster_names, sil_score)
+    finally:
+        lock.release()
+
+    return df, kmeans, scaler, cluster_names, sil_score
@@ -0,0 +1,75 @@
+"""
+Isınma + hazır olma uç noktası ile Streamlit sunucusunu başlatır.
+
+    python -m bankaci.serve                          # streamlit run app.py
+    python -m bankaci.serve --ready-port 8502 -- --server.port 8501
+
+Isınma (bankaci.warmup) Streamlit ile aynı süreçte, sunucu açılırken başlar;
+ilk kullanıcı modellerin yüklenmesini ve portföy skorlamasını beklemez.
+Yük dengeleyici `http://<host>:<ready-port>/ready` adresini yoklar: ısınma
+hatasız bitene kadar 503, bittikten sonra 200 döner. Bir artefakt yüklenemediyse
+durum 'degraded' olur ve 503 kalır (gövdedeki errors hangi artefakt olduğunu gösterir).
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from bankaci.warmup import start_warmup
+
+APP_FILENAME = 'app.py'
+
+
+def make_ready_handler(state):
+    class ReadyHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.rstrip('/') != '/ready':
+                self.send_error(404)
+                return
+            body = json.dumps(state.as_dict(), ensure_ascii=False).encode('utf-8')
+            self.send_response(200 if state.is_ready else 503)
+            self.send_header('Content-Type', 'application/json; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            # Prob istekleri her birkaç saniyede bir gelir; loglamayı kapat
+            pass
+
+    return ReadyHandler
+
+
+def start_ready_server(state, host, port):
+    server = ThreadingHTTPServer((host, port), make_ready_handler(state))
+    threading.Thread(target=server.serve_forever, name='ready-probe', daemon=True).start()
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bankacı Plus sunucusu (ısınma + hazır olma probu)")
+    parser.add_argument('--root', default=os.getcwd(), help="Proje kök dizini (app.py ve artefaktlar)")
+    parser.add_argument('--ready-host', default='0.0.0.0')
+    parser.add_argument('--ready-port', type=int, default=8502)
+    parser.add_argument('streamlit_args', nargs=argparse.REMAINDER,
+                        help="'--' sonrasındaki argümanlar streamlit run'a aktarılır")
+    args = parser.parse_args(argv)
+    streamlit_args = [a for a in args.streamlit_args if a != '--']
+
+    root = os.path.abspath(args.root)
+    state = start_warmup(root)
+    start_ready_server(state, args.ready_host, args.ready_port)
+    print(f"Isınma başladı; hazır olma probu: http://{args.ready_host}:{args.ready_port}/ready")
+
+    # Streamlit aynı süreçte çalışır: app.py aynı kayıt defterini (bankaci.artifacts) kullanır
+    from streamlit.web import cli as stcli
+    os.chdir(root)
+    sys.argv = ['streamlit', 'run', os.path.join(root, APP_FILENAME)] + streamlit_args
+    return stcli.main()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,180 @@
+"""
+İşlenmiş churn veri seti için sütunlu (Parquet) snapshot formatı.
+
+Uygulama açılışta CSV yerine bu snapshot'ı okur. Snapshot açık dtype'larla
+yazılır, şema dosya metadata'sında saklanır ve okunurken doğrulanır.
+CSV yalnızca içe/dışa aktarma yolu olarak kalır:
+
+    python -m bankaci.snapshot import churn_processed_with_clusters.csv churn_processed_with_clusters.parquet
+    python -m bankaci.snapshot export churn_processed_with_clusters.parquet cikti.csv
+"""
+
+import json
+import sys
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from bankaci.atomic import atomic_path
+
+SNAPSHOT_FORMAT_VERSION = 1
+SCHEMA_METADATA_KEY = b'bankaci.schema'
+
+# İşlenmiş churn veri setinin açık dtype şeması (sütun -> dtype)
+CHURN_SNAPSHOT_SCHEMA = {
+    'User_ID': 'int64',
+    'CreditScore': 'int16',
+    'Geography': 'category',
+    'Gender': 'category',
+    'Age': 'int16',
+    'Tenure': 'int8',
+    'Balance': 'float64',
+    'NumOfProducts': 'int8',
+    'HasCrCard': 'int8',
+    'IsActiveMember': 'int8',
+    'EstimatedSalary': 'float64',
+    'Complain': 'int8',
+    'Satisfaction Score': 'int8',
+    'Card Type': 'category',
+    'Point Earned': 'int32',
+    'Balance_per_Product': 'float64',
+    'Age_Group': 'category',
+    'Credit_Score_Age_Ratio': 'float64',
+    'Is_High_Value_Active': 'int8',
+    'Spending_Score': 'int8',
+    'Has_Vadesiz': 'int8',
+    'Has_BES': 'int8',
+    'Has_Kredi': 'int8',
+    'Has_Yatirim': 'int8',
+    'Cluster_Label': 'int8',
+    'Segment_Name': 'category',
+}
+
+# Snapshot'ta mutlaka bulunması gereken sütunlar (kümeleme + segment bilgisi)
+REQUIRED_COLUMNS = ['Balance', 'EstimatedSalary', 'NumOfProducts', 'Tenure', 'IsActiveMember',
+                    'Cluster_Label', 'Segment_Name']
+
+
+class SnapshotError(ValueError):
+    """Snapshot dosyası okunamadığında veya şema doğrulaması başarısız olduğunda fırlatılır."""
+
+
+def _cast_column(name, series, dtype):
+    if dtype == 'category':
+        return series.astype('category')
+    if dtype.startswith('int'):
+        if series.isna().any():
+            raise SnapshotError(f"'{name}' sütununda eksik değer var, {dtype} tipine çevrilemez")
+        casted = series.astype(dtype)
+        # Kayıplı dönüşümü (ondalık kısım, taşma) reddet
+        if not np.array_equal(casted.to_numpy(dtype='float64'), series.to_numpy(dtype='float64')):
+            raise SnapshotError(f"'{name}' sütunu {dtype} tipine kayıpsız çevrilemiyor")
+        return casted
+    return series.astype(dtype)
+
+
+def apply_schema(df, schema=None):
+    """
+    DataFrame'i şemadaki açık dtype'lara çevirir.
+    Şemada olmayan sütunlar olduğu gibi bırakılır; sütun sırası korunur.
+    """
+    schema = CHURN_SNAPSHOT_SCHEMA if schema is None else schema
+    out = df.copy()
+    for col, dtype in schema.items():
+        if col in out.columns:
+            out[col] = _cast_column(col, out[col], dtype)
+    return out
+
+
+def _frame_schema(df):
+    return {col: str(dtype) for col, dtype in df.dtypes.items()}
+
+
+def write_snapshot(df, path, schema=None):
+    """İşlenmiş veriyi şema metadata'sı ile birlikte Parquet snapshot olarak yazar."""
+    typed = apply_schema(df, schema)
+    missing = [c for c in REQUIRED_COLUMNS if c not in typed.columns]
+    if missing:
+        raise SnapshotError(f"Snapshot için gerekli sütunlar eksik: {missing}")
+
+    table = pa.Table.from_pandas(typed, preserve_index=False)
+    stored = {
+        'version': SNAPSHOT_FORMAT_VERSION,
+        'rows': len(typed),
+        'columns': _frame_schema(typed),
+    }
+    metadata = dict(table.schema.metadata or {})
+    metadata[SCHEMA_METADATA_KEY] = json.dumps(stored, ensure_ascii=False).encode('utf-8')
+    table = table.replace_schema_metadata(metadata)
+    # Geçici dosyaya yaz, tek adımda yerine koy (okuyucular yarım dosya görmez)
+    with atomic_path(path) as tmp:
+        pq.write_table(table, tmp, compression='zstd')
+    return typed
+
+
+def read_snapshot(path, columns=None):
+    """
+    Snapshot'ı okur ve saklanan şemaya göre doğrular.
+    Sürüm, satır sayısı veya sütun tipleri uyuşmazsa SnapshotError fırlatır.
+    """
+    try:
+        table = pq.read_table(path, columns=columns)
+    except (OSError, pa.ArrowException) as e:
+        raise SnapshotError(f"Snapshot okunamadı: {e}") from e
+
+    raw = (table.schema.metadata or {}).get(SCHEMA_METADATA_KEY)
+    if raw is None:
+        raise SnapshotError("Snapshot şema bilgisi içermiyor")
+    stored = json.loads(raw.decode('utf-8'))
+    if stored.get('version') != SNAPSHOT_FORMAT_VERSION:
+        raise SnapshotError(f"Desteklenmeyen snapshot sürümü: {stored.get('version')}")
+
+    # self_destruct: Arrow tamponları dönüştürülürken serbest bırakılır (tepe bellek düşer)
+    df = table.to_pandas(split_blocks=True, self_destruct=True)
+    del table
+    if len(df) != stored['rows']:
+        raise SnapshotError(f"Satır sayısı uyuşmuyor: {len(df)} != {stored['rows']}")
+
+    expected = stored['columns']
+    if columns is not None:
+        expected = {c: t for c, t in expected.items() if c in columns}
+    actual = _frame_schema(df)
+    if actual != expected:
+        diff = {c: (expected.get(c), actual.get(c)) for c in set(expected) | set(actual)
+                if expected.get(c) != actual.get(c)}
+        raise SnapshotError(f"Snapshot şeması uyuşmuyor: {diff}")
+
+    if columns is None:
+        missing = [c for c in REQUIRED_COLUMNS if c not in df.columns]
+        if missing:
+            raise SnapshotError(f"Snapshot'ta gerekli sütunlar eksik: {missing}")
+    return df
+
+
+def import_csv(csv_path, snapshot_path=None, schema=None):
+    """CSV'yi okuyup şemaya çevirir; snapshot_path verilirse snapshot olarak da yazar."""
+    df = pd.read_csv(csv_path)
+    if snapshot_path is not None:
+        return write_snapshot(df, snapshot_path, schema)
+    return apply_schema(df, schema)
+
+
+def export_csv(snapshot_path, csv_path):
+    """Snapshot'ı CSV olarak dışa aktarır."""
+    df = read_snapshot(snapshot_path)
+    df.to_csv(csv_path, index=False)
+    return df
+
+
+if __name__ == '__main__':
+    if len(sys.argv) != 4 or sys.argv[1] not in ('import', 'export'):
+        print("Kullanım: python -m bankaci.snapshot [import|export] <kaynak> <hedef>")
+        sys.exit(2)
+    mode, src, dst = sys.argv[1:]
+    if mode == 'import':
+        out = import_csv(src, dst)
+    else:
+        out = export_csv(src, dst)
+    print(f"{len(out)} satır yazıldı: {dst}")
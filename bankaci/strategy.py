@@ -0,0 +1,85 @@
+"""
+Churn aksiyon stratejisi motoru (sütunlu / vektörel).
+
+Strateji Mantığı sekmesindeki kurallar tüm portföye tek geçişte uygulanır:
+satır başına Python çağrısı yerine eşik karşılaştırmaları numpy dizileri
+üzerinde yapılır. Toplu risk listesi ve tekil müşteri sekmesi aynı motoru
+kullanır.
+
+    YÜKSEK RİSK (prob > 0.60): bakiye > 50K -> VIP MÜDAHALE, ürün >= 3 -> SADELEŞTİRME, diğer -> ARAMA
+    ORTA RİSK (prob > 0.40):   pasif -> UYANDIRMA, yaş < 35 -> LIFESTYLE HEDİYE, diğer -> TEŞVİK
+    DÜŞÜK RİSK:                bakiye > 100K -> YATIRIM ÇAPRAZ SATIŞ, diğer -> İLİŞKİ YÖNETİMİ
+"""
+
+import numpy as np
+import pandas as pd
+
+HIGH_RISK_THRESHOLD = 0.60
+MEDIUM_RISK_THRESHOLD = 0.40
+VIP_BALANCE = 50000
+INVESTMENT_BALANCE = 100000
+SIMPLIFY_MIN_PRODUCTS = 3
+YOUNG_AGE = 35
+# Yaş bilgisi yoksa kullanılan varsayılan
+DEFAULT_AGE = 40
+
+# Strateji kodları bu listedeki sıraya karşılık gelir
+STRATEGIES = [
+    "🚨 VIP MÜDAHALE",
+    "🔄 SADELEŞTİRME",
+    "📞 ARAMA",
+    "🔔 UYANDIRMA",
+    "🎁 LIFESTYLE HEDİYE",
+    "💳 TEŞVİK",
+    "💰 YATIRIM ÇAPRAZ SATIŞ",
+    "🤝 İLİŞKİ YÖNETİMİ",
+]
+
+
+def strategy_codes(prob, balance, products, active, age=None):
+    """
+    Her müşteri için STRATEGIES içindeki strateji kodunu (int8) döndürür.
+    Girdiler aynı uzunlukta diziler veya skalerlerdir; NaN karşılaştırmaları
+    satır bazlı kurallarla aynı şekilde yanlış sayılır.
+    """
+    prob = np.asarray(prob, dtype='float64')
+    balance = np.asarray(balance, dtype='float64')
+    products = np.asarray(products, dtype='float64')
+    active = np.asarray(active, dtype='float64')
+    age = np.asarray(DEFAULT_AGE if age is None else age, dtype='float64')
+
+    high = prob > HIGH_RISK_THRESHOLD
+    # ORTA RİSK sadece yüksek risk değilse (np.select ilk doğru koşulu seçer)
+    medium = prob > MEDIUM_RISK_THRESHOLD
+    conditions = [
+        high & (balance > VIP_BALANCE),
+        high & (products >= SIMPLIFY_MIN_PRODUCTS),
+        high,
+        medium & (active == 0),
+        medium & (age < YOUNG_AGE),
+        medium,
+        balance > INVESTMENT_BALANCE,
+    ]
+    return np.select(conditions, np.arange(len(conditions), dtype=np.int8),
+                     default=np.int8(len(conditions))).astype(np.int8)
+
+
+def portfolio_strategy_codes(df, prob):
+    """Portföy frame'i ve ayrı tutulan risk olasılıkları için strateji kodları."""
+    age = df['Age'].to_numpy() if 'Age' in df.columns else None
+    return strategy_codes(prob, df['Balance'].to_numpy(), df['NumOfProducts'].to_numpy(),
+                          df['IsActiveMember'].to_numpy(), age)
+
+
+def assign_strategies(df, prob_column='Risk_Probability'):
+    """
+    Portföydeki her müşterinin stratejisi (Categorical, df ile aynı index).
+    Beklenen sütunlar: Risk_Probability, Balance, NumOfProducts, IsActiveMember, (Age).
+    """
+    codes = portfolio_strategy_codes(df, df[prob_column].to_numpy())
+    return pd.Series(pd.Categorical.from_codes(codes, categories=STRATEGIES), index=df.index, name='Strategy')
+
+
+def customer_strategy(prob, balance, products, active, age=DEFAULT_AGE):
+    """Tek müşteri için strateji adı (tekil müşteri sekmesi)."""
+    return STRATEGIES[int(strategy_codes(prob, balance, products, active, age))]
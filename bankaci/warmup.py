@@ -0,0 +1,200 @@
+"""
+Sunucu açılışında arka planda ısınma (warm-up).
+
+- Kayıtlı tüm artefaktları (modeller, veri setleri, segmentasyon) yükler,
+- churn portföyünü önceden skorlar,
+- uygulamanın kullandığı derlenmiş skorlayıcıları (churn/Lite/Pro) küçük bir
+  sahte batch ve tek kayıtla ısıtır,
+- hepsi hatasız bittiğinde hazır (ready) işaretini koyar; bir artefakt veya
+  skorlayıcı hata verdiyse durum 'degraded' olur ve süreç hazır sayılmaz.
+
+Hazır durumu iki yoldan okunabilir: süreç içinde `WarmupState.is_ready` ve
+proje dizinindeki `.warmup_ready` dosyası (yük dengeleyici exec probu için):
+
+    python -m bankaci.warmup --probe      # hazırsa 0, değilse 1 ile çıkar
+    python -m bankaci.warmup              # ısınmayı ön planda çalıştırır
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+
+import pandas as pd
+
+from bankaci.artifacts import ARTIFACT_NAMES, get_registry
+from bankaci.atomic import atomic_path
+
+READY_FILENAME = '.warmup_ready'
+# Sahte batch boyutu: tahmin yollarının ilk çağrı maliyetini ödemeye yeter
+DUMMY_BATCH_ROWS = 8
+
+# Isıtılacak skorlayıcı -> sahte batch'in sütunlarının alındığı pipeline (kayıt defteri adları).
+# Pipeline'ların kendisi ayrıca ısıtılmaz: churn portföy skorlaması ('churn_scores') onu zaten çalıştırır.
+PREDICTOR_NAMES = {'pro_scorer': 'pro_model', 'lite_scorer': 'lite_model', 'churn_scorer': 'churn_model'}
+
+
+class WarmupState:
+    """Isınmanın durumu; thread güvenli okunur."""
+
+    def __init__(self, root):
+        self.root = root
+        self.status = 'idle'  # idle -> running -> ready | degraded
+        self.started_at = None
+        self.finished_at = None
+        self.timings = {}
+        self.errors = {}
+        self._ready = threading.Event()
+
+    @property
+    def is_ready(self):
+        return self._ready.is_set()
+
+    def wait(self, timeout=None):
+        return self._ready.wait(timeout)
+
+    def as_dict(self):
+        return {
+            'status': self.status,
+            'pid': os.getpid(),
+            'started_at': self.started_at,
+            'finished_at': self.finished_at,
+            'timings': dict(self.timings),
+            'errors': dict(self.errors),
+        }
+
+
+def dummy_batch(pipeline, n_rows=DUMMY_BATCH_ROWS):
+    """
+    Pipeline'ın beklediği sütunlarla sahte bir batch üretir: kategorik sütunlara
+    OneHotEncoder'ın bildiği ilk kategori, diğerlerine 0 yazılır.
+    """
+    preprocessor = pipeline.steps[0][1]
+    columns = getattr(pipeline, 'feature_names_in_', None)
+    if columns is None:
+        columns = getattr(preprocessor, 'feature_names_in_', [])
+    columns = list(columns)
+    values = {col: 0.0 for col in columns}
+    for _, transformer, cols in getattr(preprocessor, 'transformers_', []):
+        categories = getattr(transformer, 'categories_', None)
+        if categories is None:
+            continue
+        for col, cats in zip(cols, categories):
+            values[col] = cats[0]
+    return pd.DataFrame({col: [values[col]] * n_rows for col in columns})
+
+
+def warm_predictor(scorer, pipeline):
+    """Skorlayıcının toplu (predict) ve tekil (predict_one) yolunu ilk kez çalıştırır."""
+    batch = dummy_batch(pipeline)
+    scorer.predict(batch)
+    scorer.predict_one(batch.iloc[0].to_dict())
+
+
+def ready_path(root):
+    return os.path.join(root, READY_FILENAME)
+
+
+def _write_ready(state):
+    with atomic_path(ready_path(state.root)) as tmp:
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(state.as_dict(), f, ensure_ascii=False, indent=2)
+
+
+def run_warmup(state):
+    """Isınmayı çağıran thread'de çalıştırır; hatalar kaydedilir, ısınma yarıda kalmaz."""
+    state.status = 'running'
+    state.started_at = time.time()
+    # Önceki süreçten kalan işareti kaldır (yeni süreç henüz hazır değil)
+    if os.path.exists(ready_path(state.root)):
+        os.remove(ready_path(state.root))
+
+    registry = get_registry(state.root)
+
+    # 1. Tüm artefaktlar (paralel) + portföy skorlama ('churn_scores')
+    start = time.perf_counter()
+    values, errors = registry.get_many(ARTIFACT_NAMES)
+    state.timings['artefakt_yukleme'] = time.perf_counter() - start
+    state.errors.update({name: str(e) for name, e in errors.items()})
+
+    # 2. Skorlayıcıları sahte batch ile ısıt (formlar ve toplu skorlama bu yolları kullanır)
+    for name, pipeline_name in PREDICTOR_NAMES.items():
+        if name not in values or pipeline_name not in values:
+            continue
+        start = time.perf_counter()
+        try:
+            warm_predictor(values[name], values[pipeline_name])
+        except Exception as e:
+            state.errors[f'{name}_isinma'] = str(e)
+        state.timings[f'{name}_isinma'] = time.perf_counter() - start
+
+    # Hatalı artefakt olsa da ısınma biter, ama süreç hazır işaretlenmez: yük dengeleyici
+    # trafiği eksik artefaktlı bir sunucuya yönlendirmesin. Durum dosyası yine yazılır
+    # (status='degraded', errors) ki hangi artefaktın düştüğü probdan görülebilsin.
+    state.status = 'degraded' if state.errors else 'ready'
+    state.finished_at = time.time()
+    _write_ready(state)
+    if not state.errors:
+        state._ready.set()
+    return state
+
+
+_states = {}
+_states_guard = threading.Lock()
+
+
+def start_warmup(root):
+    """Süreç başına bir kez arka plan ısınma thread'ini başlatır; durumu döndürür."""
+    root = os.path.abspath(root)
+    with _states_guard:
+        state = _states.get(root)
+        if state is None:
+            state = _states[root] = WarmupState(root)
+            threading.Thread(target=run_warmup, args=(state,), name='warmup', daemon=True).start()
+        return state
+
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except (PermissionError, OSError):
+        return True
+    return True
+
+
+def probe(root):
+    """Isınmayı bitirmiş, hâlâ çalışan bir sunucu süreci varsa True."""
+    try:
+        with open(ready_path(root), 'r', encoding='utf-8') as f:
+            info = json.load(f)
+    except (OSError, ValueError):
+        return False
+    pid = int(info.get('pid', 0))
+    return info.get('status') == 'ready' and pid > 0 and _pid_alive(pid)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Bankacı Plus ısınma ve hazır olma probu")
+    parser.add_argument('--root', default=os.getcwd(), help="Artefaktların bulunduğu proje kök dizini")
+    parser.add_argument('--probe', action='store_true', help="Sadece hazır durumunu kontrol et")
+    args = parser.parse_args(argv)
+
+    if args.probe:
+        ready = probe(args.root)
+        print("ready" if ready else "not ready")
+        return 0 if ready else 1
+
+    state = run_warmup(WarmupState(os.path.abspath(args.root)))
+    for name, seconds in state.timings.items():
+        print(f"   {name:<30} {seconds:>8.2f} sn")
+    for name, error in state.errors.items():
+        print(f"   HATA {name}: {error}")
+    return 0 if state.is_ready else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
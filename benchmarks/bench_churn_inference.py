@@ -0,0 +1,98 @@
+"""
+Tekil Churn Skorlama Gecikme Benchmark'ı
+"🔍 KAYIP RİSKİNİ HESAPLA" butonundaki tek müşteri skorlamasını iki yolla karşılaştırır:
+
+- pipeline: eski yol; 14 sütunlu tek satırlık DataFrame + churn_model.predict_proba
+- compiled: bankaci.inference; dict/tuple kayıt + derlenmiş ön işleme + LightGBM booster
+
+Önce eşdeğerlik kontrol edilir: örnek müşterilerde (dict ve tuple girdiyle) ve
+tüm veri setinde toplu olarak iki yol birebir aynı olasılığı vermeli.
+(Aynı garanti tests/test_inference.py'de test edilir.)
+Sonra her yol için çağrı başına p50/p99 gecikme ölçülür.
+
+Kullanım:
+    python benchmarks/bench_churn_inference.py
+    python benchmarks/bench_churn_inference.py --calls 5000
+"""
+
+import argparse
+import os
+import sys
+import time
+import warnings
+
+import joblib
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from bankaci.inference import CompiledChurnModel, churn_scorer
+
+warnings.filterwarnings('ignore')
+
+MODEL_PATH = os.path.join(ROOT, 'churn_model_v1.pkl')
+DATA_PATH = os.path.join(ROOT, 'churn_processed_data_with_rational_salary.csv')
+# Uygulamanın tek satırlık DataFrame'indeki sütunlar (aynı sırada)
+APP_COLUMNS = ['CreditScore', 'Geography', 'Gender', 'Age', 'Tenure', 'Balance', 'NumOfProducts', 'HasCrCard',
+               'IsActiveMember', 'EstimatedSalary', 'Balance_per_Product', 'Age_Group', 'Credit_Score_Age_Ratio',
+               'Is_High_Value_Active']
+
+
+def check_equivalence(model, scorer, df, n_rows=2000):
+    expected = model.predict_proba(df)[:, 1]
+    if not np.array_equal(scorer.predict(df), expected):
+        raise AssertionError("Toplu skorlar farklı")
+    sample = df[scorer.input_columns].head(n_rows)
+    by_dict = [scorer.predict_one(record) for record in sample.to_dict('records')]
+    by_tuple = [scorer.predict_one(tuple(record)) for record in sample.itertuples(index=False)]
+    if not (np.array_equal(by_dict, expected[:n_rows]) and np.array_equal(by_tuple, expected[:n_rows])):
+        raise AssertionError("Tekil skorlar predict_proba ile aynı değil")
+    print(f"✅ Eşdeğerlik: {n_rows:,} müşteri (dict/tuple) ve {len(df):,} satır toplu skor birebir aynı")
+
+
+def latencies(fn, records):
+    times = np.empty(len(records))
+    for i, record in enumerate(records):
+        start = time.perf_counter()
+        fn(record)
+        times[i] = time.perf_counter() - start
+    return times * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--calls', type=int, default=2000)
+    args = parser.parse_args()
+
+    model = joblib.load(MODEL_PATH)
+    scorer = churn_scorer(model)
+    if not isinstance(scorer, CompiledChurnModel):
+        raise SystemExit("❌ Model derlenemedi; pipeline yedeği kullanılıyor")
+    df = pd.read_csv(DATA_PATH)
+
+    print("=" * 80)
+    print("TEKİL CHURN SKORLAMA GECİKMESİ")
+    print("=" * 80)
+    check_equivalence(model, scorer, df)
+    records = df[APP_COLUMNS].sample(args.calls, replace=True, random_state=0).to_dict('records')
+    # Isınma (ilk çağrılardaki tek seferlik maliyetler ölçüme girmesin)
+    for record in records[:50]:
+        model.predict_proba(pd.DataFrame({col: [value] for col, value in record.items()}))
+        scorer.predict_one(record)
+
+    pipeline = latencies(lambda r: float(model.predict_proba(
+        pd.DataFrame({col: [value] for col, value in r.items()}))[0][1]), records)
+    compiled = latencies(scorer.predict_one, records)
+    print(f"{'Yol':>10} | {'p50 (µs)':>10} | {'p99 (µs)':>10} | {'ortalama (µs)':>14}")
+    print("-" * 80)
+    for name, times in (('pipeline', pipeline), ('compiled', compiled)):
+        print(f"{name:>10} | {np.percentile(times, 50):>10,.1f} | {np.percentile(times, 99):>10,.1f} | "
+              f"{times.mean():>14,.1f}")
+    print(f"p50 hızlanma: {np.percentile(pipeline, 50) / np.percentile(compiled, 50):.0f}x")
+    print("=" * 80)
+
+
+if __name__ == '__main__':
+    main()
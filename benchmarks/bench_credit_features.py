@@ -0,0 +1,136 @@
+"""
+Kredi Özellik Mühendisliği Benchmark'ı
+Lite/Pro model girdisinin hazırlanmasını iki yolla karşılaştırır:
+
+- row: eski yol; formdaki gibi başvuru başına elle kurulan tek satırlık DataFrame
+  (map_term, clean_emp_length_input, HOME/PURPOSE/VERIF_MAP ve oranlar satır içinde)
+- vectorized: bankaci.credit_features.prepare_applications (tüm başvurular tek geçişte)
+
+Eşdeğerlik (tekil/toplu yol, eski form dönüşümleri, Pro varsayılanları,
+eğitim verisi) tests/test_credit_features.py'de test edilir; burada sadece
+süre ölçülür.
+
+Kullanım:
+    python benchmarks/bench_credit_features.py
+    python benchmarks/bench_credit_features.py --rows 1000,100000 --row-max-rows 5000
+"""
+
+import argparse
+import os
+import sys
+import time
+import warnings
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from bankaci.credit_features import (EMP_MAP, HOME_MAP, PURPOSE_MAP, VERIF_MAP, clean_emp_length_input, map_term,
+                                     prepare_applications)
+
+warnings.filterwarnings('ignore')
+
+TERMS = [12, 24, 36, 48, 60]
+GRADES = ["A", "B", "C", "D", "E", "F", "G"]
+
+
+def build_forms(n_rows, seed=42):
+    """Formdaki alan aralıklarından rastgele başvurular (Türkçe etiketlerle)."""
+    rng = np.random.default_rng(seed)
+    pick = lambda values: np.asarray(list(values), dtype=object)[rng.integers(0, len(values), size=n_rows)]
+    return pd.DataFrame({
+        'annual_inc': rng.uniform(10000.0, 1000000.0, size=n_rows).round(2),
+        'loan_amnt': rng.uniform(1000.0, 50000.0, size=n_rows).round(2),
+        'term': pick(TERMS).astype('int64'),
+        'grade': pick(GRADES),
+        'home_ownership': pick(HOME_MAP.keys()),
+        'purpose': pick(PURPOSE_MAP.keys()),
+        'emp_length': pick(EMP_MAP.keys()),
+        'int_rate': rng.uniform(5.0, 30.0, size=n_rows).round(2),
+        'installment': rng.uniform(50.0, 2000.0, size=n_rows).round(2),
+        'dti': rng.uniform(0.0, 100.0, size=n_rows).round(2),
+        'revol_bal': rng.integers(0, 100001, size=n_rows),
+        'total_acc': rng.integers(1, 101, size=n_rows),
+        'verification_status': pick(VERIF_MAP.keys()),
+    })
+
+
+def reference_lite(f):
+    """Eski Lite formundaki tek satırlık DataFrame."""
+    df = pd.DataFrame(
+        {'annual_inc': [f['annual_inc']], 'loan_amnt': [f['loan_amnt']], 'term': [map_term(f['term'])],
+         'grade': [f['grade']], 'home_ownership': [HOME_MAP[f['home_ownership']]],
+         'purpose': [PURPOSE_MAP[f['purpose']]], 'emp_length': [clean_emp_length_input(f['emp_length'])]})
+    df['loan_to_income'] = df['loan_amnt'] / (df['annual_inc'] + 1)
+    return df
+
+
+def reference_pro(f):
+    """Eski Pro formundaki tek satırlık DataFrame."""
+    df = pd.DataFrame(
+        {'loan_amnt': [f['loan_amnt']], 'term': [map_term(f['term'])], 'int_rate': [f['int_rate']],
+         'installment': [f['installment']], 'grade': [f['grade']], 'sub_grade': ['B1'],
+         'emp_length': [clean_emp_length_input(f['emp_length'])],
+         'home_ownership': [HOME_MAP[f['home_ownership']]], 'annual_inc': [f['annual_inc']],
+         'verification_status': [VERIF_MAP[f['verification_status']]], 'purpose': ['debt_consolidation'],
+         'dti': [f['dti']], 'revol_bal': [f['revol_bal']], 'revol_util': [40.0], 'total_acc': [f['total_acc']]})
+    df['loan_to_income'] = df['loan_amnt'] / (df['annual_inc'] + 1)
+    df['installment_to_income'] = df['installment'] / ((df['annual_inc'] / 12) + 1)
+    df['balance_income_ratio'] = df['revol_bal'] / (df['annual_inc'] + 1)
+    return df
+
+
+REFERENCE = {'lite': reference_lite, 'pro': reference_pro}
+
+
+def row_path(forms, kind):
+    """Başvuru başına eski form yolu; sonuç satırları alt alta eklenir."""
+    frames = [REFERENCE[kind](f) for f in forms.to_dict('records')]
+    return pd.concat(frames, ignore_index=True)
+
+
+def form_fields(forms, kind):
+    """Formda sorulan alanlar (Pro formunda purpose yok; PRO_DEFAULTS uygulanır)."""
+    if kind == 'lite':
+        return forms[['annual_inc', 'loan_amnt', 'term', 'grade', 'home_ownership', 'purpose', 'emp_length']]
+    return forms.drop(columns=['purpose'])
+
+
+def timed(fn, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', default='1000,100000,1000000')
+    parser.add_argument('--row-max-rows', type=int, default=10000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("KREDİ ÖZELLİK MÜHENDİSLİĞİ BENCHMARK'I")
+    print("=" * 80)
+    print(f"{'Model':>6} | {'Satır':>10} | {'row (sn)':>10} | {'vectorized (sn)':>15} | {'Hızlanma':>10}")
+    print("-" * 80)
+    for n_rows in [int(r) for r in args.rows.split(',')]:
+        forms = build_forms(n_rows)
+        for kind in REFERENCE:
+            fields = form_fields(forms, kind)
+            vec = timed(lambda: prepare_applications(fields, kind), args.repeat)
+            if n_rows <= args.row_max_rows:
+                row = timed(lambda: row_path(forms, kind), 1)
+                print(f"{kind:>6} | {n_rows:>10,} | {row:>10.3f} | {vec:>15.4f} | {row / vec:>9.0f}x")
+            else:
+                print(f"{kind:>6} | {n_rows:>10,} | {'-':>10} | {vec:>15.4f} | {'-':>10}")
+    print("=" * 80)
+
+
+if __name__ == '__main__':
+    main()
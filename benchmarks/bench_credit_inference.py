@@ -0,0 +1,142 @@
+"""
+Kredi Risk Çıkarım Benchmark'ı (Lite/Pro)
+Kredi modellerinin skorlamasını iki yolla karşılaştırır:
+
+- pipeline: eski yol; prepare_applications ile DataFrame + model.predict_proba
+  (ColumnTransformer -> seyrek matris -> XGBClassifier)
+- compiled: bankaci.inference.credit_scorer; prepare_application ile dict kayıt
+  (tekil) veya prepare_applications (toplu) + derlenmiş ön işleme + booster.inplace_predict
+
+Önce eşdeğerlik kontrol edilir: lending_club_cleaned.csv örneklerinde ve
+rastgele form girdilerinde iki yol her başvuruda birebir aynı olasılığı vermeli
+(tekil ve toplu; ayrıntılı testler tests/test_credit_inference.py'de). Sonra
+tekil başvuru için p50/p99 gecikme ve toplu skorlamada satır/sn ölçülür.
+
+Kazanç tekil başvurudadır (DataFrame ve transformer katmanı atlanır). Toplu
+skorlamada süreyi ağaç gezintisi belirler; derlenmiş yol burada ancak ~1.1x
+hızlıdır ve bu tablo bir iyileştirme iddiası değil, gerilemeye karşı kontroldür.
+
+Kullanım:
+    python benchmarks/bench_credit_inference.py
+    python benchmarks/bench_credit_inference.py --calls 5000 --rows 10000,1000000
+"""
+
+import argparse
+import os
+import sys
+import time
+import warnings
+
+import joblib
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_credit_features import build_forms, form_fields
+from bankaci.credit_features import prepare_application, prepare_applications
+from bankaci.inference import CompiledCreditModel, credit_scorer
+
+warnings.filterwarnings('ignore')
+
+MODEL_PATHS = {'lite': os.path.join(ROOT, 'credit_risk_lite_model.pkl'),
+               'pro': os.path.join(ROOT, 'credit_risk_model_20fold.pkl')}
+DATA_PATH = os.path.join(ROOT, 'lending_club_cleaned.csv')
+
+
+def pipeline_one(model, fields, kind):
+    return float(model.predict_proba(prepare_applications(pd.DataFrame([fields]), kind))[0][1])
+
+
+def compiled_one(scorer, fields, kind):
+    return scorer.predict_one(prepare_application(fields, kind))
+
+
+def check_equivalence(kind, model, scorer, samples, n_single=1000):
+    for name, raw in samples.items():
+        features = prepare_applications(raw, kind)
+        expected = model.predict_proba(features)[:, 1]
+        if not np.array_equal(scorer.predict(features), expected):
+            raise AssertionError(f"{kind}/{name}: toplu skorlar farklı")
+        records = raw.head(n_single).to_dict('records')
+        single = [compiled_one(scorer, fields, kind) for fields in records]
+        if not np.array_equal(np.array(single, dtype='float32'), expected[:len(records)]):
+            raise AssertionError(f"{kind}/{name}: tekil skorlar predict_proba ile aynı değil")
+        print(f"✅ {kind:<4} {name}: {len(records):,} tekil ve {len(raw):,} toplu skor birebir aynı")
+
+
+def latencies(fn, records):
+    times = np.empty(len(records))
+    for i, record in enumerate(records):
+        start = time.perf_counter()
+        fn(record)
+        times[i] = time.perf_counter() - start
+    return times * 1e6
+
+
+def timed(fn, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--calls', type=int, default=2000)
+    parser.add_argument('--rows', default='10000,100000,1000000')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    applications = pd.read_csv(DATA_PATH).drop(columns=['loan_status_binary'])
+    forms = build_forms(5000, seed=3)
+
+    print("=" * 80)
+    print("KREDİ RİSK ÇIKARIM BENCHMARK'I")
+    print("=" * 80)
+    models = {kind: joblib.load(path) for kind, path in MODEL_PATHS.items()}
+    scorers = {}
+    for kind, model in models.items():
+        scorers[kind] = credit_scorer(model)
+        if not isinstance(scorers[kind], CompiledCreditModel):
+            raise SystemExit(f"❌ {kind} modeli derlenemedi; pipeline yedeği kullanılıyor")
+        check_equivalence(kind, model, scorers[kind],
+                          {'lending_club_cleaned.csv': applications, 'form': form_fields(forms, kind)})
+
+    print()
+    print(f"{'Model':>6} | {'Yol':>10} | {'p50 (µs)':>10} | {'p99 (µs)':>10} | {'ortalama (µs)':>14}")
+    print("-" * 80)
+    for kind, model in models.items():
+        records = applications.sample(args.calls, replace=True, random_state=0).to_dict('records')
+        # Isınma (ilk çağrılardaki tek seferlik maliyetler ölçüme girmesin)
+        for fields in records[:50]:
+            pipeline_one(model, fields, kind)
+            compiled_one(scorers[kind], fields, kind)
+        pipeline = latencies(lambda r: pipeline_one(model, r, kind), records)
+        compiled = latencies(lambda r: compiled_one(scorers[kind], r, kind), records)
+        for name, times in (('pipeline', pipeline), ('compiled', compiled)):
+            print(f"{kind:>6} | {name:>10} | {np.percentile(times, 50):>10,.1f} | "
+                  f"{np.percentile(times, 99):>10,.1f} | {times.mean():>14,.1f}")
+        print(f"{kind:>6} | p50 hızlanma: {np.percentile(pipeline, 50) / np.percentile(compiled, 50):.0f}x")
+
+    print()
+    print(f"{'Model':>6} | {'Satır':>10} | {'pipeline (satır/sn)':>20} | {'compiled (satır/sn)':>20} | "
+          f"{'Hızlanma':>8}")
+    print("-" * 80)
+    for n_rows in [int(r) for r in args.rows.split(',')]:
+        batch = applications.sample(n_rows, replace=True, random_state=1).reset_index(drop=True)
+        for kind, model in models.items():
+            features = prepare_applications(batch, kind)
+            pipe = timed(lambda: model.predict_proba(features), args.repeat)
+            comp = timed(lambda: scorers[kind].predict(features), args.repeat)
+            print(f"{kind:>6} | {n_rows:>10,} | {n_rows / pipe:>20,.0f} | {n_rows / comp:>20,.0f} | "
+                  f"{pipe / comp:>7.1f}x")
+    print("=" * 80)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,196 @@
+"""
+Kredi Karar Önbelleği Benchmark'ı (LRU + TTL)
+Lite/Pro formlarındaki tekil skorlamayı iki yolla karşılaştırır:
+
+- uncached: her gönderimde prepare_application + derlenmiş skorlayıcı (credit_scorer)
+- cached: bankaci.decision_cache.CachedCreditScorer (aynı başvurunun tekrarı önbellekten)
+
+Önce doğruluk kontrol edilir:
+- önbellekten gelen skorlar önbelleksiz skorlarla birebir aynı,
+- Türkçe form etiketleri ve model değerleri (Kiracı / RENT, 36 / " 36 months") aynı kayda düşer,
+- TTL dolan kayıt yeniden hesaplanır, kapasite aşılınca en eski kullanılan kayıt çıkarılır,
+- model dosyası değişince kayıt defteri yeni hash'li, boş bir önbellek yükler.
+
+Sonra tekrar oranı farklı gönderim akışlarında çağrı başına gecikme ölçülür.
+
+Kullanım:
+    python benchmarks/bench_decision_cache.py
+    python benchmarks/bench_decision_cache.py --calls 20000 --repeat-ratios 0,0.5,0.9
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+import warnings
+
+import joblib
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_credit_features import build_forms, form_fields
+from bankaci.artifacts import LITE_MODEL_FILENAME, PRO_MODEL_FILENAME, build_registry
+from bankaci.credit_features import HOME_MAP, prepare_application
+from bankaci.decision_cache import CachedCreditScorer, LRUTTLCache
+from bankaci.manifest import file_sha256
+from bankaci.inference import credit_scorer
+
+warnings.filterwarnings('ignore')
+
+MODEL_FILES = {'lite': LITE_MODEL_FILENAME, 'pro': PRO_MODEL_FILENAME}
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def check_parity(scorers, n_rows=2000):
+    forms = build_forms(n_rows, seed=5)
+    for kind, scorer in scorers.items():
+        cached = CachedCreditScorer(scorer, 'test')
+        records = form_fields(forms, kind).to_dict('records')
+        # İkinci tur tamamen önbellekten gelir
+        for _ in range(2):
+            got = [cached.predict_one(prepare_application(fields, kind)) for fields in records]
+            expected = [scorer.predict_one(prepare_application(fields, kind)) for fields in records]
+            if got != expected:
+                raise AssertionError(f"{kind}: önbellekten gelen skorlar farklı")
+        stats = cached.stats()
+        if stats['hits'] < n_rows or stats['misses'] > n_rows:
+            raise AssertionError(f"{kind}: beklenmeyen isabet/ıska sayıları {stats}")
+    print(f"✅ Eşdeğerlik: {n_rows:,} başvuru x 2 tur, önbellekli ve önbelleksiz skorlar birebir aynı")
+
+
+def check_normalization(scorer):
+    cached = CachedCreditScorer(scorer, 'test')
+    form = {'annual_inc': 60000, 'loan_amnt': 10000.0, 'term': 36, 'grade': 'B', 'home_ownership': 'Kiracı',
+            'purpose': 'Araba', 'emp_length': '2 yıl'}
+    raw = {'annual_inc': 60000.0, 'loan_amnt': np.float64(10000), 'term': ' 36 months', 'grade': 'B',
+           'home_ownership': HOME_MAP['Kiracı'], 'purpose': 'car', 'emp_length': '2 years'}
+    cached.predict_one(prepare_application(form, 'lite'))
+    cached.predict_one(prepare_application(raw, 'lite'))
+    if cached.stats()['hits'] != 1 or len(cached.cache) != 1:
+        raise AssertionError("Form etiketi ve model değeri aynı anahtara düşmedi")
+    if cached.key(prepare_application(form, 'lite')) == CachedCreditScorer(scorer, 'other').key(
+            prepare_application(form, 'lite')):
+        raise AssertionError("Farklı model hash'i aynı anahtarı üretti")
+    print("✅ Normalizasyon: form etiketleri ve model değerleri aynı kayıt; model hash'i anahtarda")
+
+
+def check_lru_ttl():
+    clock = FakeClock()
+    cache = LRUTTLCache(maxsize=2, ttl=10, clock=clock)
+    calls = []
+    compute = lambda key: cache.get_or_compute(key, lambda: calls.append(key) or key)
+    compute('a'), compute('b'), compute('a')
+    compute('c')  # kapasite 2: en eski kullanılan 'b' çıkarılır
+    compute('a'), compute('b')
+    if calls != ['a', 'b', 'c', 'b'] or cache.evictions != 2:
+        raise AssertionError(f"LRU sırası hatalı: {calls}, çıkarılan {cache.evictions}")
+    clock.now = 10.0
+    compute('b')
+    if calls[-1] != 'b' or cache.expired != 1:
+        raise AssertionError("TTL dolan kayıt yeniden hesaplanmadı")
+    print("✅ LRU + TTL: en eski kullanılan kayıt çıkarılıyor, süresi dolan kayıt yeniden hesaplanıyor")
+
+
+def check_invalidation():
+    """Model dosyası değişince kayıt defteri yeni hash'li, boş bir önbellek yükler."""
+    root = tempfile.mkdtemp(prefix='decision_cache_')
+    try:
+        for filename in MODEL_FILES.values():
+            shutil.copy(os.path.join(ROOT, filename), os.path.join(root, filename))
+        registry = build_registry(root)
+        fields = form_fields(build_forms(1, seed=9), 'lite').to_dict('records')[0]
+        before = registry.get('lite_decisions')
+        before.predict_one(prepare_application(fields, 'lite'))
+        before.predict_one(prepare_application(fields, 'lite'))
+        pro_before = registry.get('pro_decisions')
+
+        # Aynı model, farklı baytlar (yeniden kaydetme) -> yeni hash
+        model_path = os.path.join(root, LITE_MODEL_FILENAME)
+        model = joblib.load(model_path)
+        model.steps[-1][1].set_params(n_jobs=2)
+        joblib.dump(model, model_path)
+        if not registry.check_for_changes():
+            raise AssertionError("Model dosyası değişikliği algılanmadı")
+        registry.wait_for_refresh()
+        after = registry.get('lite_decisions')
+        if after is before or after.model_hash == before.model_hash or len(after.cache) != 0:
+            raise AssertionError("Model değişince önbellek yenilenmedi")
+        if after.model_hash != file_sha256(model_path):
+            raise AssertionError("Önbellek hash'i yüklenen model dosyasına ait değil")
+        if registry.get('pro_decisions') is not pro_before:
+            raise AssertionError("Değişmeyen Pro modelinin önbelleği boşaltıldı")
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+    print("✅ Geçersiz kılma: Lite model dosyası değişince önbellek yeni hash ile boşaldı, Pro önbelleği korundu")
+
+
+def submission_stream(forms, n_calls, repeat_ratio, seed=0):
+    """Gönderimlerin repeat_ratio kadarı son 20 başvurudan birinin tekrarı."""
+    rng = np.random.default_rng(seed)
+    stream, recent, fresh = [], [], iter(forms)
+    for _ in range(n_calls):
+        if recent and rng.random() < repeat_ratio:
+            stream.append(recent[rng.integers(0, len(recent))])
+        else:
+            stream.append(next(fresh))
+            recent = (recent + [stream[-1]])[-20:]
+    return stream
+
+
+def latencies(fn, records):
+    times = np.empty(len(records))
+    for i, record in enumerate(records):
+        start = time.perf_counter()
+        fn(record)
+        times[i] = time.perf_counter() - start
+    return times * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--calls', type=int, default=5000)
+    parser.add_argument('--repeat-ratios', default='0,0.5,0.9')
+    args = parser.parse_args()
+
+    scorers = {kind: credit_scorer(joblib.load(os.path.join(ROOT, filename)))
+               for kind, filename in MODEL_FILES.items()}
+
+    print("=" * 80)
+    print("KREDİ KARAR ÖNBELLEĞİ BENCHMARK'I")
+    print("=" * 80)
+    check_parity(scorers)
+    check_normalization(scorers['lite'])
+    check_lru_ttl()
+    check_invalidation()
+
+    print(f"{'Model':>6} | {'Tekrar':>7} | {'uncached p50 (µs)':>18} | {'cached p50 (µs)':>16} | "
+          f"{'ortalama hızlanma':>17} | {'isabet':>7}")
+    print("-" * 80)
+    forms = build_forms(args.calls, seed=1)
+    for kind, scorer in scorers.items():
+        records = form_fields(forms, kind).to_dict('records')
+        for ratio in [float(r) for r in args.repeat_ratios.split(',')]:
+            stream = submission_stream(records, args.calls, ratio)
+            cached = CachedCreditScorer(scorer, 'bench')
+            uncached = latencies(lambda f: scorer.predict_one(prepare_application(f, kind)), stream)
+            with_cache = latencies(lambda f: cached.predict_one(prepare_application(f, kind)), stream)
+            print(f"{kind:>6} | {ratio:>7.0%} | {np.percentile(uncached, 50):>18,.1f} | "
+                  f"{np.percentile(with_cache, 50):>16,.1f} | {uncached.mean() / with_cache.mean():>16.1f}x | "
+                  f"{cached.stats()['hit_rate']:>7.0%}")
+    print("=" * 80)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,172 @@
+"""
+NBA Motoru Benchmark'ı
+Kampanya listesindeki öneri hesaplamasını iki yaklaşımla karşılaştırır:
+
+- apply: eski satır bazlı `df.apply(get_next_best_action, axis=1)` (tests/fixtures/nba_legacy.py)
+- vectorized: bankaci.nba.next_best_actions (toplu, dizi işlemleri)
+- top-3: bankaci.nba.ranked_offers (müşteri x teklif matrisi + kısmi sıralama)
+
+Önce eşdeğerlik kontrol edilir: aynı jitter dizisiyle iki yaklaşım her satırda
+aynı ürün, satış ihtimali, neden ve scripti vermeli (bilinmeyen segment, eksik
+segment sütunu ve eksik sütun durumları dahil). Boş (NaN) segment adında eski
+kod TypeError verdiğinden bu durum karşılaştırılmaz; motor onu segmentsiz sayar.
+Aynı eşdeğerlik tests/test_nba.py'de de test edilir.
+apply yavaş olduğundan sadece --apply-max-rows satıra kadar ölçülür.
+
+Kullanım:
+    python benchmarks/bench_nba.py
+    python benchmarks/bench_nba.py --rows 10000,1000000,10000000 --apply-max-rows 100000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'tests'))
+
+from bankaci.nba import (JITTER_MAX, JITTER_MIN, default_decision_table, next_best_actions, offer_matrix,
+                         ranked_offers)
+from bankaci.segmentation import SEGMENT_TEMPLATES
+from fixtures import nba_legacy
+
+CLUSTER_MAP = dict(enumerate(SEGMENT_TEMPLATES))
+OUTPUT_COLUMNS = ['Product', 'Prob', 'Reason', 'Script']
+
+
+def build_portfolio(n_rows, seed=42):
+    rng = np.random.default_rng(seed)
+    segments = np.array(SEGMENT_TEMPLATES + ["Bilinmiyor"], dtype=object)
+    return pd.DataFrame({
+        'User_ID': 1000000 + np.arange(n_rows),
+        'CreditScore': rng.integers(350, 851, size=n_rows),
+        'Age': rng.integers(18, 93, size=n_rows),
+        'Tenure': rng.integers(0, 11, size=n_rows),
+        'Balance': rng.choice([0.0, 4000.0, 15000.0, 45000.0, 80000.0, 150000.0], size=n_rows)
+                   + rng.integers(0, 3, size=n_rows) * 5000.0,
+        'NumOfProducts': rng.integers(1, 5, size=n_rows),
+        'HasCrCard': rng.integers(0, 2, size=n_rows),
+        'IsActiveMember': rng.integers(0, 2, size=n_rows),
+        'EstimatedSalary': rng.choice([20000.0, 30000.0, 45000.0, 55000.0, 70000.0, 120000.0], size=n_rows),
+        'Has_BES': rng.integers(0, 2, size=n_rows),
+        'Has_Kredi': rng.integers(0, 2, size=n_rows),
+        'Has_Yatirim': rng.integers(0, 2, size=n_rows),
+        'Spending_Score': rng.integers(1, 101, size=n_rows),
+        'Segment_Name': segments[rng.integers(0, len(segments), size=n_rows)],
+    })
+
+
+def reference_actions(df, jitter):
+    """Eski yol: satır başına get_next_best_action; random.randint sırayla verilen jitter'ı döndürür."""
+    nba_legacy.cluster_names_map = CLUSTER_MAP
+    values = iter(jitter.tolist())
+    original_randint = nba_legacy.random.randint
+    nba_legacy.random.randint = lambda a, b: next(values)
+    try:
+        def get_nba(row):
+            segment = row['Segment_Name'] if 'Segment_Name' in row.index else None
+            return pd.Series(nba_legacy.get_next_best_action(row, segment_name=segment))
+        return df.apply(get_nba, axis=1)[OUTPUT_COLUMNS]
+    finally:
+        nba_legacy.random.randint = original_randint
+
+
+def vectorized_actions(df, jitter):
+    segments = df['Segment_Name'] if 'Segment_Name' in df.columns else [None] * len(df)
+    return next_best_actions(df, segments, CLUSTER_MAP.values(), jitter=jitter)
+
+
+def check_equivalence(n_rows=20000):
+    rng = np.random.default_rng(7)
+    df = build_portfolio(n_rows, seed=7)
+    frames = {
+        'tam': df,
+        'Spending_Score/Tenure yok': df.drop(columns=['Spending_Score', 'Tenure']),
+        'segment yok': df.drop(columns=['Segment_Name']),
+    }
+    for name, frame in frames.items():
+        jitter = rng.integers(JITTER_MIN, JITTER_MAX + 1, size=len(frame))
+        expected = reference_actions(frame, jitter)
+        actual = vectorized_actions(frame, jitter)
+        for col in OUTPUT_COLUMNS:
+            mismatches = int((expected[col].astype(str).to_numpy() != actual[col].astype(str).to_numpy()).sum())
+            if mismatches:
+                raise AssertionError(f"{name}: {col} sütununda {mismatches} satır farklı")
+    print(f"✅ Eşdeğerlik: {n_rows:,} satır x {len(frames)} senaryo, 4 çıktı sütunu aynı")
+
+
+def check_determinism(n_rows=100000, n_shards=4):
+    """Varsayılan (hash'li) jitter: tekrar çalıştırmada ve parçalara bölünmüş hesaplamada aynı sonuç."""
+    df = build_portfolio(n_rows, seed=11)
+    full = next_best_actions(df, df['Segment_Name'], CLUSTER_MAP.values())
+    again = next_best_actions(df, df['Segment_Name'], CLUSTER_MAP.values())
+    shards = [next_best_actions(part, part['Segment_Name'], CLUSTER_MAP.values())
+              for part in (df.iloc[bounds] for bounds in np.array_split(np.arange(n_rows), n_shards))]
+    if not full['Prob'].equals(again['Prob']) or not pd.concat(shards)['Prob'].equals(full['Prob']):
+        raise AssertionError("Deterministik jitter tekrar/parça hesaplamasında farklı sonuç verdi")
+    print(f"✅ Deterministik jitter: {n_rows:,} satır, tekrar ve {n_shards} parçalı hesaplama aynı")
+
+
+def check_ranking(n_rows=2000, k=3):
+    """ranked_offers: kısmi sıralamalı top-k, tam sıralamayla (Python) bulunan top-k ile aynı olmalı (1. sıra NBA)."""
+    df = build_portfolio(n_rows, seed=13)
+    rule_ids = default_decision_table().column('id')
+    probs, eligible = offer_matrix(df, df['Segment_Name'], CLUSTER_MAP.values())
+    nba = next_best_actions(df, df['Segment_Name'], CLUSTER_MAP.values())['Rule'].astype(str).map(rule_ids.index)
+    offers = ranked_offers(df, df['Segment_Name'], CLUSTER_MAP.values(), k=k, chunk_size=n_rows // 3)
+    got = {}
+    for label, rule_id in zip(offers.index, offers['Rule'].astype(str)):
+        got.setdefault(label, []).append(rule_id)
+    for i, label in enumerate(df.index):
+        candidates = sorted((j for j in range(probs.shape[1]) if eligible[i, j]),
+                            key=lambda j: (j != nba.iloc[i], -probs[i, j], j))
+        if [rule_ids[j] for j in candidates[:k]] != got.get(label, []):
+            raise AssertionError(f"{label}. müşteride top-{k} teklif listesi farklı")
+    print(f"✅ Top-{k} teklif: {n_rows:,} müşteride kısmi sıralama tam sıralamayla aynı")
+
+
+def timed(fn, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', default='10000,1000000,10000000')
+    parser.add_argument('--apply-max-rows', type=int, default=100000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("NBA MOTORU BENCHMARK'I")
+    print("=" * 80)
+    check_equivalence()
+    check_determinism()
+    check_ranking()
+    print(f"{'Satır':>12} | {'apply (sn)':>12} | {'vectorized (sn)':>15} | {'Hızlanma':>10} | {'top-3 (sn)':>10}")
+    print("-" * 80)
+    for n_rows in [int(r) for r in args.rows.split(',')]:
+        df = build_portfolio(n_rows)
+        jitter = np.zeros(n_rows, dtype=np.int64)
+        # Motor varsayılan (User_ID'den hash'li) jitter ile ölçülür
+        vec = timed(lambda: vectorized_actions(df, None), args.repeat)
+        top3 = timed(lambda: ranked_offers(df, df['Segment_Name'], CLUSTER_MAP.values(), k=3), args.repeat)
+        if n_rows <= args.apply_max_rows:
+            row = timed(lambda: reference_actions(df, jitter), 1)
+            print(f"{n_rows:>12,} | {row:>12.3f} | {vec:>15.4f} | {row / vec:>9.0f}x | {top3:>10.4f}")
+        else:
+            print(f"{n_rows:>12,} | {'-':>12} | {vec:>15.4f} | {'-':>10} | {top3:>10.4f}")
+    print("=" * 80)
+
+
+if __name__ == '__main__':
+    main()
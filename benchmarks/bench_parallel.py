@@ -0,0 +1,100 @@
+"""
+Çok Süreçli Portföy Skorlama Benchmark'ı
+bankaci.parallel.ParallelPortfolioScorer ile churn olasılığı + strateji + NBA
+skorlamasının 1..N işçi süreçte ölçeklenmesini ölçer. Havuz başlatma (süreç
+açılışı + model yükleme, bir kez) ve sıcak havuzla skorlama ayrı raporlanır.
+
+Önce eşdeğerlik kontrol edilir: çok süreçli sonuç (küçük parçalarla) tek
+süreçli sonuçla ve churn_model.predict_proba ile aynı olmalı, sıra korunmalı.
+Ölçekleme eğrisi makinedeki çekirdek sayısıyla sınırlıdır; işçi x thread
+bütçesi çekirdek sayısını aşan ölçümler oversubscription etkisini gösterir.
+
+Kullanım:
+    python benchmarks/bench_parallel.py
+    python benchmarks/bench_parallel.py --rows 2000000 --max-workers 8 --threads-per-worker 1
+"""
+
+import argparse
+import os
+import sys
+import time
+import warnings
+
+import joblib
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from bankaci.parallel import ParallelPortfolioScorer, default_workers, score_portfolio_parallel
+from bankaci.segmentation import SEGMENT_TEMPLATES
+
+warnings.filterwarnings('ignore')
+
+MODEL_PATH = os.path.join(ROOT, 'churn_model_v1.pkl')
+DATA_PATH = os.path.join(ROOT, 'churn_processed_data_with_rational_salary.csv')
+
+
+def build_portfolio(n_rows, seed=42):
+    """İşlenmiş churn verisini n_rows satıra çoğaltıp segment/ürün sütunlarını ekler (df_churn biçimi)."""
+    rng = np.random.default_rng(seed)
+    base = pd.read_csv(DATA_PATH)
+    df = base.iloc[np.arange(n_rows) % len(base)].reset_index(drop=True)
+    df['User_ID'] = 1000000 + np.arange(n_rows)
+    df['Spending_Score'] = rng.integers(1, 101, size=n_rows)
+    df['Has_Vadesiz'] = 1
+    for col in ('Has_BES', 'Has_Kredi', 'Has_Yatirim'):
+        df[col] = rng.integers(0, 2, size=n_rows)
+    df['Segment_Name'] = np.array(SEGMENT_TEMPLATES, dtype=object)[rng.integers(0, len(SEGMENT_TEMPLATES), n_rows)]
+    return df
+
+
+def check_equivalence(n_rows=60000):
+    df = build_portfolio(n_rows, seed=7)
+    single = score_portfolio_parallel(df, MODEL_PATH, workers=1)
+    multi = score_portfolio_parallel(df, MODEL_PATH, workers=2, threads_per_worker=1, shard_size=7000)
+    if not single.equals(multi) or not multi.index.equals(df.index):
+        raise AssertionError("Çok süreçli sonuç tek süreçli sonuçtan farklı")
+    expected = joblib.load(MODEL_PATH).predict_proba(df)[:, 1]
+    if not np.array_equal(multi['Risk_Probability'].to_numpy(), expected):
+        raise AssertionError("Risk olasılıkları predict_proba ile aynı değil")
+    print(f"✅ Eşdeğerlik: {n_rows:,} satır, 2 işçi x 9 parça = tek süreç = predict_proba")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=1000000)
+    parser.add_argument('--max-workers', type=int, default=max(2, default_workers()))
+    parser.add_argument('--threads-per-worker', type=int, default=1)
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("ÇOK SÜREÇLİ PORTFÖY SKORLAMA BENCHMARK'I")
+    print("=" * 80)
+    print(f"   Çekirdek: {default_workers()} | İşçi başına thread: {args.threads_per_worker}")
+    check_equivalence()
+    df = build_portfolio(args.rows)
+    print(f"{'İşçi':>6} | {'Başlatma (sn)':>13} | {'Skorlama (sn)':>13} | {'Satır/sn':>12} | {'Hızlanma':>9} | "
+          f"{'Verim':>6}")
+    print("-" * 80)
+    baseline = None
+    for workers in range(1, args.max_workers + 1):
+        start = time.perf_counter()
+        with ParallelPortfolioScorer(MODEL_PATH, workers=workers,
+                                     threads_per_worker=args.threads_per_worker) as scorer:
+            # Her işçiyi ısıt (süreç açılışı + model yükleme ölçüme girmesin)
+            scorer.score(df.iloc[:workers * 1000], shard_size=1000)
+            startup = time.perf_counter() - start
+            start = time.perf_counter()
+            scorer.score(df)
+            elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        speedup = baseline / elapsed
+        print(f"{workers:>6} | {startup:>13.2f} | {elapsed:>13.2f} | {args.rows / elapsed:>12,.0f} | "
+              f"{speedup:>8.2f}x | {speedup / workers:>5.0%}")
+    print("=" * 80)
+
+
+if __name__ == '__main__':
+    main()
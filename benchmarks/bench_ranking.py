@@ -0,0 +1,157 @@
+"""
+Risk Listesi / Risk Aralığı Benchmark'ı
+"📋 Toplu Risk Listesi" sekmesindeki top-N listesini iki yaklaşımla karşılaştırır:
+
+- sort: eski yol; her yeniden çalıştırmada portföy kopyası + tüm portföy için
+  strateji + `sort_values('Risk_Probability').head(top_n)`
+- ranking: bankaci.scoring.RiskRanking; sıralama ve stratejiler skor sürümü
+  başına bir kez kurulur, top-N dizi dilimiyle bulunur
+
+Ayrıca rastgele churn müşterisi seçimini karşılaştırır:
+
+- mask: eski yol; her tıklamada tüm portföyde aralık maskesi + flatnonzero
+- bands: bankaci.scoring.RiskBandIndex; ikili arama + tek rastgele sayı
+
+Önce eşdeğerlik kontrol edilir: her N için iki yaklaşım aynı müşterileri aynı
+sırada ve aynı stratejiyle vermeli; risk aralığı
+indeksi maskeyle aynı müşteri kümesini kapsamalı ve aynı tohumla aynı
+müşteri sırasını vermeli.
+
+Kullanım:
+    python benchmarks/bench_ranking.py
+    python benchmarks/bench_ranking.py --rows 10000,1000000 --top-n 10,1000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from bankaci.scoring import RiskBandIndex, RiskRanking
+from bankaci.strategy import STRATEGIES, assign_strategies, portfolio_strategy_codes
+
+
+def build_portfolio(n_rows, seed=42):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        'User_ID': 1000000 + np.arange(n_rows),
+        'Balance': rng.choice([0.0, 25000.0, 75000.0, 150000.0], size=n_rows) + rng.random(n_rows) * 1000,
+        'NumOfProducts': rng.integers(1, 5, size=n_rows),
+        'IsActiveMember': rng.integers(0, 2, size=n_rows),
+        'Age': rng.integers(18, 90, size=n_rows),
+    })
+    # Eşit skorlar (yuvarlanmış olasılıklar) sıralamanın kararlılığını da sınar
+    scores = np.round(rng.random(n_rows), 3)
+    return df, scores
+
+
+def sort_top(df, scores, top_n):
+    """Eski yol: kopya + tüm portföy stratejisi + tam sıralama."""
+    df_res = df.copy()
+    df_res['Risk_Probability'] = scores
+    df_res['Strategy'] = assign_strategies(df_res)
+    return df_res.sort_values('Risk_Probability', ascending=False, kind='stable').head(top_n)
+
+
+def build_ranking(df, scores):
+    return RiskRanking(scores, portfolio_strategy_codes(df, scores))
+
+
+def ranking_top(df, ranking, top_n):
+    positions = ranking.top(top_n)
+    df_top = df.iloc[positions].assign(Risk_Probability=ranking.scores[positions])
+    df_top['Strategy'] = pd.Categorical.from_codes(ranking.strategy_codes[positions], categories=STRATEGIES)
+    return df_top
+
+
+def check_equivalence(n_rows=50000):
+    df, scores = build_portfolio(n_rows, seed=7)
+    scores[::97] = np.nan
+    ranking = build_ranking(df, scores)
+    for top_n in (0, 1, 10, 1000, n_rows + 5):
+        expected = sort_top(df, scores, top_n)
+        actual = ranking_top(df, ranking, top_n)
+        if (not expected.index.equals(actual.index)
+                or not expected['Strategy'].astype(str).equals(actual['Strategy'].astype(str))):
+            raise AssertionError(f"top_n={top_n}: liste farklı")
+    print(f"✅ Eşdeğerlik: {n_rows:,} satır, 5 farklı N (eşit skor/NaN dahil) aynı")
+
+
+RISK_RANGES = [(0, 20), (81, 100), (21, 40), (61, 80), (41, 60)]
+
+
+def mask_sample(risk_percent, low, high, rng):
+    """Eski yol: aralık maskesi + rastgele konum."""
+    positions = np.flatnonzero((risk_percent >= low) & (risk_percent <= high))
+    return int(positions[rng.integers(len(positions))]) if len(positions) else None
+
+
+def check_bands(n_rows=50000):
+    _, scores = build_portfolio(n_rows, seed=9)
+    scores[::89] = np.nan
+    risk_percent = scores * 100
+    bands = RiskBandIndex(risk_percent)
+    for low, high in RISK_RANGES + [(20.5, 20.9), (-np.inf, np.inf)]:
+        start, stop = bands.band(low, high)
+        expected = np.flatnonzero((risk_percent >= low) & (risk_percent <= high))
+        if not np.array_equal(np.sort(bands.positions[start:stop]), expected):
+            raise AssertionError(f"[{low}-{high}] aralığında müşteri kümesi farklı")
+    first = [bands.sample(low, high, 123) for low, high in RISK_RANGES]
+    rng_a, rng_b = np.random.default_rng(5), np.random.default_rng(5)
+    seq_a = [bands.sample(low, high, rng_a) for low, high in RISK_RANGES * 4]
+    seq_b = [bands.sample(low, high, rng_b) for low, high in RISK_RANGES * 4]
+    if first != [bands.sample(low, high, 123) for low, high in RISK_RANGES] or seq_a != seq_b:
+        raise AssertionError("Aynı tohumla farklı müşteri sırası")
+    print(f"✅ Risk aralığı indeksi: {n_rows:,} satır, maskeyle aynı küme, tohumla tekrarlanabilir seçim")
+
+
+def timed(fn, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', default='10000,1000000')
+    parser.add_argument('--top-n', default='10,100,1000')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("RİSK LİSTESİ / RİSK ARALIĞI BENCHMARK'I")
+    print("=" * 80)
+    check_equivalence()
+    check_bands()
+    print(f"{'Satır':>10} | {'N':>5} | {'sort (sn)':>10} | {'ranking (sn)':>12} | {'Hızlanma':>9}")
+    print("-" * 80)
+    for n_rows in [int(r) for r in args.rows.split(',')]:
+        df, scores = build_portfolio(n_rows)
+        build = timed(lambda: build_ranking(df, scores), 1)
+        ranking = build_ranking(df, scores)
+        for top_n in [int(n) for n in args.top_n.split(',')]:
+            old = timed(lambda: sort_top(df, scores, top_n), args.repeat)
+            new = timed(lambda: ranking_top(df, ranking, top_n), args.repeat)
+            print(f"{n_rows:>10,} | {top_n:>5} | {old:>10.4f} | {new:>12.6f} | {old / new:>8.0f}x")
+        print(f"{'':>10}   sıralama kurulumu (skor sürümü başına bir kez): {build:.4f} sn")
+        risk_percent = scores * 100
+        bands = RiskBandIndex(risk_percent)
+        rng = np.random.default_rng(0)
+        old = timed(lambda: [mask_sample(risk_percent, low, high, rng) for low, high in RISK_RANGES], args.repeat)
+        new = timed(lambda: [bands.sample(low, high, rng) for low, high in RISK_RANGES], args.repeat)
+        print(f"{'':>10}   rastgele müşteri (5 aralık): mask {old / 5 * 1e6:,.0f} µs, bands {new / 5 * 1e6:,.1f} µs"
+              f" / seçim ({old / new:.0f}x)")
+    print("=" * 80)
+
+
+if __name__ == '__main__':
+    main()
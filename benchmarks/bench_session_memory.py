@@ -0,0 +1,118 @@
+"""
+Oturum Başına Bellek Benchmark'ı
+1, 10 ve 100 eşzamanlı oturum açıldığında RSS artışını iki yaklaşım için ölçer:
+
+- session_copy: her oturum skorlu portföyün kendi kopyasını session_state'te tutar
+  (eski `df_churn_with_risk` davranışı; her tıklamada Risk_Percent eklenir)
+- shared: skorlu portföy süreç genelinde tek kopya; oturumda sadece sayaç tutulur
+
+Her ölçüm ayrı bir Python sürecinde yapılır.
+
+Kullanım:
+    python benchmarks/bench_session_memory.py
+    python benchmarks/bench_session_memory.py --rows 100000 --sessions 1,10,100
+"""
+
+import argparse
+import gc
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from bench_snapshot import _rss_mb, build_frame
+
+RISK_RANGES = [(0, 20), (81, 100), (21, 40), (61, 80), (41, 60)]
+
+
+def click_session_copy(session, df, scores, rng):
+    # Eski davranış: oturum başına tam kopya + her tıklamada yerinde sütun ekleme
+    if 'df_churn_with_risk' not in session:
+        df_with_risk = df.copy()
+        df_with_risk['Risk_Probability'] = scores
+        session['df_churn_with_risk'] = df_with_risk
+    df_with_risk = session['df_churn_with_risk']
+    df_with_risk['Risk_Percent'] = df_with_risk['Risk_Probability'] * 100
+    min_risk, max_risk = RISK_RANGES[session.get('churn_range_index', 0)]
+    session['churn_range_index'] = (session.get('churn_range_index', 0) + 1) % len(RISK_RANGES)
+    filtered = df_with_risk[(df_with_risk['Risk_Percent'] >= min_risk) & (df_with_risk['Risk_Percent'] <= max_risk)]
+    return filtered.sample(n=1, random_state=int(rng.integers(1 << 31))).iloc[0]
+
+
+def click_shared(session, scored, rng):
+    # Yeni davranış: paylaşılan frame üzerinde pozisyon seçimi, oturumda sadece sayaç
+    import numpy as np
+
+    min_risk, max_risk = RISK_RANGES[session.get('churn_range_index', 0)]
+    session['churn_range_index'] = (session.get('churn_range_index', 0) + 1) % len(RISK_RANGES)
+    risk_percent = scored['Risk_Percent'].to_numpy()
+    positions = np.flatnonzero((risk_percent >= min_risk) & (risk_percent <= max_risk))
+    return scored.iloc[positions[rng.integers(len(positions))]]
+
+
+def child(mode, path, n_sessions):
+    import numpy as np
+    from bankaci.scoring import scored_portfolio
+    from bankaci.snapshot import read_snapshot
+
+    rng = np.random.default_rng(0)
+    df = read_snapshot(path)
+    scores = rng.random(len(df))
+    shared = scored_portfolio(df, scores) if mode == 'shared' else None
+    gc.collect()
+    base_rss = _rss_mb()
+
+    sessions = [{} for _ in range(n_sessions)]
+    for session in sessions:
+        if mode == 'shared':
+            click_shared(session, shared, rng)
+        else:
+            click_session_copy(session, df, scores, rng)
+    gc.collect()
+    print(json.dumps({'rss_mb': _rss_mb() - base_rss,
+                      'frame_mb': df.memory_usage(deep=True).sum() / 1024 / 1024}))
+
+
+def measure(mode, path, n_sessions):
+    out = subprocess.run([sys.executable, os.path.abspath(__file__), '--child', mode, path, str(n_sessions)],
+                         check=True, capture_output=True, text=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', type=int, default=10000)
+    parser.add_argument('--sessions', default='1,10,100')
+    parser.add_argument('--child', nargs=3, metavar=('MODE', 'PATH', 'SESSIONS'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        mode, path, n_sessions = args.child
+        child(mode, path, int(n_sessions))
+        return
+
+    from bankaci.snapshot import write_snapshot
+
+    print("=" * 80)
+    print("OTURUM BAŞINA BELLEK BENCHMARK'I")
+    print("=" * 80)
+    with tempfile.TemporaryDirectory() as tmp:
+        snap_path = os.path.join(tmp, 'churn.parquet')
+        frame_mb = write_snapshot(build_frame(args.rows), snap_path).memory_usage(deep=True).sum() / 1024 / 1024
+        print(f"Portföy: {args.rows:,} satır, {frame_mb:.1f} MB")
+        print(f"{'Oturum':>8} | {'Yaklaşım':>14} | {'RSS artışı (MB)':>15} | {'Oturum başına (MB)':>18}")
+        print("-" * 80)
+        for n_sessions in [int(s) for s in args.sessions.split(',')]:
+            for mode in ('session_copy', 'shared'):
+                r = measure(mode, snap_path, n_sessions)
+                print(f"{n_sessions:>8} | {mode:>14} | {r['rss_mb']:>15.1f} | {r['rss_mb'] / n_sessions:>18.3f}")
+    print("=" * 80)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,122 @@
+"""
+Snapshot vs CSV Soğuk Yükleme Benchmark'ı
+İşlenmiş churn veri setinin CSV (pd.read_csv) ve Parquet snapshot (read_snapshot)
+ile yüklenme süresini ve bellek kullanımını (RSS) karşılaştırır.
+
+Her ölçüm ayrı bir Python sürecinde yapılır (soğuk başlangıç).
+
+Kullanım:
+    python benchmarks/bench_snapshot.py
+    python benchmarks/bench_snapshot.py --rows 10000,1000000
+"""
+
+import argparse
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+RAW_FILE = os.path.join(ROOT, 'churn_processed_data_with_rational_salary.csv')
+SEGMENTS = ["💎 Elit / Servet Yönetimi", "🚀 Dinamik / Aktif Müşteri", "💰 Güvenli / Birikimci",
+            "⚠️ Riskli / Pasif Müşteri", "🌱 Temel Mevduat / Giriş", "📊 Standart Bankacılık"]
+
+
+def _rss_mb():
+    # Linux'ta anlık RSS /proc'tan okunur; ru_maxrss fork/exec sonrası ebeveynin tepe değerini taşır
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS byte, diğerleri KB döndürür
+    return peak / 1024 / 1024 if sys.platform == 'darwin' else peak / 1024
+
+
+def build_frame(n_rows, seed=42):
+    """Ham churn verisini n_rows satıra çoğaltıp işlenmiş veri setinin sütunlarını ekler."""
+    import numpy as np
+    import pandas as pd
+
+    raw = pd.read_csv(RAW_FILE)
+    rng = np.random.default_rng(seed)
+    df = raw.iloc[rng.integers(0, len(raw), size=n_rows)].reset_index(drop=True)
+    df['Spending_Score'] = rng.integers(1, 101, size=n_rows)
+    df['Has_Vadesiz'] = 1
+    for col in ['Has_BES', 'Has_Kredi', 'Has_Yatirim']:
+        df[col] = rng.integers(0, 2, size=n_rows)
+    df['Cluster_Label'] = rng.integers(0, 6, size=n_rows)
+    df['Segment_Name'] = np.array(SEGMENTS, dtype=object)[df['Cluster_Label'].to_numpy()]
+    df.insert(0, 'User_ID', 1000000 + np.arange(n_rows))
+    return df
+
+
+def child(fmt, path):
+    import pandas as pd
+    from bankaci.snapshot import read_snapshot
+
+    base_rss = _rss_mb()
+    start = time.perf_counter()
+    if fmt == 'csv':
+        df = pd.read_csv(path)
+    else:
+        df = read_snapshot(path)
+    seconds = time.perf_counter() - start
+    print(json.dumps({
+        'seconds': seconds,
+        'rss_mb': _rss_mb() - base_rss,
+        'frame_mb': df.memory_usage(deep=True).sum() / 1024 / 1024,
+    }))
+
+
+def measure(fmt, path):
+    out = subprocess.run([sys.executable, os.path.abspath(__file__), '--child', fmt, path],
+                         check=True, capture_output=True, text=True)
+    return json.loads(out.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', default='10000,1000000,10000000')
+    parser.add_argument('--child', nargs=2, metavar=('FORMAT', 'PATH'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(*args.child)
+        return
+
+    from bankaci.snapshot import write_snapshot
+
+    print("=" * 80)
+    print("SNAPSHOT vs CSV SOĞUK YÜKLEME BENCHMARK'I")
+    print("=" * 80)
+    print(f"{'Satır':>12} | {'Format':>8} | {'Süre (s)':>9} | {'RSS artışı (MB)':>15} | {'Frame (MB)':>10} | {'Dosya (MB)':>10}")
+    print("-" * 80)
+    with tempfile.TemporaryDirectory() as tmp:
+        for n_rows in [int(r) for r in args.rows.split(',')]:
+            df = build_frame(n_rows)
+            csv_path = os.path.join(tmp, f'churn_{n_rows}.csv')
+            snap_path = os.path.join(tmp, f'churn_{n_rows}.parquet')
+            df.to_csv(csv_path, index=False)
+            write_snapshot(df, snap_path)
+            del df
+            for fmt, path in [('csv', csv_path), ('snapshot', snap_path)]:
+                r = measure(fmt, path)
+                size_mb = os.path.getsize(path) / 1024 / 1024
+                print(f"{n_rows:>12,} | {fmt:>8} | {r['seconds']:>9.3f} | {r['rss_mb']:>15.1f} | "
+                      f"{r['frame_mb']:>10.1f} | {size_mb:>10.1f}")
+            os.remove(csv_path)
+            os.remove(snap_path)
+    print("=" * 80)
+
+
+if __name__ == '__main__':
+    main()
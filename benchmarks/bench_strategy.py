@@ -0,0 +1,98 @@
+"""
+Strateji Motoru Benchmark'ı
+Toplu risk listesindeki strateji atamasını iki yaklaşımla karşılaştırır:
+
+- apply: eski satır bazlı `df.apply(advanced_strategy, axis=1)` (tests/fixtures/strategy_legacy.py)
+- vectorized: bankaci.strategy.assign_strategies (tek vektörel geçiş)
+
+Önce eşdeğerlik kontrol edilir: eşik değerleri (0.40/0.60, 50K/100K, 3 ürün,
+35 yaş) ve NaN içeren rastgele portföyde iki yaklaşım aynı stratejiyi vermeli.
+Aynı eşdeğerlik tests/test_strategy.py'de de test edilir.
+apply çok yavaş olduğundan sadece --apply-max-rows satıra kadar ölçülür.
+
+Kullanım:
+    python benchmarks/bench_strategy.py
+    python benchmarks/bench_strategy.py --rows 10000,1000000,10000000 --apply-max-rows 1000000
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, 'tests'))
+
+from bankaci.strategy import assign_strategies
+from fixtures.strategy_legacy import advanced_strategy
+
+
+def build_portfolio(n_rows, seed=42, with_edges=False):
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        'Risk_Probability': rng.random(n_rows),
+        'Balance': rng.choice([0.0, 25000.0, 75000.0, 150000.0], size=n_rows) + rng.random(n_rows) * 1000,
+        'NumOfProducts': rng.integers(1, 5, size=n_rows),
+        'IsActiveMember': rng.integers(0, 2, size=n_rows),
+        'Age': rng.integers(18, 90, size=n_rows).astype('float64'),
+    })
+    if with_edges:
+        # Eşik değerleri tam sınırda ve eksik değerler
+        n_edge = max(1, n_rows // 10)
+        idx = rng.choice(n_rows, size=n_edge, replace=False)
+        df.loc[idx, 'Risk_Probability'] = rng.choice([0.40, 0.60, np.nan], size=n_edge)
+        df.loc[idx, 'Balance'] = rng.choice([50000.0, 100000.0, np.nan], size=n_edge)
+        df.loc[idx, 'Age'] = rng.choice([35.0, np.nan], size=n_edge)
+    return df
+
+
+def check_equivalence(n_rows=20000):
+    df = build_portfolio(n_rows, seed=7, with_edges=True)
+    for frame in (df, df.drop(columns=['Age'])):
+        expected = frame.apply(advanced_strategy, axis=1).to_numpy()
+        actual = assign_strategies(frame).astype(str).to_numpy()
+        mismatches = int((expected != actual).sum())
+        if mismatches:
+            raise AssertionError(f"{mismatches} satırda strateji farklı")
+    print(f"✅ Eşdeğerlik: {n_rows:,} satır (eşik/NaN/yaşsız dahil) iki yaklaşımda aynı")
+
+
+def timed(fn, repeat):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--rows', default='10000,1000000,10000000')
+    parser.add_argument('--apply-max-rows', type=int, default=1000000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    print("=" * 80)
+    print("STRATEJİ MOTORU BENCHMARK'I")
+    print("=" * 80)
+    check_equivalence()
+    print(f"{'Satır':>12} | {'apply (sn)':>12} | {'vectorized (sn)':>15} | {'Hızlanma':>10}")
+    print("-" * 80)
+    for n_rows in [int(r) for r in args.rows.split(',')]:
+        df = build_portfolio(n_rows)
+        vec = timed(lambda: assign_strategies(df), args.repeat)
+        if n_rows <= args.apply_max_rows:
+            row = timed(lambda: df.apply(advanced_strategy, axis=1), 1)
+            print(f"{n_rows:>12,} | {row:>12.3f} | {vec:>15.4f} | {row / vec:>9.0f}x")
+        else:
+            print(f"{n_rows:>12,} | {'-':>12} | {vec:>15.4f} | {'-':>10}")
+    print("=" * 80)
+
+
+if __name__ == '__main__':
+    main()
@@ -4,6 +4,8 @@ XGBoost Classifier - 8 değişken (7 temel + 1 türetilmiş)
 Hızlı ön tarama için optimize edilmiş model
 """
 
+import os
+import sys
 import pandas as pd
 import numpy as np
 import joblib
@@ -15,6 +17,10 @@ from sklearn.metrics import accuracy_score, roc_auc_score, precision_score, reca
 import warnings
 warnings.filterwarnings('ignore')
 
+# Türetilmiş oranlar app.py ve toplu skorlama ile ortak (bankaci/credit_features.py)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from bankaci.credit_features import add_ratio_features
+
 print("=" * 80)
 print("CREDIT RISK LITE MODEL EĞİTİMİ")
 print("=" * 80)
@@ -32,7 +38,7 @@ print()
 print(">>> [2/6] Özellik mühendisliği yapılıyor...")
 
 # Türetilmiş özellik: loan_to_income
-df['loan_to_income'] = df['loan_amnt'] / (df['annual_inc'] + 1)
+df = add_ratio_features(df)
 
 # Lite Model için 8 değişken seçimi (7 temel + 1 türetilmiş)
 lite_features = [
@@ -4,6 +4,8 @@ XGBoost Classifier - 16 değişken (13 temel + 3 türetilmiş)
 Detaylı risk analizi için optimize edilmiş model
 """
 
+import os
+import sys
 import pandas as pd
 import numpy as np
 import joblib
@@ -15,6 +17,10 @@ from sklearn.metrics import accuracy_score, roc_auc_score, precision_score, reca
 import warnings
 warnings.filterwarnings('ignore')
 
+# Türetilmiş oranlar app.py ve toplu skorlama ile ortak (bankaci/credit_features.py)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from bankaci.credit_features import add_ratio_features
+
 print("=" * 80)
 print("CREDIT RISK PRO MODEL EĞİTİMİ")
 print("=" * 80)
@@ -31,10 +37,8 @@ print()
 # --- 2. ÖZELLİK MÜHENDİSLİĞİ (FEATURE ENGINEERING) ---
 print(">>> [2/6] Özellik mühendisliği yapılıyor...")
 
-# Türetilmiş özellikler
-df['loan_to_income'] = df['loan_amnt'] / (df['annual_inc'] + 1)
-df['installment_to_income'] = df['installment'] / ((df['annual_inc'] / 12) + 1)  # PTI - Payment-to-Income
-df['balance_income_ratio'] = df['revol_bal'] / (df['annual_inc'] + 1)
+# Türetilmiş özellikler (loan_to_income, installment_to_income (PTI), balance_income_ratio)
+df = add_ratio_features(df)
 
 # Pro Model için 16 değişken seçimi (13 temel + 3 türetilmiş)
 pro_features = [
@@ -4,15 +4,20 @@ K-Means Clustering - 6 küme
 Müşteri segmentasyonu için optimize edilmiş model
 """
 
+import os
+import sys
 import pandas as pd
 import numpy as np
 import joblib
-from sklearn.cluster import KMeans
 from sklearn.preprocessing import MinMaxScaler
-from sklearn.metrics import silhouette_score
 import warnings
 warnings.filterwarnings('ignore')
 
+# Kümeleme ve segment isimlendirme app.py ile ortak (bankaci/segmentation.py)
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+from bankaci.segmentation import (SEGMENTATION_FEATURES, N_CLUSTERS, N_INIT, MAX_ITER,
+                                  fit_kmeans, name_clusters, sample_silhouette)
+
 print("=" * 80)
 print("NBA K-MEANS CLUSTERING MODEL EĞİTİMİ")
 print("K-Means Clustering - 6 Küme")
@@ -31,7 +36,7 @@ print()
 print(">>> [2/5] Özellik seçimi yapılıyor...")
 
 # K-Means için seçilen özellikler
-features = ['Balance', 'EstimatedSalary', 'NumOfProducts', 'Tenure', 'IsActiveMember']
+features = list(SEGMENTATION_FEATURES)
 
 X = df[features].copy()
 
@@ -80,11 +85,7 @@ print()
 # --- 4. K-MEANS CLUSTERING ---
 print(">>> [4/5] K-Means clustering yapılıyor...")
 
-# K-Means parametreleri
-N_CLUSTERS = 6
-N_INIT = 10000  # 10,000 farklı başlangıç noktası
-MAX_ITER = 300
-
+# K-Means parametreleri (N_CLUSTERS, N_INIT, MAX_ITER) bankaci/segmentation.py'den
 print(f"   Parametreler:")
 print(f"     n_clusters: {N_CLUSTERS}")
 print(f"     n_init: {N_INIT} (10,000 farklı başlangıç noktası)")
@@ -92,19 +93,8 @@ print(f"     max_iter: {MAX_ITER}")
 print()
 print("   Model eğitiliyor (bu işlem biraz zaman alabilir)...")
 
-# K-Means modeli
-kmeans = KMeans(
-    n_clusters=N_CLUSTERS,
-    n_init=N_INIT,
-    max_iter=MAX_ITER,
-    n_jobs=-1
-)
-
-# Model eğitimi
-kmeans.fit(X_scaled)
-
-# Küme etiketleri
-cluster_labels = kmeans.predict(X_scaled)
+# K-Means modeli + eğitim + küme etiketleri (app.py ile aynı ayarlar)
+kmeans, cluster_labels = fit_kmeans(X_scaled, n_init=N_INIT)
 df['Cluster_Label'] = cluster_labels
 
 print("   Eğitim tamamlandı!")
@@ -114,8 +104,7 @@ print()
 print(">>> [5/5] Model doğrulama (Silhouette Score)...")
 
 # Silhouette Score hesaplama (örneklem boyutu sınırlı)
-sample_size = min(2000, len(X_scaled))
-sil_score = silhouette_score(X_scaled[:sample_size], cluster_labels[:sample_size])
+sil_score = sample_silhouette(X_scaled, cluster_labels)
 
 print(f"   Silhouette Score: {sil_score:.4f}")
 print(f"   Yorumlama:")
@@ -151,29 +140,8 @@ for i in range(N_CLUSTERS):
         'centroid': centroids[i]
     }
 
-# Segment isimlendirme (centroid analizine göre)
-cluster_scores = []
-for i in range(N_CLUSTERS):
-    stats = segment_stats[i]
-    center = centroids[i]
-    total_score = (center[0] * 0.3 + center[1] * 0.3 + center[2] * 0.2 + 
-                  center[3] * 0.1 + center[4] * 0.1)
-    cluster_scores.append((i, total_score, stats))
-
-cluster_scores.sort(key=lambda x: x[1], reverse=True)
-
-segment_templates = [
-    "💎 Elit / Servet Yönetimi",
-    "🚀 Dinamik / Aktif Müşteri", 
-    "💰 Güvenli / Birikimci",
-    "⚠️ Riskli / Pasif Müşteri",
-    "🌱 Temel Mevduat / Giriş",
-    "📊 Standart Bankacılık"
-]
-
-cluster_names = {}
-for rank, (cluster_id, total_score, stats) in enumerate(cluster_scores):
-    cluster_names[cluster_id] = segment_templates[rank]
+# Segment isimlendirme (centroid analizine göre, app.py ile ortak)
+cluster_names = name_clusters(centroids)
 
 df['Segment_Name'] = df['Cluster_Label'].map(cluster_names)
 
@@ -0,0 +1,87 @@
+"""
+Ortak pytest ayarları ve veri/model fixture'ları.
+
+Testler proje kökünden `python -m pytest -q` ile çalışır. Eşdeğerlik testlerinin
+referans aldığı eski (satır bazlı) uygulamalar tests/fixtures/ altındadır; bunlar
+sadece test kahinidir (oracle), uygulama kodu değildir. Git'te bulunmayan yerel
+veri/model dosyalarına ihtiyaç duyan testler dosya yoksa atlanır.
+"""
+
+import os
+import sys
+import warnings
+
+import joblib
+import numpy as np
+import pandas as pd
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from bankaci.credit_features import EMP_MAP, HOME_MAP, PURPOSE_MAP, VERIF_MAP
+
+GRADES = ["A", "B", "C", "D", "E", "F", "G"]
+
+
+def project_path(filename):
+    """Proje kökündeki dosyanın yolu; dosya yoksa test atlanır."""
+    path = os.path.join(ROOT, filename)
+    if not os.path.exists(path):
+        pytest.skip(f"{filename} bulunamadı")
+    return path
+
+
+def load_model(filename):
+    with warnings.catch_warnings():
+        # Modeller farklı bir sklearn/xgboost sürümüyle kaydedilmiş olabilir
+        warnings.simplefilter('ignore')
+        return joblib.load(project_path(filename))
+
+
+@pytest.fixture(scope='session')
+def churn_model():
+    return load_model('churn_model_v1.pkl')
+
+
+@pytest.fixture(scope='session')
+def churn_rows():
+    """İşlenmiş churn verisinden sabit bir örnek (model girdisi sütunları dahil)."""
+    df = pd.read_csv(project_path('churn_processed_with_clusters.csv'))
+    return df.sample(min(len(df), 3000), random_state=0).reset_index(drop=True)
+
+
+@pytest.fixture(scope='session')
+def lending_club():
+    """lending_club_cleaned.csv (hedef sütunu olmadan)."""
+    return pd.read_csv(project_path('lending_club_cleaned.csv')).drop(columns=['loan_status_binary'])
+
+
+@pytest.fixture(scope='session')
+def credit_models():
+    return {'lite': load_model('credit_risk_lite_model.pkl'), 'pro': load_model('credit_risk_model_20fold.pkl')}
+
+
+@pytest.fixture(scope='session')
+def credit_forms():
+    """Lite/Pro formlarındaki alan aralıklarından rastgele başvurular (Türkçe etiketlerle)."""
+    n_rows = 500
+    rng = np.random.default_rng(7)
+    pick = lambda values: np.asarray(list(values), dtype=object)[rng.integers(0, len(values), size=n_rows)]
+    return pd.DataFrame({
+        'annual_inc': rng.uniform(10000.0, 1000000.0, size=n_rows).round(2),
+        'loan_amnt': rng.uniform(1000.0, 50000.0, size=n_rows).round(2),
+        'term': pick([12, 24, 36, 48, 60]).astype('int64'),
+        'grade': pick(GRADES),
+        'sub_grade': pick([f"{g}{i}" for g in GRADES for i in range(1, 6)]),
+        'home_ownership': pick(HOME_MAP.keys()),
+        'purpose': pick(PURPOSE_MAP.keys()),
+        'emp_length': pick(EMP_MAP.keys()),
+        'int_rate': rng.uniform(5.0, 30.0, size=n_rows).round(2),
+        'installment': rng.uniform(50.0, 2000.0, size=n_rows).round(2),
+        'dti': rng.uniform(0.0, 100.0, size=n_rows).round(2),
+        'revol_bal': rng.integers(0, 100001, size=n_rows),
+        'revol_util': rng.uniform(0.0, 100.0, size=n_rows).round(1),
+        'total_acc': rng.integers(1, 101, size=n_rows),
+        'verification_status': pick(VERIF_MAP.keys()),
+    })
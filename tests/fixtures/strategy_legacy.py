@@ -0,0 +1,42 @@
+"""
+Eski app.py'deki satır bazlı strateji fonksiyonu (baseline, birebir kopya).
+
+Sadece bankaci.strategy eşdeğerlik testleri ve benchmark için referanstır.
+"""
+
+
+def advanced_strategy(row):
+    """
+    Strateji Mantığı sekmesindeki mantıkla uyumlu strateji belirleme fonksiyonu.
+    Risk seviyesine ve müşteri özelliklerine göre kişiselleştirilmiş strateji önerir.
+    """
+    prob = row['Risk_Probability']
+    bal = row['Balance']
+    prod = row['NumOfProducts']
+    act = row['IsActiveMember']
+    age = row.get('Age', 40)  # Yaş bilgisi varsa kullan, yoksa varsayılan 40
+    
+    # YÜKSEK RİSK (prob > 0.60)
+    if prob > 0.60:
+        if bal > 50000:
+            return "🚨 VIP MÜDAHALE"
+        elif prod >= 3:
+            return "🔄 SADELEŞTİRME"
+        else:
+            return "📞 ARAMA"
+    
+    # ORTA RİSK (0.40 < prob <= 0.60)
+    elif prob > 0.40:
+        if act == 0:  # Pasif üye
+            return "🔔 UYANDIRMA"
+        elif age < 35:  # Genç müşteri
+            return "🎁 LIFESTYLE HEDİYE"
+        else:
+            return "💳 TEŞVİK"
+    
+    # DÜŞÜK RİSK (prob <= 0.40)
+    else:
+        if bal > 100000:
+            return "💰 YATIRIM ÇAPRAZ SATIŞ"
+        else:
+            return "🤝 İLİŞKİ YÖNETİMİ"
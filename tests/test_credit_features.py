@@ -0,0 +1,117 @@
+"""bankaci.credit_features: tekil (prepare_application) ve toplu (prepare_applications) yol aynı girdiyi üretmeli."""
+
+import re
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from bankaci.credit_features import (HOME_MAP, LITE_COLUMNS, PRO_COLUMNS, PRO_DEFAULTS, PURPOSE_MAP, VERIF_MAP,
+                                     CreditInputError, clean_emp_length_input, map_term,
+                                     prepare_application, prepare_applications)
+
+LITE_FORM = ['annual_inc', 'loan_amnt', 'term', 'grade', 'home_ownership', 'purpose', 'emp_length']
+# Pro formunda sub_grade, purpose ve revol_util sorulmaz (PRO_DEFAULTS)
+PRO_FORM = [col for col in PRO_COLUMNS if col not in PRO_DEFAULTS]
+
+
+def assert_same_inputs(df, kind):
+    """prepare_application satır satır, prepare_applications ile aynı sütunları ve değerleri vermeli."""
+    batch = prepare_applications(df, kind)
+    records = [prepare_application(fields, kind) for fields in df.to_dict('records')]
+    assert [list(record) for record in records] == [list(batch.columns)] * len(records)
+    for col in batch.columns:
+        single = pd.Series([record[col] for record in records], index=batch.index)
+        if pd.api.types.is_numeric_dtype(batch[col]):
+            np.testing.assert_array_equal(single.astype('float64'), batch[col].astype('float64'), err_msg=col)
+        else:
+            assert single.astype(object).tolist() == batch[col].astype(object).tolist(), col
+    return batch
+
+
+@pytest.mark.parametrize('kind, fields', [('lite', LITE_FORM), ('pro', PRO_FORM)])
+def test_form_fields_single_matches_batch(credit_forms, kind, fields):
+    batch = assert_same_inputs(credit_forms[fields], kind)
+    columns = LITE_COLUMNS if kind == 'lite' else PRO_COLUMNS
+    assert list(batch.columns[:len(columns)]) == columns
+
+
+def test_pro_form_gets_defaults(credit_forms):
+    batch = assert_same_inputs(credit_forms[PRO_FORM], 'pro')
+    assert (batch['sub_grade'] == 'B1').all()
+    assert (batch['purpose'] == 'debt_consolidation').all()
+    assert (batch['revol_util'] == 40.0).all()
+
+
+@pytest.mark.parametrize('kind, fields', [('lite', LITE_FORM), ('pro', PRO_FORM)])
+def test_matches_legacy_form_rows(credit_forms, kind, fields):
+    """Eski formdaki dönüşümler (map_term, clean_emp_length_input, *_MAP, sabit Pro alanları)."""
+    forms = credit_forms
+    batch = prepare_applications(forms[fields], kind)
+    expected = forms[fields].assign(
+        term=forms['term'].map(map_term), emp_length=forms['emp_length'].map(clean_emp_length_input),
+        home_ownership=forms['home_ownership'].map(HOME_MAP), purpose=forms['purpose'].map(PURPOSE_MAP),
+        loan_to_income=forms['loan_amnt'] / (forms['annual_inc'] + 1))
+    if kind == 'pro':
+        expected = expected.assign(
+            verification_status=forms['verification_status'].map(VERIF_MAP), sub_grade='B1',
+            purpose='debt_consolidation', revol_util=40.0,
+            installment_to_income=forms['installment'] / ((forms['annual_inc'] / 12) + 1),
+            balance_income_ratio=forms['revol_bal'] / (forms['annual_inc'] + 1))
+    pd.testing.assert_frame_equal(batch, expected[batch.columns], check_dtype=False)
+
+
+@pytest.mark.parametrize('missing', [[col] for col in PRO_DEFAULTS] + [list(PRO_DEFAULTS)])
+def test_missing_optional_columns(credit_forms, missing):
+    batch = assert_same_inputs(credit_forms.drop(columns=missing), 'pro')
+    for col in missing:
+        assert (batch[col] == PRO_DEFAULTS[col]).all()
+    # Dosyada bulunan opsiyonel sütunlar varsayılanla ezilmez
+    for col in set(PRO_DEFAULTS) - set(missing):
+        expected = credit_forms[col]
+        if col == 'purpose':
+            expected = expected.map(PURPOSE_MAP)
+        assert batch[col].tolist() == expected.tolist()
+
+
+@pytest.mark.parametrize('kind, required', [('lite', 'purpose'), ('pro', 'annual_inc'), ('pro', 'term')])
+def test_missing_required_column(credit_forms, kind, required):
+    fields = credit_forms.drop(columns=[required])
+    with pytest.raises(CreditInputError, match=required):
+        prepare_applications(fields, kind)
+    with pytest.raises(CreditInputError, match=required):
+        prepare_application(fields.iloc[0].to_dict(), kind)
+
+
+def test_non_numeric_value_is_rejected(credit_forms):
+    fields = credit_forms[LITE_FORM].astype({'annual_inc': object})
+    fields.loc[3, 'annual_inc'] = 'abc'
+    with pytest.raises(CreditInputError, match='annual_inc'):
+        prepare_applications(fields, 'lite')
+
+
+def test_form_labels_and_lending_club_values_agree():
+    form = {'annual_inc': 60000, 'loan_amnt': 10000.0, 'term': 36, 'grade': 'B', 'home_ownership': 'Kiracı',
+            'purpose': 'Araba', 'emp_length': '10 yıl ve üzeri', 'int_rate': 12.5, 'installment': 330.0,
+            'dti': 18.0, 'revol_bal': 5000, 'total_acc': 20, 'verification_status': 'Doğrulanmamış'}
+    raw = {**form, 'term': ' 36 months', 'home_ownership': 'RENT', 'purpose': 'car', 'emp_length': '10+ years',
+           'verification_status': 'Not Verified'}
+    for kind in ('lite', 'pro'):
+        assert prepare_application(form, kind) == prepare_application(raw, kind)
+        pd.testing.assert_frame_equal(prepare_applications(pd.DataFrame([form]), kind),
+                                      prepare_applications(pd.DataFrame([raw]), kind))
+
+
+def test_lending_club_rows(lending_club):
+    """Eğitim verisinde iki yol aynı; özellikler eğitim scriptlerindeki dönüşümlerle aynı."""
+    sample = lending_club.sample(2000, random_state=0)
+    batch = assert_same_inputs(sample, 'pro')
+    assert_same_inputs(sample, 'lite')
+    years = sample['emp_length'].map(
+        lambda v: 0 if pd.isna(v) else (10 if '+' in v else (0 if '<' in v else int(re.findall(r'\d+', v)[0]))))
+    expected = sample.assign(
+        emp_length=years.astype('int64'),
+        loan_to_income=sample['loan_amnt'] / (sample['annual_inc'] + 1),
+        installment_to_income=sample['installment'] / ((sample['annual_inc'] / 12) + 1),
+        balance_income_ratio=sample['revol_bal'] / (sample['annual_inc'] + 1))
+    pd.testing.assert_frame_equal(batch, expected[batch.columns], check_dtype=False)
@@ -0,0 +1,74 @@
+"""bankaci.inference: derlenmiş kredi modeli (Lite/Pro) pipeline.predict_proba ile birebir aynı olmalı."""
+
+import numpy as np
+import pytest
+from sklearn.preprocessing import StandardScaler
+
+from bankaci.credit_features import PRO_DEFAULTS, prepare_application, prepare_applications
+from bankaci.inference import CompiledCreditModel, compile_credit_model, credit_scorer
+
+KINDS = ['lite', 'pro']
+LITE_FORM = ['annual_inc', 'loan_amnt', 'term', 'grade', 'home_ownership', 'purpose', 'emp_length']
+
+
+@pytest.fixture(scope='module')
+def compiled_credit(credit_models):
+    return {kind: compile_credit_model(model) for kind, model in credit_models.items()}
+
+
+def form_fields(forms, kind):
+    """Formda sorulan alanlar (Pro formunda PRO_DEFAULTS sütunları sorulmaz)."""
+    return forms[LITE_FORM] if kind == 'lite' else forms.drop(columns=list(PRO_DEFAULTS))
+
+
+def assert_scores_match(model, scorer, raw, kind):
+    """Toplu (prepare_applications) ve tekil (prepare_application) skorlar predict_proba ile aynı."""
+    features = prepare_applications(raw, kind)
+    expected = model.predict_proba(features)[:, 1]
+    np.testing.assert_array_equal(scorer.predict(features), expected)
+    single = [scorer.predict_one(prepare_application(fields, kind)) for fields in raw.to_dict('records')]
+    np.testing.assert_array_equal(np.array(single, dtype='float32'), expected)
+
+
+@pytest.mark.parametrize('kind', KINDS)
+def test_credit_model_compiles(credit_models, compiled_credit, kind):
+    assert isinstance(compiled_credit[kind], CompiledCreditModel)
+    assert isinstance(credit_scorer(credit_models[kind]), CompiledCreditModel)
+
+
+@pytest.mark.parametrize('kind', KINDS)
+def test_csv_rows_match_predict_proba(credit_models, compiled_credit, lending_club, kind):
+    sample = lending_club.sample(1000, random_state=0)
+    assert_scores_match(credit_models[kind], compiled_credit[kind], sample, kind)
+
+
+@pytest.mark.parametrize('kind', KINDS)
+def test_form_inputs_match_predict_proba(credit_models, compiled_credit, credit_forms, kind):
+    assert_scores_match(credit_models[kind], compiled_credit[kind], form_fields(credit_forms, kind), kind)
+
+
+@pytest.mark.parametrize('kind', KINDS)
+def test_zero_scaled_features_match_predict_proba(credit_models, compiled_credit, lending_club, kind):
+    """
+    Ölçeklenmiş değeri tam 0 olan sayısal özellikler ve tüm one-hot sütunları 0 kalan
+    bilinmeyen kategoriler: seyrek matriste saklanmaz, XGBoost bunları eksik sayar.
+    """
+    model, scorer = credit_models[kind], compiled_credit[kind]
+    features = prepare_applications(lending_club.sample(200, random_state=1), kind)
+    scaler, numeric = next((transformer, columns) for _, transformer, columns in model.steps[0][1].transformers_
+                           if isinstance(transformer, StandardScaler))
+    # Her satırda farklı bir sütun alt kümesi ortalamaya eşitlenir (ilk satırda hepsi)
+    features = features.astype({col: 'float64' for col in numeric})
+    rng = np.random.default_rng(0)
+    for col, mean in zip(numeric, scaler.mean_):
+        rows = rng.random(len(features)) < 0.5
+        rows[0] = True
+        features.loc[features.index[rows], col] = mean
+    features.loc[features.index[::7], 'grade'] = 'Z'
+    features.loc[features.index[::5], 'home_ownership'] = 'NONE'
+    assert (scaler.transform(features[numeric].iloc[[0]]) == 0).all()
+
+    expected = model.predict_proba(features)[:, 1]
+    np.testing.assert_array_equal(scorer.predict(features), expected)
+    single = [scorer.predict_one(record) for record in features.to_dict('records')]
+    np.testing.assert_array_equal(np.array(single, dtype='float32'), expected)
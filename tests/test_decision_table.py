@@ -0,0 +1,138 @@
+"""bankaci.nba.DecisionTable: kural dosyası doğrulaması, ilk eşleşme sırası, isabet sayımı ve sıcak yükleme."""
+
+import copy
+import json
+import os
+
+import pandas as pd
+import pytest
+
+from bankaci import artifacts
+from bankaci.nba import DecisionTable, DecisionTableError, load_decision_table, next_best_actions
+
+SEGMENT = "💎 Elit / Servet Yönetimi"
+
+
+def rule(rule_id, product, when=None):
+    entry = {'id': rule_id, 'product': product, 'reason': f"{product} nedeni", 'script': f"{product} scripti"}
+    if when:
+        entry['when'] = when
+    return entry
+
+
+def clause(column, op, value, default=0):
+    return {'column': column, 'op': op, 'value': value, 'default': default}
+
+
+RULES = {
+    'version': 1,
+    'segments': [{'segment': SEGMENT, 'rules': [
+        rule('bakiye', 'Yatırım Fonu', [clause('Balance', '>', 50000)]),
+        rule('genc_kart', 'Kredi Kartı', [clause('Age', '<', 30), clause('HasCrCard', '==', 0)]),
+        rule('vip', 'VIP Hizmetler'),
+    ]}],
+    'general': [
+        rule('bes', 'BES', [clause('Has_BES', '==', 0)]),
+        rule('mevduat', 'Mevduat'),
+    ],
+}
+
+CUSTOMERS = pd.DataFrame({
+    'User_ID': [1, 2, 3, 4, 5, 6],
+    'Balance': [80000.0, 80000.0, 0.0, 0.0, 0.0, 0.0],
+    'Age': [25, 45, 25, 45, 40, 40],
+    'HasCrCard': [0, 0, 0, 0, 1, 1],
+    'Has_BES': [0, 0, 0, 0, 0, 1],
+    'Segment_Name': [SEGMENT] * 4 + ["Bilinmiyor"] * 2,
+})
+
+
+def choose_rules(table, df=CUSTOMERS):
+    return next_best_actions(df, df['Segment_Name'], [SEGMENT], table=table)['Rule'].astype(str).tolist()
+
+
+def with_change(change):
+    data = copy.deepcopy(RULES)
+    change(data)
+    return data
+
+
+@pytest.mark.parametrize('change, message', [
+    (lambda d: d['segments'][0]['rules'][0]['when'][0].update(column='Balanse'), 'bilinmeyen sütun'),
+    (lambda d: d['segments'][0]['rules'][0]['when'][0].update(op='=>'), 'geçersiz koşul'),
+    (lambda d: d['segments'][0]['rules'][0]['when'][0].update(value='çok'), 'sayısal olmayan'),
+    (lambda d: d['segments'][0]['rules'].pop(), 'koşulsuz'),
+    (lambda d: d['general'][-1].update(when=[clause('Age', '>', 0)]), 'koşulsuz'),
+    (lambda d: d.pop('general'), 'eksik alan'),
+    (lambda d: d['general'][0].pop('product'), 'eksik alan'),
+    (lambda d: d['general'][0].update(id='vip'), 'Tekrarlanan'),
+], ids=['bilinmeyen_sutun', 'bilinmeyen_operator', 'sayisal_olmayan_deger', 'segment_varsayilani_yok',
+        'genel_varsayilan_kosullu', 'genel_kurallar_yok', 'urun_yok', 'tekrarlanan_kimlik'])
+def test_invalid_rules_are_rejected(tmp_path, change, message):
+    with pytest.raises(DecisionTableError, match=message):
+        DecisionTable(with_change(change))
+    path = tmp_path / 'rules.json'
+    path.write_text(json.dumps(with_change(change)), encoding='utf-8')
+    with pytest.raises(DecisionTableError, match=message):
+        load_decision_table(str(path))
+
+
+def test_unreadable_file_is_rejected(tmp_path):
+    path = tmp_path / 'rules.json'
+    path.write_text('{"version": 1,', encoding='utf-8')
+    with pytest.raises(DecisionTableError, match='okunamadı'):
+        load_decision_table(str(path))
+
+
+def test_first_matching_rule_wins():
+    # 1. müşteri hem 'bakiye' hem 'genc_kart' koşulunu sağlar: dosyadaki ilk kural seçilir
+    assert choose_rules(DecisionTable(RULES)) == ['bakiye', 'bakiye', 'genc_kart', 'vip', 'bes', 'mevduat']
+    swapped = with_change(lambda d: d['segments'][0]['rules'].insert(0, d['segments'][0]['rules'].pop(1)))
+    assert choose_rules(DecisionTable(swapped)) == ['genc_kart', 'bakiye', 'genc_kart', 'vip', 'bes', 'mevduat']
+
+
+def test_hit_counts():
+    table = DecisionTable(RULES)
+    assert table.hit_report()['İsabet'].tolist() == [0, 0, 0, 0, 0]
+    rules = choose_rules(table)
+    choose_rules(table, CUSTOMERS.iloc[:3])
+    report = table.hit_report()
+    assert report['Kural'].tolist() == ['bakiye', 'genc_kart', 'vip', 'bes', 'mevduat']
+    assert report['Segment'].tolist() == [SEGMENT] * 3 + ['Genel'] * 2
+    assert report['İsabet'].tolist() == [4, 2, 1, 1, 1]
+    # rule_ids verilirse sadece o sonucun sayımı raporlanır
+    assert table.hit_report(rules)['İsabet'].tolist() == [2, 1, 1, 1, 1]
+    table.record_hits([2, 2, 4])
+    assert table.hit_report()['İsabet'].tolist() == [4, 2, 3, 1, 2]
+
+
+def test_registry_reloads_edited_rules(tmp_path, monkeypatch):
+    """Kayıt defterindeki nba_rules: dosya değişince yeni tablo, bozulunca önceki tablo servis edilir."""
+    path = tmp_path / 'nba_rules.json'
+    path.write_text(json.dumps(RULES), encoding='utf-8')
+    monkeypatch.setattr(artifacts, 'RULES_PATH', str(path))
+    registry = artifacts.build_registry(str(tmp_path))
+    registry.check_interval = 0
+
+    def edit(data):
+        stat = os.stat(path)
+        path.write_text(data if isinstance(data, str) else json.dumps(data), encoding='utf-8')
+        # Aynı boyut ve kaba mtime çözünürlüğünde de değişiklik görülsün
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    first = registry.get('nba_rules')
+    assert choose_rules(first) == ['bakiye', 'bakiye', 'genc_kart', 'vip', 'bes', 'mevduat']
+
+    edit(with_change(lambda d: (d.update(version=2), d['segments'][0]['rules'][0]['when'][0].update(value=100000))))
+    # Yenileme bitene kadar eski tablo servis edilir
+    assert registry.get('nba_rules') is first
+    registry.wait_for_refresh()
+    second = registry.get('nba_rules')
+    assert second.version == 2
+    assert choose_rules(second) == ['genc_kart', 'vip', 'genc_kart', 'vip', 'bes', 'mevduat']
+
+    edit('{"version": 3,')
+    registry.get('nba_rules')
+    registry.wait_for_refresh()
+    assert registry.get('nba_rules') is second
+    assert isinstance(registry.last_refresh_error, DecisionTableError)
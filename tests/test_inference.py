@@ -0,0 +1,83 @@
+"""bankaci.inference: derlenmiş churn modeli pipeline.predict_proba ile birebir aynı olmalı."""
+
+import numpy as np
+import pytest
+from lightgbm import LGBMClassifier
+from sklearn.compose import ColumnTransformer
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import MinMaxScaler, OneHotEncoder
+
+from bankaci.inference import (CompiledChurnModel, PipelineModel, UnsupportedModelError, churn_scorer,
+                               compile_churn_model)
+
+
+@pytest.fixture(scope='module')
+def compiled_churn(churn_model):
+    return compile_churn_model(churn_model)
+
+
+def test_churn_model_compiles(churn_model, compiled_churn):
+    assert isinstance(compiled_churn, CompiledChurnModel)
+    assert isinstance(churn_scorer(churn_model), CompiledChurnModel)
+
+
+def test_churn_batch_matches_predict_proba(churn_model, compiled_churn, churn_rows):
+    expected = churn_model.predict_proba(churn_rows)[:, 1]
+    np.testing.assert_array_equal(compiled_churn.predict(churn_rows), expected)
+
+
+def test_churn_single_matches_predict_proba(churn_model, compiled_churn, churn_rows):
+    sample = churn_rows.head(300)
+    expected = churn_model.predict_proba(sample)[:, 1]
+    columns = compiled_churn.input_columns
+    by_dict = [compiled_churn.predict_one(record) for record in sample[columns].to_dict('records')]
+    by_tuple = [compiled_churn.predict_one(tuple(record)) for record in sample[columns].itertuples(index=False)]
+    np.testing.assert_array_equal(by_dict, expected)
+    np.testing.assert_array_equal(by_tuple, expected)
+
+
+def test_churn_unknown_category_and_missing_values(churn_model, compiled_churn, churn_rows):
+    # Bilinmeyen kategori (handle_unknown='ignore') ve eksik sayısal değer
+    sample = churn_rows.head(50).copy()
+    sample.loc[::2, 'Geography'] = 'Italy'
+    sample.loc[1::3, 'Balance_per_Product'] = np.nan
+    expected = churn_model.predict_proba(sample)[:, 1]
+    np.testing.assert_array_equal(compiled_churn.predict(sample), expected)
+    single = [compiled_churn.predict_one(record) for record in sample[compiled_churn.input_columns].to_dict('records')]
+    np.testing.assert_array_equal(single, expected)
+
+
+def test_tuple_record_length_is_checked(compiled_churn):
+    with pytest.raises(ValueError):
+        compiled_churn.predict_one((1, 2, 3))
+
+
+@pytest.fixture(scope='module')
+def uncompilable_pipeline(churn_model, churn_rows):
+    """Aynı sütunlarla ama MinMaxScaler kullanan (derlenemeyen) bir pipeline."""
+    compiled = compile_churn_model(churn_model)
+    preprocessor = ColumnTransformer([('num', MinMaxScaler(), compiled.numeric_columns),
+                                      ('cat', OneHotEncoder(handle_unknown='ignore'), compiled.categorical_columns)])
+    model = Pipeline([('preprocessor', preprocessor),
+                      ('classifier', LGBMClassifier(n_estimators=10, verbose=-1))])
+    return model.fit(churn_rows[compiled.input_columns], churn_rows['Complain'])
+
+
+def test_uncompilable_pipeline_falls_back(uncompilable_pipeline, churn_rows):
+    with pytest.raises(UnsupportedModelError):
+        compile_churn_model(uncompilable_pipeline)
+    scorer = churn_scorer(uncompilable_pipeline)
+    assert isinstance(scorer, PipelineModel)
+    sample = churn_rows.head(100)
+    expected = uncompilable_pipeline.predict_proba(sample)[:, 1]
+    np.testing.assert_array_equal(scorer.predict(sample), expected)
+    records = sample[scorer.input_columns]
+    assert [scorer.predict_one(r) for r in records.head(20).to_dict('records')] == list(expected[:20])
+    assert [scorer.predict_one(tuple(r)) for r in records.head(20).itertuples(index=False)] == list(expected[:20])
+
+
+def test_non_pipeline_model_falls_back(uncompilable_pipeline):
+    classifier = uncompilable_pipeline.steps[-1][1]
+    with pytest.raises(UnsupportedModelError):
+        compile_churn_model(classifier)
+    assert isinstance(churn_scorer(classifier), PipelineModel)
@@ -0,0 +1,154 @@
+"""bankaci.nba: vektörel NBA motoru eski satır bazlı get_next_best_action ile aynı olmalı."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from bankaci.nba import (JITTER_MAX, JITTER_MIN, PROB_MAX, PROB_MIN, default_decision_table, deterministic_jitter,
+                         next_best_action, next_best_actions, offer_matrix, ranked_offers)
+from bankaci.segmentation import SEGMENT_TEMPLATES
+from fixtures import nba_legacy
+
+CLUSTER_MAP = dict(enumerate(SEGMENT_TEMPLATES))
+OUTPUT_COLUMNS = ['Product', 'Prob', 'Reason', 'Script']
+# Müşteri analizi panelindeki selected_row alanları (app.py)
+PANEL_FIELDS = ['Balance', 'EstimatedSalary', 'Age', 'Spending_Score', 'Has_Yatirim', 'Has_BES', 'HasCrCard',
+                'Has_Kredi', 'CreditScore', 'NumOfProducts', 'Tenure', 'IsActiveMember', 'User_ID']
+
+
+def build_portfolio(n_rows=3000, seed=7):
+    """Rastgele portföy; bilinmeyen segment adı ve kural eşiklerindeki bakiye/maaş değerleri dahil."""
+    rng = np.random.default_rng(seed)
+    segments = np.array(SEGMENT_TEMPLATES + ["Bilinmiyor"], dtype=object)
+    return pd.DataFrame({
+        'User_ID': 1000000 + np.arange(n_rows),
+        'CreditScore': rng.integers(350, 851, size=n_rows),
+        'Age': rng.integers(18, 93, size=n_rows),
+        'Tenure': rng.integers(0, 11, size=n_rows),
+        'Balance': rng.choice([0.0, 4000.0, 15000.0, 45000.0, 80000.0, 150000.0], size=n_rows)
+                   + rng.integers(0, 3, size=n_rows) * 5000.0,
+        'NumOfProducts': rng.integers(1, 5, size=n_rows),
+        'HasCrCard': rng.integers(0, 2, size=n_rows),
+        'IsActiveMember': rng.integers(0, 2, size=n_rows),
+        'EstimatedSalary': rng.choice([20000.0, 30000.0, 45000.0, 55000.0, 70000.0, 120000.0], size=n_rows),
+        'Has_BES': rng.integers(0, 2, size=n_rows),
+        'Has_Kredi': rng.integers(0, 2, size=n_rows),
+        'Has_Yatirim': rng.integers(0, 2, size=n_rows),
+        'Spending_Score': rng.integers(1, 101, size=n_rows),
+        'Segment_Name': segments[rng.integers(0, len(segments), size=n_rows)],
+    })
+
+
+def legacy_actions(df, jitter, monkeypatch):
+    """Eski yol: satır başına get_next_best_action; random.randint sırayla verilen jitter'ı döndürür."""
+    values = iter(jitter.tolist())
+    monkeypatch.setattr(nba_legacy, 'cluster_names_map', CLUSTER_MAP)
+    monkeypatch.setattr(nba_legacy.random, 'randint', lambda a, b: next(values))
+
+    def get_nba(row):
+        segment = row['Segment_Name'] if 'Segment_Name' in row.index else None
+        return pd.Series(nba_legacy.get_next_best_action(row, segment_name=segment))
+    return df.apply(get_nba, axis=1)[OUTPUT_COLUMNS]
+
+
+# Boş (NaN) segment adında eski kod TypeError verdiğinden karşılaştırılmaz
+@pytest.mark.parametrize('drop', [[], ['Spending_Score', 'Tenure'], ['Segment_Name']],
+                         ids=['tam', 'spending_tenure_yok', 'segment_yok'])
+def test_next_best_actions_match_legacy(monkeypatch, drop):
+    df = build_portfolio().drop(columns=drop)
+    jitter = np.random.default_rng(1).integers(JITTER_MIN, JITTER_MAX + 1, size=len(df))
+    expected = legacy_actions(df, jitter, monkeypatch)
+    segments = df['Segment_Name'] if 'Segment_Name' in df.columns else [None] * len(df)
+    actual = next_best_actions(df, segments, CLUSTER_MAP.values(), jitter=jitter)
+    for col in OUTPUT_COLUMNS:
+        assert expected[col].astype(str).tolist() == actual[col].astype(str).tolist(), col
+
+
+def batch_actions(df, **kwargs):
+    return next_best_actions(df, df['Segment_Name'], CLUSTER_MAP.values(), **kwargs)
+
+
+def test_single_customer_matches_batch():
+    """Paneldeki tek müşteri önerisi kampanya listesindeki (toplu) öneriyle aynı User_ID'de aynı Prob'u verir."""
+    df = build_portfolio(n_rows=300)
+    expected = batch_actions(df)
+    for (_, row), (_, rec) in zip(df.iterrows(), expected.iterrows()):
+        record = {col: row[col].item() if hasattr(row[col], 'item') else row[col] for col in PANEL_FIELDS}
+        single = next_best_action(record, row['Segment_Name'], CLUSTER_MAP.values())
+        assert (single['Product'], single['Prob'], single['Rule']) == (rec['Product'], rec['Prob'], rec['Rule'])
+    # Anahtarsız tek satır her müşteride index 0'a düşerdi; anahtar zorunlu
+    with pytest.raises(ValueError, match='User_ID'):
+        next_best_action({col: record[col] for col in PANEL_FIELDS[:-1]}, row['Segment_Name'])
+
+
+def test_jitter_is_repeatable():
+    df = build_portfolio()
+    pd.testing.assert_frame_equal(batch_actions(df), batch_actions(df.copy()))
+    products = batch_actions(df)['Product'].astype(str)
+    np.testing.assert_array_equal(deterministic_jitter(df['User_ID'], products),
+                                  deterministic_jitter(df['User_ID'].to_numpy(), products.to_numpy()))
+
+
+def test_jitter_independent_of_shards_and_order():
+    df = build_portfolio()
+    expected = batch_actions(df)
+    shards = pd.concat([batch_actions(df.iloc[rows]) for rows in np.array_split(np.arange(len(df)), 7)])
+    pd.testing.assert_frame_equal(shards, expected)
+    shuffled = df.sample(frac=1, random_state=3)
+    pd.testing.assert_frame_equal(batch_actions(shuffled).loc[df.index], expected)
+
+
+def test_seed_changes_jitter():
+    df = build_portfolio()
+    base, other = batch_actions(df), batch_actions(df, seed=1)
+    assert (base['Product'] == other['Product']).all()
+    assert (base['Prob'] != other['Prob']).mean() > 0.5
+
+
+def test_jitter_within_legacy_range():
+    df = build_portfolio()
+    products = np.array(['Kredi Kartı', 'BES', 'Yatırım Fonu', 'Mevduat'], dtype=object)[np.arange(len(df)) % 4]
+    jitter = deterministic_jitter(df['User_ID'], products)
+    assert jitter.min() == JITTER_MIN and jitter.max() == JITTER_MAX
+    assert set(np.unique(jitter)) == set(range(JITTER_MIN, JITTER_MAX + 1))
+    prob = batch_actions(df)['Prob']
+    assert prob.between(PROB_MIN, PROB_MAX).all()
+
+
+def offers_by_customer(offers):
+    got = {}
+    for label, rule_id in zip(offers.index, offers['Rule'].astype(str)):
+        got.setdefault(label, []).append(rule_id)
+    return got
+
+
+@pytest.mark.parametrize('k', [1, 3, 100])
+def test_ranked_offers_match_full_sort(k):
+    """Kısmi sıralamalı top-k, matrisin tam (kararlı) sıralamasıyla aynı: 1. sıra NBA, sonra Prob, sonra tablo sırası."""
+    df = build_portfolio(n_rows=1500, seed=13)
+    rule_ids = default_decision_table().column('id')
+    probs, eligible = offer_matrix(df, df['Segment_Name'], CLUSTER_MAP.values())
+    nba = batch_actions(df)['Rule'].astype(str).map(rule_ids.index).to_numpy()
+    got = offers_by_customer(ranked_offers(df, df['Segment_Name'], CLUSTER_MAP.values(), k=k, chunk_size=400))
+    for i, label in enumerate(df.index):
+        candidates = sorted((j for j in range(probs.shape[1]) if eligible[i, j]),
+                            key=lambda j: (j != nba[i], -probs[i, j], j))
+        assert [rule_ids[j] for j in candidates[:k]] == got[label], label
+
+
+def test_first_ranked_offer_is_next_best_action():
+    df = build_portfolio()
+    expected = batch_actions(df)
+    offers = ranked_offers(df, df['Segment_Name'], CLUSTER_MAP.values(), k=3)
+    first = offers[offers['Rank'] == 1]
+    assert first.index.equals(df.index)
+    for col in ['Product', 'Prob', 'Rule']:
+        assert first[col].astype(str).tolist() == expected[col].astype(str).tolist(), col
+    assert offers.groupby(level=0)['Rank'].max().le(3).all()
+
+
+@pytest.mark.parametrize('k', [0, -1])
+def test_ranked_offers_reject_invalid_k(k):
+    df = build_portfolio(n_rows=10)
+    with pytest.raises(ValueError, match='k'):
+        ranked_offers(df, df['Segment_Name'], CLUSTER_MAP.values(), k=k)
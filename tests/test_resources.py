@@ -0,0 +1,87 @@
+"""bankaci.resources: başarısız arka plan yenilemesi dosyalar değişmeden tekrar denenmez."""
+
+import os
+import time
+
+from bankaci.resources import ResourceRegistry
+
+
+class FileLoader:
+    """Dosya içeriğini döndürür; 'bozuk' içerikte hata verir. Çağrı sayısını tutar."""
+
+    def __init__(self, path):
+        self.path = path
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        with open(self.path, encoding='utf-8') as f:
+            text = f.read()
+        if text.startswith('bozuk'):
+            raise ValueError(f"geçersiz içerik: {text}")
+        return text
+
+
+def write(path, text, shift):
+    """İçeriği yazar; mtime kaydırılır ki kaba mtime çözünürlüğünde de değişiklik görülsün."""
+    path.write_text(text, encoding='utf-8')
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + shift * 1_000_000_000))
+
+
+def registry_for(path, max_age=None):
+    loader = FileLoader(path)
+    registry = ResourceRegistry(check_interval=0)
+    registry.register('tablo', loader, files=[path], max_age=max_age)
+    return registry, loader
+
+
+def refresh(registry):
+    names = registry.check_for_changes()
+    registry.wait_for_refresh()
+    return names
+
+
+def test_failed_refresh_waits_for_file_change(tmp_path):
+    path = tmp_path / 'tablo.json'
+    write(path, 'v1', 0)
+    registry, loader = registry_for(path)
+    assert registry.get('tablo') == 'v1'
+
+    write(path, 'bozuk-1', 1)
+    assert refresh(registry) == ['tablo']
+    assert isinstance(registry.last_refresh_error, ValueError)
+    assert loader.calls == 2
+    # Aynı bozuk dosya her kontrolde yeniden yüklenmez; eski değer servis edilir
+    for _ in range(5):
+        assert refresh(registry) == []
+        assert registry.get('tablo') == 'v1'
+    assert loader.calls == 2
+
+    # Dosya tekrar değişince yeniden denenir (yine bozuksa tekrar beklenir)
+    write(path, 'bozuk-22', 2)
+    assert refresh(registry) == ['tablo']
+    assert refresh(registry) == []
+    assert loader.calls == 3
+
+    write(path, 'v2', 3)
+    assert refresh(registry) == ['tablo']
+    assert registry.get('tablo') == 'v2'
+    assert registry.last_refresh_error is None
+    assert loader.calls == 4
+
+
+def test_failed_max_age_refresh_waits_for_max_age(tmp_path):
+    path = tmp_path / 'tablo.json'
+    write(path, 'v1', 0)
+    registry, loader = registry_for(path, max_age=0.2)
+    assert registry.get('tablo') == 'v1'
+
+    write(path, 'bozuk', 1)
+    assert refresh(registry) == ['tablo']
+    assert refresh(registry) == []
+    assert loader.calls == 2
+    time.sleep(0.25)
+    assert refresh(registry) == ['tablo']
+    assert loader.calls == 3
+
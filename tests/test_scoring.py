@@ -0,0 +1,28 @@
+"""bankaci.scoring: akış halinde türetilen churn özellikleri eğitimdeki dönüşümlerle aynı olmalı."""
+
+import numpy as np
+import pandas as pd
+
+from bankaci.scoring import add_engineered_features
+
+
+def customers(age):
+    return pd.DataFrame({'Age': age, 'Balance': 80000.0, 'NumOfProducts': 2, 'CreditScore': 650,
+                         'IsActiveMember': 1})
+
+
+def test_age_group_matches_training_bins():
+    # Aralık sınırları ve dışı: eğitimdeki pd.cut (0, 100] dışında ve eksik yaşta NaN verir
+    age = [-5, 0, 0.5, 18, 30, 30.5, 45, 46, 60, 61, 100, 100.5, 120, np.nan]
+    expected = pd.cut(pd.Series(age), bins=[0, 30, 45, 60, 100], labels=['Young', 'Adult', 'Middle', 'Senior'])
+    actual = add_engineered_features(customers(age))['Age_Group']
+    assert actual.astype(object).tolist() == expected.astype(object).tolist()
+    assert actual.isna().tolist() == [True, True] + [False] * 9 + [True, True, True]
+
+
+def test_engineered_features_match_processed_data(churn_rows):
+    raw = churn_rows.drop(columns=['Balance_per_Product', 'Age_Group', 'Credit_Score_Age_Ratio'])
+    actual = add_engineered_features(raw)
+    assert actual['Age_Group'].astype(object).tolist() == churn_rows['Age_Group'].astype(object).tolist()
+    for col in ['Balance_per_Product', 'Credit_Score_Age_Ratio']:
+        np.testing.assert_allclose(actual[col], churn_rows[col], err_msg=col)
@@ -0,0 +1,59 @@
+"""bankaci.strategy: vektörel strateji motoru eski satır bazlı advanced_strategy ile aynı olmalı."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from bankaci.strategy import STRATEGIES, assign_strategies, customer_strategy, strategy_codes
+from fixtures.strategy_legacy import advanced_strategy
+
+
+def build_portfolio(n_rows=5000, seed=7):
+    """Rastgele portföy; satırların bir kısmı eşik değerlerinde ve NaN."""
+    rng = np.random.default_rng(seed)
+    df = pd.DataFrame({
+        'Risk_Probability': rng.random(n_rows),
+        'Balance': rng.choice([0.0, 25000.0, 75000.0, 150000.0], size=n_rows) + rng.random(n_rows) * 1000,
+        'NumOfProducts': rng.integers(1, 5, size=n_rows),
+        'IsActiveMember': rng.integers(0, 2, size=n_rows),
+        'Age': rng.integers(18, 90, size=n_rows).astype('float64'),
+    })
+    idx = rng.choice(n_rows, size=n_rows // 5, replace=False)
+    df.loc[idx, 'Risk_Probability'] = rng.choice([0.40, 0.60, np.nan], size=len(idx))
+    df.loc[idx, 'Balance'] = rng.choice([50000.0, 100000.0, np.nan], size=len(idx))
+    df.loc[idx, 'Age'] = rng.choice([35.0, np.nan], size=len(idx))
+    return df
+
+
+def legacy(df):
+    return df.apply(advanced_strategy, axis=1).to_numpy()
+
+
+@pytest.mark.parametrize('with_age', [True, False])
+def test_strategy_codes_match_legacy(with_age):
+    df = build_portfolio()
+    if not with_age:
+        df = df.drop(columns=['Age'])
+    age = df['Age'].to_numpy() if with_age else None
+    codes = strategy_codes(df['Risk_Probability'], df['Balance'], df['NumOfProducts'], df['IsActiveMember'], age)
+    assert codes.dtype == np.int8
+    np.testing.assert_array_equal(np.asarray(STRATEGIES, dtype=object)[codes], legacy(df))
+    np.testing.assert_array_equal(assign_strategies(df).astype(str).to_numpy(), legacy(df))
+
+
+@pytest.mark.parametrize('row', [
+    # NaN olasılık/bakiye/yaş: karşılaştırmalar yanlış sayılır
+    {'Risk_Probability': np.nan, 'Balance': 200000.0, 'NumOfProducts': 1, 'IsActiveMember': 1, 'Age': 30.0},
+    {'Risk_Probability': np.nan, 'Balance': 1000.0, 'NumOfProducts': 4, 'IsActiveMember': 0, 'Age': 30.0},
+    {'Risk_Probability': 0.9, 'Balance': np.nan, 'NumOfProducts': 3, 'IsActiveMember': 1, 'Age': 50.0},
+    {'Risk_Probability': 0.9, 'Balance': np.nan, 'NumOfProducts': 1, 'IsActiveMember': 1, 'Age': 50.0},
+    {'Risk_Probability': 0.5, 'Balance': 1000.0, 'NumOfProducts': 1, 'IsActiveMember': 1, 'Age': np.nan},
+    {'Risk_Probability': 0.5, 'Balance': 1000.0, 'NumOfProducts': 1, 'IsActiveMember': np.nan, 'Age': 20.0},
+    # Sınır değerleri
+    {'Risk_Probability': 0.60, 'Balance': 50000.0, 'NumOfProducts': 3, 'IsActiveMember': 1, 'Age': 35.0},
+    {'Risk_Probability': 0.40, 'Balance': 100000.0, 'NumOfProducts': 1, 'IsActiveMember': 0, 'Age': 34.0},
+])
+def test_customer_strategy_edge_cases(row):
+    expected = advanced_strategy(pd.Series(row))
+    assert customer_strategy(row['Risk_Probability'], row['Balance'], row['NumOfProducts'],
+                             row['IsActiveMember'], row['Age']) == expected
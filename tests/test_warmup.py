@@ -0,0 +1,59 @@
+"""bankaci.warmup: süreç sadece ısınma hatasız bittiğinde hazır sayılır."""
+
+import json
+
+import pytest
+
+from bankaci import warmup
+from bankaci.resources import ResourceRegistry
+
+
+def fake_registry(fail=()):
+    registry = ResourceRegistry()
+
+    def loader(name):
+        def load():
+            if name in fail:
+                raise FileNotFoundError(f"{name} bulunamadı")
+            return name
+        return load
+    for name in ['model', 'data']:
+        registry.register(name, loader(name))
+    return registry
+
+
+@pytest.fixture
+def run(tmp_path, monkeypatch):
+    def run_with(registry, predictors=None):
+        monkeypatch.setattr(warmup, 'get_registry', lambda root: registry)
+        monkeypatch.setattr(warmup, 'ARTIFACT_NAMES', registry.names())
+        monkeypatch.setattr(warmup, 'PREDICTOR_NAMES', predictors or {})
+        state = warmup.run_warmup(warmup.WarmupState(str(tmp_path)))
+        with open(warmup.ready_path(str(tmp_path)), encoding='utf-8') as f:
+            return state, json.load(f)
+    return run_with
+
+
+def test_clean_warmup_is_ready(tmp_path, run):
+    state, info = run(fake_registry())
+    assert state.status == info['status'] == 'ready'
+    assert state.is_ready and state.wait(0)
+    assert warmup.probe(str(tmp_path))
+
+
+def test_failed_artifact_is_not_ready(tmp_path, run):
+    state, info = run(fake_registry(fail=['data']))
+    assert state.status == info['status'] == 'degraded'
+    assert list(info['errors']) == ['data']
+    assert not state.is_ready and not state.wait(0)
+    assert not warmup.probe(str(tmp_path))
+
+
+def test_failed_predictor_warmup_is_not_ready(tmp_path, run, monkeypatch):
+    def broken(scorer, pipeline):
+        raise ValueError("predict_one hatası")
+    monkeypatch.setattr(warmup, 'warm_predictor', broken)
+    state, info = run(fake_registry(), predictors={'model': 'data'})
+    assert state.status == info['status'] == 'degraded'
+    assert list(info['errors']) == ['model_isinma']
+    assert not warmup.probe(str(tmp_path))